@@ -0,0 +1,131 @@
+"""Cold import time of figures and first use cost of backends.
+
+Every measure runs in a new interpreter (python -X importtime),
+best of repeats is reported. Bytecode cache is allowed, so
+compilation of figures isn`t a part of numbers (as after install).
+Import of baseline figures.py (first commit by default, taken
+from git) is measured the same way for reference.
+
+Run: python bench/import_time.py [-r 7] [--baseline REV]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+
+import figures
+
+# run from package parent dir, so <import figures> finds the package
+# whatever cwd and sys.path[0] are
+_CWD = os.path.dirname(os.path.dirname(os.path.abspath(figures.__file__)))
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_HEAVY = ("numpy", "pandas", "pyarrow", "asyncio", "concurrent.futures")
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.pop("FIGURES_BACKEND", None)
+    return env
+
+
+def import_us(module: str, repeat: int, cwd: str = _CWD) -> tuple[int, int]:
+    """best <own, cumulative> import time of module (microseconds),
+    own is self time of module and its submodules (stdlib and
+    other imported modules aren`t counted)."""
+    best: Optional[tuple[int, int]] = None
+    for _ in range(repeat):
+        res = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                cwd=cwd, env=_env(), check=True, capture_output=True, text=True,
+                )
+        own = cumulative = 0
+        for line in res.stderr.splitlines():
+            _, us_self, us_cumulative, name = (
+                    p.strip() for p in line.replace(":", "|", 1).split("|")
+                    )
+            if name == module or name.startswith(module + "."):
+                own += int(us_self)
+            if name == module:
+                cumulative = int(us_cumulative)
+        if best is None or cumulative < best[1]:
+            best = (own, cumulative)
+    assert best is not None
+    return best
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+            ["git", *args], cwd=_REPO, check=True, capture_output=True, text=True,
+            ).stdout
+
+
+def baseline_dir(rev: Optional[str]) -> tuple[str, str]:
+    """temp dir with figures.py of rev and short rev."""
+    rev = rev or _git("rev-list", "--max-parents=0", "HEAD").split()[-1]
+    path = tempfile.mkdtemp(prefix="figures-baseline-")
+    with open(os.path.join(path, "figures.py"), "w") as f:
+        f.write(_git("show", f"{rev}:figures/figures.py"))
+    return path, _git("rev-parse", "--short", rev).strip()
+
+
+def first_use_us(backend: str, repeat: int) -> int:
+    """best time of first get_backend(backend) call after import."""
+    code = (
+            "import time, figures\n"
+            "start = time.perf_counter_ns()\n"
+            f"figures.get_backend({backend!r})\n"
+            "print((time.perf_counter_ns() - start) // 1000)\n"
+            )
+    return min(
+            int(subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=_CWD, env=_env(), check=True, capture_output=True, text=True,
+                ).stdout)
+            for _ in range(repeat)
+            )
+
+
+def loaded_heavy() -> list[str]:
+    code = f"import sys, figures; print(*[m for m in {_HEAVY!r} if m in sys.modules])"
+    res = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=_CWD, env=_env(), check=True, capture_output=True, text=True,
+            )
+    return res.stdout.split()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=7)
+    parser.add_argument("--baseline", help="git revision of baseline figures.py")
+    args = parser.parse_args(argv)
+    # warm bytecode cache
+    import_us("figures", 1)
+    print(f"{'':<32}{'own us':>10}{'total us':>10}")
+    own, total = import_us("figures", args.repeat)
+    print(f"{'import figures':<32}{own:>10,}{total:>10,}")
+    try:
+        path, rev = baseline_dir(args.baseline)
+    except (OSError, subprocess.CalledProcessError) as err:
+        print(f"baseline isn`t measured: {err}")
+    else:
+        try:
+            import_us("figures", 1, path)
+            own, total = import_us("figures", args.repeat, path)
+            print(f"{'import figures (' + rev + ')':<32}{own:>10,}{total:>10,}")
+        finally:
+            shutil.rmtree(path)
+    for backend in ("python", "numpy", "pandas"):
+        us = first_use_us(backend, args.repeat)
+        print(f"{'first use of ' + backend:<32}{us:>10,} us")
+    heavy = loaded_heavy()
+    print(f"heavy modules loaded by import figures: {heavy or 'none'}")
+    return 1 if heavy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
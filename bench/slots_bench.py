@@ -0,0 +1,143 @@
+"""Memory and construction time of slotted figures and specs
+compared with dict based classes (as they were before slots).
+
+Run: python bench/slots_bench.py [-n 100000]
+"""
+import argparse
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Optional, Any
+
+from figures import (
+        Circle,
+        Triangle,
+        Rectangle,
+        Square,
+        FigureSpec,
+        FigureType,
+        ParamT,
+        _args_bigger_as_zero,
+        )
+
+
+# copies of figure initializers without __slots__
+class DictCircle:
+
+    def __init__(self, radius: ParamT) -> None:
+        self._radius = radius
+        if not _args_bigger_as_zero(self._radius):
+            raise ValueError(radius)
+
+
+class DictTriangle:
+
+    def __init__(
+            self,
+            leg_a: ParamT,
+            leg_b: ParamT,
+            hopotenuse: ParamT,
+            *,
+            rel_tol: Optional[ParamT] = None,
+            ) -> None:
+        self._leg_a = leg_a
+        self._leg_b = leg_b
+        self._hpt = hopotenuse
+        self._tol = rel_tol or 1e-3
+        if not _args_bigger_as_zero(self._leg_a, self._leg_b, self._hpt):
+            raise ValueError(leg_a, leg_b, hopotenuse)
+
+
+class DictRectangle:
+
+    def __init__(self, side_a: ParamT, side_b: ParamT) -> None:
+        self._side_a = side_a
+        self._side_b = side_b
+        if not _args_bigger_as_zero(self._side_a, self._side_b):
+            raise ValueError(side_a, side_b)
+
+
+class DictSquare:
+
+    def __init__(self, side: ParamT) -> None:
+        self._side = side
+        if not _args_bigger_as_zero(self._side):
+            raise ValueError(side)
+
+
+@dataclass
+class DictFigureSpec:
+    ftype: FigureType
+    args: tuple[ParamT, ...]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.args, tuple):
+            raise ValueError(self.args)
+        if not isinstance(self.ftype, FigureType):
+            raise ValueError(self.ftype)
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratedInitSpec:
+    """FigureSpec with dataclass generated frozen __init__
+    (fields are set by object.__setattr__())."""
+    ftype: FigureType
+    args: tuple[ParamT, ...]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.args, tuple):
+            raise ValueError(self.args)
+        if not isinstance(self.ftype, FigureType):
+            raise ValueError(self.ftype)
+
+
+CASES: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        "circle": (lambda: Circle(1.5), lambda: DictCircle(1.5)),
+        "triangle": (
+            lambda: Triangle(2.0, 2.0, 2.8283),
+            lambda: DictTriangle(2.0, 2.0, 2.8283),
+            ),
+        "rectangle": (lambda: Rectangle(1.0, 2.0), lambda: DictRectangle(1.0, 2.0)),
+        "square": (lambda: Square(1.0), lambda: DictSquare(1.0)),
+        "spec": (
+            lambda: FigureSpec(FigureType.CIRCLE, (1.5, )),
+            lambda: DictFigureSpec(FigureType.CIRCLE, (1.5, )),
+            ),
+        }
+
+
+def bytes_per_object(factory: Callable[[], Any], n: int) -> float:
+    """allocated bytes per alive object (args are shared)."""
+    tracemalloc.start()
+    objs = [factory() for _ in range(n)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    # list itself holds a pointer per object
+    return size / n - 8
+
+
+def ns_per_object(factory: Callable[[], Any], n: int) -> float:
+    return min(timeit.repeat(factory, number=n, repeat=7)) / n * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=100_000)
+    opts = parser.parse_args()
+    print(f"{'case':<10}{'B/obj':>10}{'B/obj dict':>12}{'ns/obj':>10}{'ns/obj dict':>13}")
+    for name, (slotted, with_dict) in CASES.items():
+        print(
+            f"{name:<10}"
+            f"{bytes_per_object(slotted, opts.n):>10.1f}"
+            f"{bytes_per_object(with_dict, opts.n):>12.1f}"
+            f"{ns_per_object(slotted, opts.n):>10.1f}"
+            f"{ns_per_object(with_dict, opts.n):>13.1f}"
+            )
+    generated = ns_per_object(lambda: GeneratedInitSpec(FigureType.CIRCLE, (1.5, )), opts.n)
+    current = ns_per_object(lambda: FigureSpec(FigureType.CIRCLE, (1.5, )), opts.n)
+    print(f"FigureSpec ns/obj: generated frozen __init__ {generated:.1f}, own __init__ {current:.1f}")
+
+
+if __name__ == "__main__":
+    main()
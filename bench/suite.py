@@ -0,0 +1,726 @@
+"""Benchmark suite for figures hot paths.
+
+Every case processes a realistic mixed workload (all figure types,
+repeated standard sizes, a few invalid dimentions) and reports
+ops/sec, bytes and memory blocks allocated per op (tracemalloc
+snapshot diff of one run, the result of run is kept alive, so its
+memory is counted too) and peak memory traced while it runs.
+Results can be saved as JSON baseline and compared later to catch
+regressions.
+
+Run:
+    python bench/suite.py                         # all cases
+    python bench/suite.py -k batch -n 200000      # filter cases by name
+    python bench/suite.py --save base.json        # save baseline
+    python bench/suite.py --compare base.json     # exit 1 on regression
+"""
+import argparse
+import asyncio
+import atexit
+import gc
+import importlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Final, Optional, Any
+
+import numpy as np
+
+from figures import (
+        AreaService,
+        FigureBatch,
+        FigureCollection,
+        FigureIndex,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        aggregate_figure_areas,
+        build_figure_spec,
+        calculate_areas,
+        calculate_circle_area,
+        calculate_figure_area,
+        calculate_figure_areas,
+        calculate_polygon_area,
+        calculate_polygon_areas,
+        calculate_rectangle_area,
+        calculate_square_area,
+        calculate_triangle_area,
+        calculate_unique_areas,
+        classify_triangles,
+        compute_areas_parquet,
+        disable_area_cache,
+        disable_metrics,
+        enable_area_cache,
+        enable_metrics,
+        is_triangle_right,
+        iter_figure_areas,
+        measure_figure,
+        measure_figures,
+        parallel_figure_areas,
+        register_pandas_accessor,
+        validate_figures,
+        read_figures_binary,
+        write_figures_binary,
+        _new_circle,
+        _new_rectangle,
+        _new_square,
+        _new_triangle,
+        )
+from figures.core import _TypeSwitch
+
+
+RawT = tuple[FigureType, tuple[float, ...]]
+RunT = Callable[[], object]
+PrepareT = Callable[[list[RawT]], tuple[RunT, int]]
+
+_SEED = 42
+# share of types in workload
+_TYPES = (FigureType.RECTANGLE, FigureType.SQUARE, FigureType.CIRCLE, FigureType.TRIANGLE)
+_WEIGHTS = (0.4, 0.25, 0.2, 0.15)
+
+
+def make_workload(n: int, *, distinct: int = 5000, invalid: float = 0.01) -> list[RawT]:
+    """mixed figures, sizes repeat like standard tiles and pipes."""
+    rnd = random.Random(_SEED)
+    pool: list[RawT] = []
+    for ftype in rnd.choices(_TYPES, _WEIGHTS, k=distinct):
+        if ftype is FigureType.TRIANGLE:
+            a, b = rnd.uniform(1, 10), rnd.uniform(1, 10)
+            c = rnd.uniform(abs(a - b) + 0.1, a + b - 0.1)
+            pool.append((ftype, (a, b, c)))
+        elif ftype is FigureType.RECTANGLE:
+            pool.append((ftype, (rnd.uniform(0.1, 10), rnd.uniform(0.1, 10))))
+        else:
+            pool.append((ftype, (rnd.uniform(0.1, 10), )))
+    work = [rnd.choice(pool) for _ in range(n)]
+    for idx in rnd.sample(range(n), int(n * invalid)):
+        ftype, args = work[idx]
+        work[idx] = (ftype, (-1.0, *args[1:]))
+    return work
+
+
+def _specs(work: list[RawT]) -> list[FigureSpec]:
+    return [build_figure_spec(ftype, *args) for ftype, args in work]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    prepare: PrepareT
+
+
+CASES: list[Case] = []
+
+
+def case(name: str) -> Callable[[PrepareT], PrepareT]:
+    """register case, prepare() returns run func and ops count per run."""
+    def register(prepare: PrepareT) -> PrepareT:
+        CASES.append(Case(name, prepare))
+        return prepare
+    return register
+
+
+def _per_call(func: Callable[..., object], ftype: FigureType) -> PrepareT:
+    def prepare(work: list[RawT]) -> tuple[RunT, int]:
+        args = [a for t, a in work if t is ftype and a[0] > 0]
+
+        def run() -> None:
+            for a in args:
+                func(*a)
+        return run, len(args)
+    return prepare
+
+
+case("calculate_circle_area")(_per_call(calculate_circle_area, FigureType.CIRCLE))
+case("calculate_square_area")(_per_call(calculate_square_area, FigureType.SQUARE))
+case("calculate_rectangle_area")(
+        _per_call(calculate_rectangle_area, FigureType.RECTANGLE),
+        )
+case("calculate_triangle_area")(_per_call(calculate_triangle_area, FigureType.TRIANGLE))
+
+
+@case("is_triangle_right")
+def _is_right(work: list[RawT]) -> tuple[RunT, int]:
+    args = [a for t, a in work if t is FigureType.TRIANGLE and a[0] > 0]
+
+    def run() -> None:
+        for a in args:
+            is_triangle_right(*a, rel_tolerance=1e-3)
+    return run, len(args)
+
+
+@case("classify_triangles")
+def _classify(work: list[RawT]) -> tuple[RunT, int]:
+    a, b, c = zip(*(a for t, a in work if t is FigureType.TRIANGLE))
+    return lambda: classify_triangles(a, b, c, rel_tol=1e-3), len(a)
+
+
+def _triangle_columns(work: list[RawT], rows: int = 2_000_000) -> list[np.ndarray]:
+    """workload triangles tiled up to rows (big arrays, memory bound)."""
+    sides = np.array([a for t, a in work if t is FigureType.TRIANGLE and a[0] > 0])
+    return list(np.resize(sides, (rows, 3)).T.copy())
+
+
+@case("calculate_areas_triangle_float64")
+def _triangles64(work: list[RawT]) -> tuple[RunT, int]:
+    cols = _triangle_columns(work)
+    return lambda: calculate_areas(FigureType.TRIANGLE, *cols), len(cols[0])
+
+
+@case("calculate_areas_triangle_float32")
+def _triangles32(work: list[RawT]) -> tuple[RunT, int]:
+    cols = [col.astype(np.float32) for col in _triangle_columns(work)]
+    return (
+            lambda: calculate_areas(FigureType.TRIANGLE, *cols, dtype=np.float32),
+            len(cols[0]),
+            )
+
+
+@case("build_figure_spec")
+def _build(work: list[RawT]) -> tuple[RunT, int]:
+    def run() -> None:
+        for ftype, args in work:
+            build_figure_spec(ftype, *args)
+    return run, len(work)
+
+
+def _dispatch_all(specs: list[FigureSpec]) -> None:
+    for spec in specs:
+        try:
+            calculate_figure_area(spec)
+        except ImpossibleDimention:
+            pass
+
+
+@case("calculate_figure_area")
+def _dispatch(work: list[RawT]) -> tuple[RunT, int]:
+    specs = _specs(work)
+    return lambda: _dispatch_all(specs), len(specs)
+
+
+@case("figure_objects_area")
+def _objects(work: list[RawT]) -> tuple[RunT, int]:
+    """reference: area through figure objects creation
+    (as calculate_figure_area did before area kernels)."""
+    factories: dict[FigureType, Callable[..., Any]] = {
+            FigureType.CIRCLE: _new_circle,
+            FigureType.SQUARE: _new_square,
+            FigureType.RECTANGLE: _new_rectangle,
+            FigureType.TRIANGLE: _new_triangle,
+            }
+    specs = _specs(work)
+
+    def run() -> None:
+        for spec in specs:
+            try:
+                factories[spec.ftype](*spec.args).area()
+            except ImpossibleDimention:
+                pass
+    return run, len(specs)
+
+
+@case("build_and_calculate_figure_area")
+def _build_dispatch(work: list[RawT]) -> tuple[RunT, int]:
+    def run() -> None:
+        for ftype, args in work:
+            try:
+                calculate_figure_area(build_figure_spec(ftype, *args))
+            except ImpossibleDimention:
+                pass
+    return run, len(work)
+
+
+def _with_cache(prepare: PrepareT) -> PrepareT:
+    """same case with area cache on, cache is cold on every run
+    (misses are paid for distinct sizes of workload)."""
+    def cached(work: list[RawT]) -> tuple[RunT, int]:
+        run, ops = prepare(work)
+
+        def run_cached() -> None:
+            enable_area_cache()
+            try:
+                run()
+            finally:
+                disable_area_cache()
+        return run_cached, ops
+    return cached
+
+
+case("calculate_figure_area_cached")(_with_cache(_dispatch))
+case("calculate_triangle_area_cached")(
+        _with_cache(_per_call(calculate_triangle_area, FigureType.TRIANGLE)),
+        )
+
+
+@case("calculate_figure_area_metrics")
+def _metrics(work: list[RawT]) -> tuple[RunT, int]:
+    """metrics are on, compare with calculate_figure_area
+    (metrics are off) to see instrumentation cost."""
+    specs = _specs(work)
+
+    def run() -> None:
+        enable_metrics()
+        try:
+            _dispatch_all(specs)
+        finally:
+            disable_metrics()
+    return run, len(specs)
+
+
+def _uninstrumented_area(spec: FigureSpec) -> float:
+    """calculate_figure_area() body without metrics and cache checks."""
+    areaf = _TypeSwitch.find_fig_type(spec.ftype)
+    if areaf is None:
+        raise FigureTypeError(f"No type <{spec.ftype}> specified.")
+    return areaf(*spec.args)
+
+
+@case("calculate_figure_area_uninstrumented")
+def _uninstrumented(work: list[RawT]) -> tuple[RunT, int]:
+    """reference: calculate_figure_area without instrumentation,
+    compare with calculate_figure_area (metrics and cache are off)
+    to see cost of disabled metrics."""
+    specs = _specs(work)
+
+    def run() -> None:
+        for spec in specs:
+            try:
+                _uninstrumented_area(spec)
+            except ImpossibleDimention:
+                pass
+    return run, len(specs)
+
+
+@case("calculate_figure_areas_specs")
+def _batch_specs(work: list[RawT]) -> tuple[RunT, int]:
+    specs = _specs(work)
+    return lambda: calculate_figure_areas(specs), len(specs)
+
+
+@case("calculate_unique_areas")
+def _unique(work: list[RawT]) -> tuple[RunT, int]:
+    """workload has 5000 distinct specs, compare
+    with calculate_figure_areas_specs."""
+    specs = _specs(work)
+    return lambda: calculate_unique_areas(specs), len(specs)
+
+
+@case("calculate_figure_areas_batch")
+def _batch(work: list[RawT]) -> tuple[RunT, int]:
+    batch = FigureBatch(_specs(work))
+    return lambda: calculate_figure_areas(batch), len(batch)
+
+
+@case("figure_batch_build")
+def _batch_build(work: list[RawT]) -> tuple[RunT, int]:
+    def run() -> None:
+        batch = FigureBatch()
+        for ftype, args in work:
+            batch.append_figure(ftype, *args)
+    return run, len(work)
+
+
+@case("parallel_figure_areas")
+def _parallel(work: list[RawT]) -> tuple[RunT, int]:
+    batch = FigureBatch(_specs(work))
+    workers = min(os.cpu_count() or 1, 4)
+    chunk = max(len(batch) // workers, 1)
+    return (
+            lambda: parallel_figure_areas(batch, workers=workers, chunk_size=chunk),
+            len(batch),
+            )
+
+
+@case("area_service")
+def _service(work: list[RawT]) -> tuple[RunT, int]:
+    """concurrent requests merged into batches."""
+    specs = _specs(work)
+
+    async def requests() -> None:
+        async with AreaService() as service:
+            await asyncio.gather(
+                    *(service.area(s) for s in specs),
+                    return_exceptions=True,
+                    )
+    return lambda: asyncio.run(requests()), len(specs)
+
+
+@case("iter_figure_areas_csv")
+def _stream(work: list[RawT]) -> tuple[RunT, int]:
+    text = "".join(f"{t.value},{','.join(map(repr, a))}\n" for t, a in work)
+
+    def run() -> None:
+        for _ in iter_figure_areas(io.StringIO(text), fmt="csv"):
+            pass
+    return run, len(work)
+
+
+@case("binary_records_areas")
+def _binary(work: list[RawT]) -> tuple[RunT, int]:
+    """map binary file and calculate areas (file is in page cache)."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".bin", delete=False)
+    tmp.close()
+    atexit.register(os.unlink, tmp.name)
+    write_figures_binary(tmp.name, FigureBatch(_specs(work)))
+
+    def run() -> None:
+        calculate_figure_areas(read_figures_binary(tmp.name))
+    return run, len(work)
+
+
+@case("compute_areas_parquet")
+def _parquet(work: list[RawT]) -> tuple[RunT, int]:
+    """parquet -> areas parquet in 64k rows batches (files are in page cache)."""
+    pa = importlib.import_module("pyarrow")
+    pq = importlib.import_module("pyarrow.parquet")
+
+    params = np.full((len(work), 3), np.nan)
+    for row, (_, args) in enumerate(work):
+        params[row, :len(args)] = args
+    table = pa.table({
+            "ftype": pa.array([t.value for t, _ in work]).dictionary_encode(),
+            "p0": params[:, 0],
+            "p1": params[:, 1],
+            "p2": params[:, 2],
+            })
+    src = tempfile.NamedTemporaryFile(suffix=".parquet", delete=False)
+    sink = tempfile.NamedTemporaryFile(suffix=".parquet", delete=False)
+    src.close()
+    sink.close()
+    atexit.register(os.unlink, src.name)
+    atexit.register(os.unlink, sink.name)
+    pq.write_table(table, src.name)
+
+    def run() -> None:
+        compute_areas_parquet(src.name, sink.name)
+    return run, len(work)
+
+
+@case("pandas_accessor_area")
+def _pandas_area(work: list[RawT]) -> tuple[RunT, int]:
+    """df.figures.area() on categorical type column."""
+    pd = importlib.import_module("pandas")
+    register_pandas_accessor()
+    params = np.full((len(work), 3), np.nan)
+    for row, (_, args) in enumerate(work):
+        params[row, :len(args)] = args
+    df = pd.DataFrame({
+            "ftype": pd.Categorical([t.value for t, _ in work]),
+            "p0": params[:, 0],
+            "p1": params[:, 1],
+            "p2": params[:, 2],
+            })
+    return lambda: df.figures.area(), len(work)
+
+
+@case("aggregate_figure_areas")
+def _aggregate(work: list[RawT]) -> tuple[RunT, int]:
+    specs = _specs(work)
+    edges = (1.0, 10.0, 100.0, 1000.0)
+    return lambda: aggregate_figure_areas(specs, edges), len(specs)
+
+
+@case("figure_index_build")
+def _index_build(work: list[RawT]) -> tuple[RunT, int]:
+    specs = [s for s in _specs(work) if s.args[0] > 0]
+    return lambda: FigureIndex(specs), len(specs)
+
+
+@case("figure_index_queries")
+def _index_queries(work: list[RawT]) -> tuple[RunT, int]:
+    """top-k and range queries over index of whole workload."""
+    index = FigureIndex(s for s in _specs(work) if s.args[0] > 0)
+    queries = 1000
+
+    def run() -> None:
+        for i in range(queries):
+            index.top_k(100, _TYPES[i % len(_TYPES)])
+            index.between(i, i + 1.0)
+    return run, queries
+
+
+@case("figure_collection_edit_total")
+def _collection(work: list[RawT]) -> tuple[RunT, int]:
+    """replace one figure and ask total area (dashboard edits)."""
+    factories: dict[FigureType, Callable[..., Any]] = {
+            FigureType.CIRCLE: _new_circle,
+            FigureType.SQUARE: _new_square,
+            FigureType.RECTANGLE: _new_rectangle,
+            FigureType.TRIANGLE: _new_triangle,
+            }
+    figures = [factories[t](*a) for t, a in work if a[0] > 0]
+    coll = FigureCollection(figures)
+    coll.total_area()
+    ids = list(coll)
+    edits = 10_000
+
+    def run() -> None:
+        for i in range(edits):
+            coll.replace(ids[i % len(ids)], figures[-1 - i % len(figures)])
+            coll.total_area()
+    return run, edits
+
+
+def _polygons(n: int) -> list[tuple[float, ...]]:
+    """floor plan like polygons, 4..16 vertices."""
+    rnd = random.Random(_SEED)
+    out = []
+    for _ in range(n):
+        cx, cy, r = rnd.uniform(0, 1e4), rnd.uniform(0, 1e4), rnd.uniform(1, 50)
+        angles = sorted(rnd.uniform(0, 2 * math.pi) for _ in range(rnd.randint(4, 16)))
+        out.append(tuple(
+            c for a in angles for c in (cx + r * math.cos(a), cy + r * math.sin(a))
+            ))
+    return out
+
+
+@case("calculate_polygon_area")
+def _polygon(work: list[RawT]) -> tuple[RunT, int]:
+    polygons = _polygons(len(work) // 10)
+
+    def run() -> None:
+        for coords in polygons:
+            calculate_polygon_area(*coords)
+    return run, len(polygons)
+
+
+@case("calculate_polygon_area_plans")
+def _polygon_plans(work: list[RawT]) -> tuple[RunT, int]:
+    """standard floor plans, every one comes 20 times."""
+    pool = _polygons(len(work) // 200)
+    polygons = random.Random(_SEED).choices(pool, k=len(pool) * 20)
+
+    def run() -> None:
+        for coords in polygons:
+            calculate_polygon_area(*coords)
+    return run, len(polygons)
+
+
+case("calculate_polygon_area_plans_cached")(_with_cache(_polygon_plans))
+
+
+@case("calculate_polygon_areas")
+def _polygons_vec(work: list[RawT]) -> tuple[RunT, int]:
+    polygons = _polygons(len(work) // 10)
+    offsets = np.cumsum([0, *map(len, polygons)])
+    coords = np.concatenate(polygons)
+    return lambda: calculate_polygon_areas(coords, offsets), len(polygons)
+
+
+def _valid_specs(work: list[RawT]) -> list[FigureSpec]:
+    specs = []
+    for spec in _specs(work):
+        try:
+            calculate_figure_area(spec)
+        except (ImpossibleDimention, ValueError):
+            continue
+        specs.append(spec)
+    return specs
+
+
+@case("measure_figure")
+def _measure(work: list[RawT]) -> tuple[RunT, int]:
+    """area, perimeter and right flag by one call,
+    compare with separate_figure_measures."""
+    specs = _valid_specs(work)
+
+    def run() -> None:
+        for spec in specs:
+            measure_figure(spec, rel_tol=1e-3)
+    return run, len(specs)
+
+
+@case("separate_figure_measures")
+def _separate_measures(work: list[RawT]) -> tuple[RunT, int]:
+    """reference: area, perimeter (figure object) and
+    right flag by separate calls."""
+    factories: dict[FigureType, Callable[..., Any]] = {
+            FigureType.CIRCLE: _new_circle,
+            FigureType.SQUARE: _new_square,
+            FigureType.RECTANGLE: _new_rectangle,
+            FigureType.TRIANGLE: _new_triangle,
+            }
+    specs = _valid_specs(work)
+
+    def run() -> None:
+        for spec in specs:
+            calculate_figure_area(spec)
+            factories[spec.ftype](*spec.args).perimeter()
+            if spec.ftype is FigureType.TRIANGLE:
+                is_triangle_right(*spec.args, rel_tolerance=1e-3)
+    return run, len(specs)
+
+
+@case("measure_figures_batch")
+def _measure_batch(work: list[RawT]) -> tuple[RunT, int]:
+    batch = FigureBatch(_specs(work))
+    return lambda: measure_figures(batch, rel_tol=1e-3), len(batch)
+
+
+def _dirty(work: list[RawT], share: float = 0.05) -> list[tuple[Any, tuple[float, ...]]]:
+    """workload with share of bad rows: unknown type, wrong
+    args count, not positive dimention or impossible triangle."""
+    rnd = random.Random(_SEED)
+    dirty: list[tuple[Any, tuple[float, ...]]] = list(work)
+    for idx in rnd.sample(range(len(work)), int(len(work) * share)):
+        ftype, args = work[idx]
+        dirty[idx] = rnd.choice((
+                ("hexagon", args),
+                (ftype, (*args, 1.0)),
+                (ftype, (0.0, *args[1:])),
+                (FigureType.TRIANGLE, (1.0, 1.0, 5.0)),
+                ))
+    return dirty
+
+
+@case("build_and_calculate_dirty")
+def _build_dirty(work: list[RawT]) -> tuple[RunT, int]:
+    """reference: errors of bad rows are raised and caught."""
+    dirty = _dirty(work)
+
+    def run() -> None:
+        for ftype, args in dirty:
+            try:
+                calculate_figure_area(build_figure_spec(FigureType(ftype), *args))
+            except (ValueError, ImpossibleDimention, FigureSpecError, FigureTypeError):
+                pass
+    return run, len(dirty)
+
+
+@case("validate_figures_dirty")
+def _validate_dirty(work: list[RawT]) -> tuple[RunT, int]:
+    dirty = _dirty(work)
+    return lambda: validate_figures(dirty).areas(), len(dirty)
+
+
+@dataclass(frozen=True)
+class Result:
+    ops_per_sec: float
+    bytes_per_op: float
+    blocks_per_op: float
+    peak_bytes: int
+
+
+_TRACE_FILTERS: Final[tuple[tracemalloc.Filter, ...]] = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+        )
+
+
+def allocated(run: RunT) -> tuple[int, int, int]:
+    """bytes and blocks allocated by run which are reachable
+    after it (its result included) and peak traced bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+        out = run()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+    finally:
+        tracemalloc.stop()
+    del out
+    diff = after.compare_to(before, "filename")
+    size = sum(d.size_diff for d in diff)
+    blocks = sum(d.count_diff for d in diff)
+    return max(size, 0), max(blocks, 0), peak
+
+
+def measure(run: RunT, ops: int, repeat: int) -> Result:
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    size, blocks, peak = allocated(run)
+    return Result(
+            ops_per_sec=ops / best if best else float("inf"),
+            bytes_per_op=size / max(ops, 1),
+            blocks_per_op=blocks / max(ops, 1),
+            peak_bytes=peak,
+            )
+
+
+def compare(
+        results: dict[str, Result],
+        baseline: dict[str, dict[str, float]],
+        tolerance: float,
+        ) -> list[str]:
+    """names of cases which became slower than baseline * (1 - tolerance)."""
+    slow = []
+    for name, res in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if res.ops_per_sec < base["ops_per_sec"] * (1 - tolerance):
+            slow.append(name)
+    return slow
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+            description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            )
+    parser.add_argument("-n", type=int, default=50_000, help="figures in workload")
+    parser.add_argument("-k", default="", help="run cases which names contain it")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--save", help="save results as JSON baseline")
+    parser.add_argument("--compare", help="compare with JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    opts = parser.parse_args(argv)
+
+    work = make_workload(opts.n)
+    results: dict[str, Result] = {}
+    print(
+        f"{'case':<36}{'ops/sec':>14}{'B/op':>10}"
+        f"{'blocks/op':>11}{'peak KiB':>11}"
+        )
+    for c in CASES:
+        if opts.k not in c.name:
+            continue
+        run, ops = c.prepare(work)
+        res = results[c.name] = measure(run, ops, opts.repeat)
+        print(
+            f"{c.name:<36}{res.ops_per_sec:>14,.0f}"
+            f"{res.bytes_per_op:>10.1f}{res.blocks_per_op:>11.2f}"
+            f"{res.peak_bytes / 1024:>11.1f}"
+            )
+
+    if opts.save:
+        with open(opts.save, "w") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "python": sys.version,
+                        "platform": platform.platform(),
+                        "n": opts.n,
+                        },
+                    "results": {k: asdict(v) for k, v in results.items()},
+                    },
+                f,
+                indent=2,
+                )
+    if opts.compare:
+        with open(opts.compare) as f:
+            baseline = json.load(f)["results"]
+        slow = compare(results, baseline, opts.tolerance)
+        for name in slow:
+            print(
+                f"REGRESSION {name}: {results[name].ops_per_sec:,.0f} ops/sec, "
+                f"baseline {baseline[name]['ops_per_sec']:,.0f}"
+                )
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""Figures areas library.
+
+Figures, scalar area functions, cache and metrics switches are
+imported with the package. Optional features (vectorized numpy
+API, IO, services, backends...) are submodules imported on first
+use of their names, so import of figures stays cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, Final, Mapping
+
+from .core import (
+        Base2DFigure,
+        AreaT,
+        FigureType,
+        ParamT,
+        ImpossibleDimention,
+        FigureSpecError,
+        FigureTypeError,
+        calculate_figure_area,
+        is_triangle_right,
+        calculate_circle_area,
+        calculate_square_area,
+        calculate_triangle_area,
+        build_figure_spec,
+        calculate_rectangle_area,
+        calculate_polygon_area,
+        AreasT,
+        MaskT,
+        enable_area_cache,
+        disable_area_cache,
+        get_area_cache,
+        enable_metrics,
+        disable_metrics,
+        get_metrics,
+        )
+# not in __all__, but were always importable from figures
+from .core import (
+        FigureSpec,
+        AbcFigure,
+        Circle,
+        Triangle,
+        Rectangle,
+        Square,
+        Polygon,
+        _args_bigger_as_zero,
+        _new_circle,
+        _new_triangle,
+        _new_square,
+        _new_rectangle,
+        )
+
+if TYPE_CHECKING:
+    from .batch import (
+            FigureBatch,
+            FigureRecords,
+            )
+    from .vectorized import (
+            calculate_polygon_areas,
+            calculate_areas,
+            calculate_figure_areas,
+            UniqueAreas,
+            calculate_unique_areas,
+            args_valid_mask,
+            TriangleClasses,
+            classify_triangles,
+            calculate_column_areas,
+            column_triangles_right,
+            )
+    from .measures import (
+            FigureMeasures,
+            measure_figure,
+            BatchMeasures,
+            measure_figures,
+            )
+    from .validation import (
+            SpecStatus,
+            FiguresValidation,
+            validate_figures,
+            )
+    from .io import (
+            AreaResult,
+            iter_figure_areas,
+            write_figure_areas,
+            read_figures_parquet,
+            compute_areas_parquet,
+            write_figures_binary,
+            read_figures_binary,
+            )
+    from .cache import (
+            FigureAreaCache,
+            CacheStats,
+            )
+    from .metrics import (
+            OpStats,
+            MetricsSnapshot,
+            FigureMetrics,
+            )
+    from .parallel import (
+            AreasReport,
+            parallel_figure_areas,
+            )
+    from .service import (
+            AreaService,
+            )
+    from .aggregation import (
+            AreaSummary,
+            AreaAccumulator,
+            AreaAggregator,
+            aggregate_figure_areas,
+            )
+    from .index import (
+            FigureIndex,
+            )
+    from .collection import (
+            FigureCollection,
+            )
+    from .backends import (
+            AreaBackend,
+            register_backend,
+            set_backend,
+            get_backend,
+            available_backends,
+            compute_figure_areas,
+            )
+    from .accessor import (
+            FiguresAccessor,
+            register_pandas_accessor,
+            )
+
+
+__all__ = (
+        "Base2DFigure",
+        "AreaT",
+        "FigureType",
+        "ParamT",
+        "ImpossibleDimention",
+        "FigureSpecError",
+        "FigureTypeError",
+        "calculate_figure_area",
+        "is_triangle_right",
+        "calculate_circle_area",
+        "calculate_square_area",
+        "calculate_triangle_area",
+        "build_figure_spec",
+        "calculate_rectangle_area",
+        "calculate_polygon_area",
+        "calculate_polygon_areas",
+        "AreasT",
+        "MaskT",
+        "calculate_areas",
+        "calculate_figure_areas",
+        "UniqueAreas",
+        "calculate_unique_areas",
+        "args_valid_mask",
+        "FigureBatch",
+        "AreaResult",
+        "iter_figure_areas",
+        "write_figure_areas",
+        "read_figures_parquet",
+        "compute_areas_parquet",
+        "AreasReport",
+        "parallel_figure_areas",
+        "FigureAreaCache",
+        "CacheStats",
+        "enable_area_cache",
+        "disable_area_cache",
+        "get_area_cache",
+        "OpStats",
+        "MetricsSnapshot",
+        "FigureMetrics",
+        "enable_metrics",
+        "disable_metrics",
+        "get_metrics",
+        "TriangleClasses",
+        "FigureMeasures",
+        "measure_figure",
+        "BatchMeasures",
+        "measure_figures",
+        "SpecStatus",
+        "FiguresValidation",
+        "validate_figures",
+        "classify_triangles",
+        "calculate_column_areas",
+        "column_triangles_right",
+        "AreaService",
+        "FigureRecords",
+        "write_figures_binary",
+        "read_figures_binary",
+        "AreaSummary",
+        "AreaAccumulator",
+        "AreaAggregator",
+        "aggregate_figure_areas",
+        "FigureIndex",
+        "FigureCollection",
+        "AreaBackend",
+        "register_backend",
+        "set_backend",
+        "get_backend",
+        "available_backends",
+        "compute_figure_areas",
+        "FiguresAccessor",
+        "register_pandas_accessor",
+        )
+
+# name -> submodule, see __getattr__()
+_SUBMODULES: Final[Mapping[str, str]] = {
+        "FigureBatch": "batch",
+        "FigureRecords": "batch",
+        "calculate_polygon_areas": "vectorized",
+        "calculate_areas": "vectorized",
+        "calculate_figure_areas": "vectorized",
+        "UniqueAreas": "vectorized",
+        "calculate_unique_areas": "vectorized",
+        "args_valid_mask": "vectorized",
+        "TriangleClasses": "vectorized",
+        "classify_triangles": "vectorized",
+        "calculate_column_areas": "vectorized",
+        "column_triangles_right": "vectorized",
+        "FigureMeasures": "measures",
+        "measure_figure": "measures",
+        "BatchMeasures": "measures",
+        "measure_figures": "measures",
+        "SpecStatus": "validation",
+        "FiguresValidation": "validation",
+        "validate_figures": "validation",
+        "AreaResult": "io",
+        "iter_figure_areas": "io",
+        "write_figure_areas": "io",
+        "read_figures_parquet": "io",
+        "compute_areas_parquet": "io",
+        "write_figures_binary": "io",
+        "read_figures_binary": "io",
+        "FigureAreaCache": "cache",
+        "CacheStats": "cache",
+        "OpStats": "metrics",
+        "MetricsSnapshot": "metrics",
+        "FigureMetrics": "metrics",
+        "AreasReport": "parallel",
+        "parallel_figure_areas": "parallel",
+        "AreaService": "service",
+        "AreaSummary": "aggregation",
+        "AreaAccumulator": "aggregation",
+        "AreaAggregator": "aggregation",
+        "aggregate_figure_areas": "aggregation",
+        "FigureIndex": "index",
+        "FigureCollection": "collection",
+        "AreaBackend": "backends",
+        "register_backend": "backends",
+        "set_backend": "backends",
+        "get_backend": "backends",
+        "available_backends": "backends",
+        "compute_figure_areas": "backends",
+        "FiguresAccessor": "accessor",
+        "register_pandas_accessor": "accessor",
+        }
+
+
+def __getattr__(name: str) -> Any:
+    """import submodule of optional feature on first use."""
+    module = _SUBMODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES})
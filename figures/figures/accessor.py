@@ -0,0 +1,197 @@
+"""pandas DataFrame accessor (df.figures)."""
+import importlib
+from typing import (
+        TYPE_CHECKING,
+        cast,
+        Optional,
+        Final,
+        Sequence,
+        Iterator,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        FigureSpecError,
+        FigureType,
+        MaskT,
+        _ArgsCounter,
+        )
+from .batch import _TypeCoder
+from .vectorized import (
+        calculate_areas,
+        classify_triangles,
+        )
+from .validation import (
+        SpecStatus,
+        _group_status,
+        )
+from .io import _type_codes_lut
+
+
+__all__ = (
+        "FiguresAccessor",
+        "register_pandas_accessor",
+        )
+
+
+_PANDAS_ACCESSOR: Final[str] = "figures"
+
+
+class FiguresAccessor:
+    """pandas DataFrame accessor, df.figures after register_pandas_accessor().
+    Works on a type column (str, FigureType or categorical) and param
+    columns, every figure uses as many first param columns as it needs
+    (like calculate_column_areas()). Rows are grouped by type codes and
+    every group is calculated by one vector kernel, results are Series
+    with frame index. Other columns are used by call:
+        df.figures("kind", params=("a", "b", "c")).area()
+    Polygons don`t fit param columns."""
+
+    __slots__ = ("_df", "_ftype", "_params")
+
+    def __init__(
+            self,
+            df: Any,
+            ftype: str = "ftype",
+            params: Sequence[str] = ("p0", "p1", "p2"),
+            ) -> None:
+        self._df = df
+        self._ftype = ftype
+        self._params = tuple(params)
+
+    def __call__(
+            self,
+            ftype: str = "ftype",
+            *,
+            params: Sequence[str] = ("p0", "p1", "p2"),
+            ) -> "FiguresAccessor":
+        return type(self)(self._df, ftype, params)
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(ftype={self._ftype!r}, params={self._params!r})"
+
+    def _column(self, name: str) -> Any:
+        if name not in self._df.columns:
+            raise ValueError(f"No column <{name}> in frame.")
+        return self._df[name]
+
+    def _codes(self) -> "npt.NDArray[np.uint8]":
+        """type code per row, unknown types and missing values get
+        code which isn`t used. Categorical columns are mapped by their
+        categories, others are factorized first, so only distinct
+        values are matched with types."""
+        pd = importlib.import_module("pandas")
+        col = self._column(self._ftype)
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            values, idx = col.cat.categories, col.cat.codes.to_numpy()
+        else:
+            idx, values = pd.factorize(col)
+        # missing values are -1, so they get last (unknown) code
+        return cast("npt.NDArray[np.uint8]", _type_codes_lut(values)[idx])
+
+    def _groups(self) -> Iterator[tuple[FigureType, MaskT]]:
+        """masks of rows by fixed arity type (found types only)."""
+        codes = self._codes()
+        for ftype in _ArgsCounter.fixed_types():
+            mask = codes == _TypeCoder.get_code(ftype)
+            if mask.any():
+                yield ftype, mask
+
+    def _param(self, pos: int) -> tuple[AreasT, MaskT]:
+        """float values of param column and its missing values mask,
+        values which aren`t numbers become NaN."""
+        import numpy as np
+        pd = importlib.import_module("pandas")
+        col = self._column(self._params[pos])
+        values = pd.to_numeric(col, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        return values, col.isna().to_numpy()
+
+    def area(self) -> Any:
+        """areas Series (named <area>), NaN for unknown types,
+        polygons and impossible dimentions."""
+        import numpy as np
+        pd = importlib.import_module("pandas")
+        out = np.full(len(self._df), np.nan, dtype=np.float64)
+        params: dict[int, AreasT] = {}
+        for ftype, mask in self._groups():
+            cnt = _ArgsCounter.get_args_count(ftype)
+            if len(self._params) < cnt:
+                raise FigureSpecError(
+                        f"Not enough param columns for <{ftype}>. "
+                        f"Got: {len(self._params)}, need: {cnt}"
+                        )
+            for pos in range(cnt):
+                if pos not in params:
+                    params[pos] = self._param(pos)[0]
+            out[mask] = calculate_areas(ftype, *(params[pos][mask] for pos in range(cnt)))
+        return pd.Series(out, index=self._df.index, name="area")
+
+    def is_right(self, *, rel_tol: Optional["npt.ArrayLike"] = None) -> Any:
+        """right triangle flags Series (named <is_right>), False for
+        other figures and impossible triangles."""
+        import numpy as np
+        pd = importlib.import_module("pandas")
+        out = np.zeros(len(self._df), dtype=np.bool_)
+        for ftype, mask in self._groups():
+            if ftype is not FigureType.TRIANGLE:
+                continue
+            if len(self._params) < 3:
+                raise FigureSpecError(
+                        f"Not enough param columns for <{ftype}>. "
+                        f"Got: {len(self._params)}, need: 3"
+                        )
+            a, b, c = (self._param(pos)[0][mask] for pos in range(3))
+            tol = rel_tol
+            if tol is not None and np.ndim(tol):
+                tol = np.asarray(tol)[mask]
+            out[mask] = classify_triangles(a, b, c, rel_tol=tol).right
+        return pd.Series(out, index=self._df.index, name="is_right")
+
+    def validate(self) -> Any:
+        """SpecStatus code per row as uint8 Series (named <status>),
+        nothing is raised. Missing required params (and polygons,
+        which don`t fit param columns) are WRONG_ARGS_COUNT, params
+        which aren`t numbers are BAD_ARGS, dimentions are checked
+        like validate_figures() does."""
+        import numpy as np
+        pd = importlib.import_module("pandas")
+        codes = self._codes()
+        out = np.full(len(self._df), SpecStatus.UNKNOWN_TYPE, dtype=np.uint8)
+        for ftype in _TypeCoder.types():
+            if _ArgsCounter.is_variadic(ftype):
+                out[codes == _TypeCoder.get_code(ftype)] = SpecStatus.WRONG_ARGS_COUNT
+        params: dict[int, tuple[AreasT, MaskT]] = {}
+        for ftype, mask in self._groups():
+            cnt = _ArgsCounter.get_args_count(ftype)
+            if len(self._params) < cnt:
+                out[mask] = SpecStatus.WRONG_ARGS_COUNT
+                continue
+            for pos in range(cnt):
+                if pos not in params:
+                    params[pos] = self._param(pos)
+            values = np.column_stack([params[pos][0][mask] for pos in range(cnt)])
+            missing = np.logical_or.reduce([params[pos][1][mask] for pos in range(cnt)])
+            type_status = _group_status(ftype, values, None)
+            type_status[np.isnan(values).any(axis=1) & ~missing] = SpecStatus.BAD_ARGS
+            type_status[missing] = SpecStatus.WRONG_ARGS_COUNT
+            out[mask] = type_status
+        return pd.Series(out, index=self._df.index, name="status")
+
+
+_pandas_accessors: set[str] = set()
+
+
+def register_pandas_accessor(name: str = _PANDAS_ACCESSOR) -> None:
+    """add FiguresAccessor to pandas DataFrame as df.<name>, pandas is
+    imported here (import figures doesn`t do it). Repeated calls
+    with same name do nothing."""
+    if name in _pandas_accessors:
+        return
+    pd = importlib.import_module("pandas")
+    pd.api.extensions.register_dataframe_accessor(name)(FiguresAccessor)
+    _pandas_accessors.add(name)
@@ -0,0 +1,326 @@
+"""Exact streaming area aggregates (sum, mean, histogram) by figure type."""
+import bisect
+import math
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+        TYPE_CHECKING,
+        Union,
+        Final,
+        Mapping,
+        Sequence,
+        Iterable,
+        Iterator,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        calculate_figure_area,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        _ArgsCounter,
+        _STREAM_CHUNK,
+        )
+from .batch import (
+        FigureBatch,
+        FigureRecords,
+        _TypeCoder,
+        )
+from .vectorized import (
+        calculate_areas,
+        _batch_type_areas,
+        )
+
+
+__all__ = (
+        "AreaSummary",
+        "AreaAccumulator",
+        "AreaAggregator",
+        "aggregate_figure_areas",
+        )
+
+
+# exact sums are kept as ints scaled by 2 ** 1074 (smallest subnormal)
+_EXACT_SHIFT: Final[int] = 1074
+_MANT_BITS: Final[int] = 53
+_HALF_MANT_BITS: Final[int] = 26
+
+
+def _exact_scaled(value: float) -> int:
+    """exact value of float scaled by 2 ** _EXACT_SHIFT."""
+    num, den = value.as_integer_ratio()
+    return (num << _EXACT_SHIFT) // den
+
+
+def _exact_scaled_sum(values: AreasT) -> int:
+    """exact sum of finite non negative floats scaled by
+    2 ** _EXACT_SHIFT. Every value is <mantissa * 2 ** exp> with
+    53 bits integer mantissa, so mantissas with the same exp are
+    summed in int64 (split by halves to avoid overflow)."""
+    import numpy as np
+    if not len(values):
+        return 0
+    mant, exp = np.frexp(values)
+    mants = (mant * float(1 << _MANT_BITS)).astype(np.int64)
+    shifts = exp.astype(np.int64) + (_EXACT_SHIFT - _MANT_BITS)
+    order = np.argsort(shifts, kind="stable")
+    shifts, mants = shifts[order], mants[order]
+    starts = np.flatnonzero(np.r_[True, shifts[1:] != shifts[:-1]])
+    his = np.add.reduceat(mants >> _HALF_MANT_BITS, starts)
+    los = np.add.reduceat(mants & ((1 << _HALF_MANT_BITS) - 1), starts)
+    total = 0
+    for shift, hi, lo in zip(shifts[starts].tolist(), his.tolist(), los.tolist()):
+        part = (hi << _HALF_MANT_BITS) + lo
+        # subnormals have zero low bits, so right shift is exact
+        total += part << shift if shift >= 0 else part >> -shift
+    return total
+
+
+def _scaled_div(scaled: int, count: int) -> float:
+    """correctly rounded <scaled / 2 ** _EXACT_SHIFT / count>."""
+    try:
+        return scaled / (count << _EXACT_SHIFT)
+    except OverflowError:
+        return math.inf
+
+
+@dataclass(frozen=True, slots=True)
+class AreaSummary:
+    """Aggregates of areas for one FigureType.
+    histogram[i] counts areas in [edges[i - 1], edges[i]),
+    first and last bins are open. errors are counted
+    by exception class name."""
+    count: int
+    total: float
+    mean: float
+    min: float
+    max: float
+    edges: tuple[float, ...]
+    histogram: tuple[int, ...]
+    errors: Mapping[str, int]
+
+
+class AreaAccumulator:
+    """Mergeable accumulator of areas, memory doesn`t depend
+    on count of areas. Sum is exact (kept as scaled int), so
+    merged partial results are equal to one pass result
+    whatever the order of chunks is."""
+
+    __slots__ = ("_edges", "_count", "_exact", "_min", "_max", "_hist", "_errors")
+
+    def __init__(self, edges: Sequence[float] = ()) -> None:
+        edges = tuple(float(e) for e in edges)
+        if any(a >= b for a, b in zip(edges, edges[1:])):
+            raise ValueError(f"Histogram edges should be increasing, got: {edges}")
+        self._edges = edges
+        self._count = 0
+        self._exact = 0
+        self._min = math.inf
+        self._max = -math.inf
+        self._hist = [0] * (len(edges) + 1)
+        self._errors: dict[str, int] = {}
+
+    @property
+    def edges(self) -> tuple[float, ...]:
+        return self._edges
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """correctly rounded sum of all areas."""
+        return _scaled_div(self._exact, 1)
+
+    @property
+    def mean(self) -> float:
+        if not self._count:
+            return math.nan
+        return _scaled_div(self._exact, self._count)
+
+    def add(self, area: float) -> None:
+        """add one calculated (finite) area."""
+        self._count += 1
+        self._exact += _exact_scaled(area)
+        self._min = min(self._min, area)
+        self._max = max(self._max, area)
+        self._hist[bisect.bisect_right(self._edges, area)] += 1
+
+    def add_areas(self, areas: "npt.ArrayLike") -> None:
+        """add many areas, NaN are counted as ImpossibleDimention
+        and infinities as OverflowError."""
+        import numpy as np
+        arr = np.asarray(areas, dtype=np.float64)
+        finite = np.isfinite(arr)
+        if not finite.all():
+            nans = int(np.isnan(arr).sum())
+            self.add_error(ImpossibleDimention.__name__, nans)
+            self.add_error(OverflowError.__name__, len(arr) - int(finite.sum()) - nans)
+            arr = arr[finite]
+        if not len(arr):
+            return
+        self._count += len(arr)
+        self._exact += _exact_scaled_sum(arr)
+        self._min = min(self._min, float(arr.min()))
+        self._max = max(self._max, float(arr.max()))
+        bins = np.searchsorted(self._edges, arr, side="right")
+        for idx, cnt in enumerate(np.bincount(bins, minlength=len(self._hist)).tolist()):
+            self._hist[idx] += cnt
+
+    def add_error(self, name: str, count: int = 1) -> None:
+        if count:
+            self._errors[name] = self._errors.get(name, 0) + count
+
+    def merge(self, other: "AreaAccumulator") -> "AreaAccumulator":
+        """add other (e.g. worker) results into self."""
+        if other._edges != self._edges:
+            raise ValueError(
+                    f"Can`t merge accumulators with different edges: "
+                    f"{self._edges} and {other._edges}"
+                    )
+        self._count += other._count
+        self._exact += other._exact
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._hist = [a + b for a, b in zip(self._hist, other._hist)]
+        for name, cnt in other._errors.items():
+            self.add_error(name, cnt)
+        return self
+
+    def summary(self) -> AreaSummary:
+        empty = not self._count
+        return AreaSummary(
+                count=self._count,
+                total=self.total,
+                mean=self.mean,
+                min=math.nan if empty else self._min,
+                max=math.nan if empty else self._max,
+                edges=self._edges,
+                histogram=tuple(self._hist),
+                errors=dict(self._errors),
+                )
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(count={self._count}, errors={self._errors})"
+
+
+class AreaAggregator:
+    """One pass aggregation of areas grouped by FigureType.
+    Accepts specs (one by one or iterable), FigureBatch or
+    FigureRecords; iterables are consumed chunk by chunk,
+    so memory is O(count of types). Aggregators with the same
+    edges can be merged (e.g. results from workers)."""
+
+    __slots__ = ("_edges", "_stats")
+
+    def __init__(self, edges: Sequence[float] = ()) -> None:
+        self._edges = tuple(edges)
+        self._stats: dict[FigureType, AreaAccumulator] = {}
+
+    def _acc(self, ftype: FigureType) -> AreaAccumulator:
+        if (acc := self._stats.get(ftype)) is None:
+            acc = self._stats[ftype] = AreaAccumulator(self._edges)
+        return acc
+
+    def add(self, spec: FigureSpec) -> None:
+        acc = self._acc(spec.ftype)
+        try:
+            area = calculate_figure_area(spec)
+        except (FigureTypeError, FigureSpecError, ImpossibleDimention, OverflowError) as err:
+            acc.add_error(type(err).__name__)
+            return
+        except ValueError:
+            # math domain error for impossible triangle, batch paths
+            # count it as ImpossibleDimention
+            acc.add_error(ImpossibleDimention.__name__)
+            return
+        except TypeError:
+            # not numeric args, batch paths refuse them by FigureSpecError
+            acc.add_error(FigureSpecError.__name__)
+            return
+        if math.isfinite(area):
+            acc.add(area)
+        else:
+            acc.add_error(OverflowError.__name__)
+
+    def update(
+            self,
+            figures: Union[FigureBatch, FigureRecords, Iterable[FigureSpec]],
+            chunk_size: int = _STREAM_CHUNK,
+            ) -> "AreaAggregator":
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size should be bigger as zero, got: {chunk_size}")
+        if isinstance(figures, FigureBatch):
+            for ftype in _TypeCoder.types():
+                if figures.count(ftype):
+                    self._acc(ftype).add_areas(_batch_type_areas(figures, ftype))
+        elif isinstance(figures, FigureRecords):
+            for start in range(0, len(figures), chunk_size):
+                self._update_records(figures[start:start + chunk_size])
+        else:
+            it = iter(figures)
+            while chunk := list(islice(it, chunk_size)):
+                self.update(self._chunk_batch(chunk))
+        return self
+
+    def _update_records(self, records: FigureRecords) -> None:
+        codes, params = records.codes, records.params
+        for ftype in _ArgsCounter.fixed_types():
+            mask = codes == _TypeCoder.get_code(ftype)
+            if mask.any():
+                cnt = _ArgsCounter.get_args_count(ftype)
+                self._acc(ftype).add_areas(
+                        calculate_areas(ftype, *params[mask, :cnt].T),
+                        )
+
+    def _chunk_batch(self, chunk: list[FigureSpec]) -> FigureBatch:
+        """bad specs (not numeric args included) are counted as errors
+        here, failed append leaves batch as it was."""
+        batch = FigureBatch()
+        for spec in chunk:
+            try:
+                batch.append(spec)
+            except (FigureTypeError, FigureSpecError) as err:
+                self._acc(spec.ftype).add_error(type(err).__name__)
+        return batch
+
+    def merge(self, other: "AreaAggregator") -> "AreaAggregator":
+        for ftype, acc in other._stats.items():
+            self._acc(ftype).merge(acc)
+        return self
+
+    def __getitem__(self, ftype: FigureType) -> AreaAccumulator:
+        return self._stats[ftype]
+
+    def __contains__(self, ftype: object) -> bool:
+        return ftype in self._stats
+
+    def __iter__(self) -> Iterator[FigureType]:
+        return iter(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def summary(self) -> dict[FigureType, AreaSummary]:
+        return {ftype: acc.summary() for ftype, acc in self._stats.items()}
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(types={[t.value for t in self._stats]})"
+
+
+def aggregate_figure_areas(
+        figures: Union[FigureBatch, FigureRecords, Iterable[FigureSpec]],
+        edges: Sequence[float] = (),
+        chunk_size: int = _STREAM_CHUNK,
+        ) -> dict[FigureType, AreaSummary]:
+    """count, total, mean, min/max and histogram of areas
+    by FigureType in one pass, without materialized areas."""
+    return AreaAggregator(edges).update(figures, chunk_size).summary()
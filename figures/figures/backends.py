@@ -0,0 +1,199 @@
+"""Pluggable area backends: python, numpy and pandas."""
+import importlib
+import math
+import os
+from abc import ABC, abstractmethod
+from typing import (
+        TYPE_CHECKING,
+        Optional,
+        Final,
+        Callable,
+        ClassVar,
+        Sequence,
+        Iterable,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        AreaT,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        ParamT,
+        _ArgsCounter,
+        _TypeSwitch,
+        )
+from .batch import (
+        FigureBatch,
+        FigureRecords,
+        )
+from .vectorized import (
+        calculate_areas,
+        calculate_figure_areas,
+        )
+
+
+__all__ = (
+        "AreaBackend",
+        "register_backend",
+        "set_backend",
+        "get_backend",
+        "available_backends",
+        "compute_figure_areas",
+        )
+
+
+_BACKEND_ENV: Final[str] = "FIGURES_BACKEND"
+_DEF_BACKEND: Final[str] = "python"
+
+
+class AreaBackend(ABC):
+    """Calculates areas of many figures. Rows which can`t be
+    calculated (impossible dimentions) get NaN. Heavy libs
+    should be imported in __init__, backend object is created
+    when it`s used first time."""
+
+    __slots__ = ()
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def areas(self, ftype: FigureType, /, *columns: Any) -> Any:
+        """areas of one type figures, one column per param."""
+
+    @abstractmethod
+    def figure_areas(self, specs: Iterable[FigureSpec]) -> Any:
+        """areas of specs of any types (order is kept), specs
+        with unknown type or wrong args count get NaN."""
+
+
+class _PythonBackend(AreaBackend):
+    """stdlib only, scalar kernels in loop."""
+
+    __slots__ = ()
+
+    name = "python"
+
+    @staticmethod
+    def _area(kernel: Callable[..., AreaT], args: Sequence[ParamT]) -> AreaT:
+        try:
+            return kernel(*args)
+        except (ImpossibleDimention, ValueError, OverflowError, TypeError):
+            # ValueError is math domain error for impossible triangle,
+            # TypeError - args which aren`t numbers
+            return math.nan
+
+    def areas(self, ftype: FigureType, /, *columns: Iterable[ParamT]) -> list[AreaT]:
+        kernel = _TypeSwitch.find_fig_type(ftype)
+        if kernel is None or _ArgsCounter.is_variadic(ftype):
+            raise FigureTypeError(f"No columns for type <{ftype}> specified.")
+        cnt = _ArgsCounter.get_args_count(ftype)
+        if len(columns) != cnt:
+            raise FigureSpecError(
+                    f"Arrays count not mathed. Got: {len(columns)}, need: {cnt}"
+                    )
+        return [self._area(kernel, row) for row in zip(*columns, strict=True)]
+
+    def figure_areas(self, specs: Iterable[FigureSpec]) -> list[AreaT]:
+        out = []
+        for spec in specs:
+            kernel = _TypeSwitch.find_fig_type(spec.ftype)
+            if kernel is None or not _ArgsCounter.args_count_matched(spec.ftype, spec.args):
+                out.append(math.nan)
+            else:
+                out.append(self._area(kernel, spec.args))
+        return out
+
+
+class _NumpyBackend(AreaBackend):
+    """vector kernels, returns numpy arrays."""
+
+    __slots__ = ()
+
+    name = "numpy"
+
+    def __init__(self) -> None:
+        importlib.import_module("numpy")
+
+    def areas(self, ftype: FigureType, /, *columns: "npt.ArrayLike") -> AreasT:
+        return calculate_areas(ftype, *columns)
+
+    def figure_areas(self, specs: Iterable[FigureSpec]) -> AreasT:
+        if isinstance(specs, (FigureBatch, FigureRecords, Sequence)):
+            return calculate_figure_areas(specs)
+        return calculate_figure_areas(list(specs))
+
+
+class _PandasBackend(_NumpyBackend):
+    """vector kernels, returns pandas Series
+    (index of first Series column is kept)."""
+
+    __slots__ = ("_pd", )
+
+    name = "pandas"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pd = importlib.import_module("pandas")
+
+    def areas(self, ftype: FigureType, /, *columns: Any) -> Any:
+        index = next((c.index for c in columns if isinstance(c, self._pd.Series)), None)
+        return self._pd.Series(super().areas(ftype, *columns), index=index, name="area")
+
+    def figure_areas(self, specs: Iterable[FigureSpec]) -> Any:
+        return self._pd.Series(super().figure_areas(specs), name="area")
+
+
+_backend_factories: dict[str, Callable[[], AreaBackend]] = {
+        _PythonBackend.name: _PythonBackend,
+        _NumpyBackend.name: _NumpyBackend,
+        _PandasBackend.name: _PandasBackend,
+        }
+_backends: dict[str, AreaBackend] = {}
+_backend_name: Optional[str] = None
+
+
+def register_backend(name: str, factory: Callable[[], AreaBackend]) -> None:
+    """add (or replace) backend, factory is called on first use."""
+    _backend_factories[name] = factory
+    _backends.pop(name, None)
+
+
+def available_backends() -> tuple[str, ...]:
+    """names of registered backends (not imported yet too)."""
+    return tuple(_backend_factories)
+
+
+def set_backend(name: Optional[str]) -> None:
+    """choose default backend, None means FIGURES_BACKEND
+    env variable or <python>."""
+    global _backend_name
+    if name is not None and name not in _backend_factories:
+        raise ValueError(f"No backend <{name}> registered.")
+    _backend_name = name
+
+
+def get_backend(name: Optional[str] = None) -> AreaBackend:
+    """get backend by name or default one, backend
+    (and its heavy imports) is created on first call."""
+    name = name or _backend_name or os.environ.get(_BACKEND_ENV) or _DEF_BACKEND
+    if (backend := _backends.get(name)) is not None:
+        return backend
+    factory = _backend_factories.get(name)
+    if factory is None:
+        raise ValueError(f"No backend <{name}> registered.")
+    backend = _backends[name] = factory()
+    return backend
+
+
+def compute_figure_areas(specs: Iterable[FigureSpec], *, backend: Optional[str] = None) -> Any:
+    """areas of specs by chosen (or default) backend, list
+    for <python>, numpy array for <numpy>, Series for <pandas>.
+    Bad specs get NaN."""
+    return get_backend(backend).figure_areas(specs)
@@ -0,0 +1,420 @@
+"""Columnar containers of many figures: FigureBatch and FigureRecords."""
+import math
+from array import array
+from itertools import chain
+from typing import (
+        TYPE_CHECKING,
+        cast,
+        Optional,
+        Union,
+        Final,
+        Mapping,
+        ClassVar,
+        Iterable,
+        Iterator,
+        overload,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ParamT,
+        _ArgsCounter,
+        _TypeMapper,
+        )
+
+
+__all__ = (
+        "FigureBatch",
+        "FigureRecords",
+        )
+
+
+# binary records are fixed width <code: u1, pad: 7 bytes, params: 3 x f8>
+_BIN_PARAMS: Final[int] = 3
+
+
+class _TypeCoder(_TypeMapper):
+    """get compact integer code by FigureType and back."""
+
+    _types: ClassVar[tuple[FigureType, ...]] = (
+            FigureType.CIRCLE,
+            FigureType.RECTANGLE,
+            FigureType.SQUARE,
+            FigureType.TRIANGLE,
+            FigureType.POLYGON,
+            )
+    _codes_map: ClassVar[Mapping[FigureType, int]] = {
+            ftype: code for code, ftype in enumerate(_types)
+            }
+
+    @classmethod
+    def get_code(cls, ftype: FigureType) -> int:
+        return cls._codes_map[ftype]
+
+    @classmethod
+    def get_type(cls, code: int) -> FigureType:
+        return cls._types[code]
+
+    @classmethod
+    def types(cls) -> tuple[FigureType, ...]:
+        return cls._types
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        """check that type is specified."""
+        return ftype in cls._codes_map
+
+
+class FigureBatch:
+    """Columnar container for many figure specs.
+    Keeps one type code (byte) per figure and one contiguous
+    float64 params array per FigureType, params of one type
+    are stored in rows order. So memory per figure is close
+    to raw params size and there are no objects for GC.
+    Rows of variable arity types (polygons) are found by
+    ends of their params."""
+
+    __slots__ = ("_codes", "_params", "_ends")
+
+    def __init__(self, specs: Iterable[FigureSpec] = ()) -> None:
+        self._codes: "array[int]" = array("B")
+        self._params: dict[FigureType, "array[float]"] = {
+                ftype: array("d") for ftype in _TypeCoder.types()
+                }
+        # params ends of rows for variable arity types
+        self._ends: dict[FigureType, "array[int]"] = {
+                ftype: array("q")
+                for ftype in _TypeCoder.types() if _ArgsCounter.is_variadic(ftype)
+                }
+        self.extend(specs)
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[FigureSpec]) -> "FigureBatch":
+        return cls(specs)
+
+    @classmethod
+    def _from_columns(
+            cls,
+            codes: "npt.NDArray[np.uint8]",
+            params: Mapping[FigureType, AreasT],
+            ends: Mapping[FigureType, "npt.NDArray[np.int64]"],
+            ) -> "FigureBatch":
+        """batch from numpy columns (they are copied): type codes,
+        params of every type in rows order (flat for variable arity
+        types) and ends of variable arity rows params, missing types
+        have no figures. Raises ValueError if columns don`t agree."""
+        import numpy as np
+        types = _TypeCoder.types()
+        counts = np.bincount(codes, minlength=len(types)).tolist()
+        if len(counts) > len(types):
+            raise ValueError(f"Unknown type codes, max code: {len(counts) - 1}")
+        batch = cls()
+        for ftype in types:
+            vals = np.asarray(params.get(ftype, ()), dtype=np.float64)
+            cnt = counts[_TypeCoder.get_code(ftype)]
+            if ftype in batch._ends:
+                type_ends = np.asarray(ends.get(ftype, ()), dtype=np.int64)
+                consistent = (
+                        len(type_ends) == cnt
+                        and (type_ends[-1] if cnt else 0) == vals.size
+                        and bool((np.diff(type_ends, prepend=0) >= 0).all())
+                        )
+                batch._ends[ftype] = array("q", type_ends.tobytes())
+            else:
+                if ftype in ends:
+                    raise FigureTypeError(f"Type <{ftype}> has fixed args count.")
+                consistent = vals.size == cnt * _ArgsCounter.get_args_count(ftype)
+            if not consistent:
+                raise ValueError(f"Columns of type <{ftype}> don`t agree with type codes.")
+            batch._params[ftype] = array("d", vals.tobytes())
+        batch._codes = array("B", np.asarray(codes, dtype=np.uint8).tobytes())
+        return batch
+
+    @staticmethod
+    def type_code(ftype: FigureType) -> int:
+        """get code which is used for ftype inside type_codes()."""
+        if _TypeCoder.fig_type_contains(ftype):
+            return _TypeCoder.get_code(ftype)
+        raise FigureTypeError(f"No type <{ftype}> specified.")
+
+    def append_figure(self, ftype: FigureType, /, *args: ParamT) -> None:
+        """add figure without FigureSpec object creation,
+        args are checked as in build_figure_spec()."""
+        if not _TypeCoder.fig_type_contains(ftype):
+            raise FigureTypeError(f"No type <{ftype}> specified.")
+        if not _ArgsCounter.args_count_matched(ftype, args):
+            cnt = _ArgsCounter.expected_args(ftype)
+            raise FigureSpecError(
+                    f"Args count in {args} not mathed. "
+                    f"Got: {len(args)}, need: {cnt}"
+                    )
+        try:
+            # args are converted first, so failed append
+            # doesn`t leave part of them in params
+            vals = array("d", args)
+        except (TypeError, OverflowError) as err:
+            raise FigureSpecError(f"Invalid args {args} for <{ftype}>.") from err
+        # buffers can`t be resized while numpy view of them is alive
+        # (BufferError), appended part is rolled back in this case
+        params, start = self._params[ftype], len(self._params[ftype])
+        self._codes.append(_TypeCoder.get_code(ftype))
+        try:
+            params.extend(vals)
+            if ftype in self._ends:
+                self._ends[ftype].append(len(params))
+        except BufferError:
+            self._codes.pop()
+            if len(params) > start:
+                del params[start:]
+            raise
+
+    def append(self, spec: FigureSpec) -> None:
+        self.append_figure(spec.ftype, *spec.args)
+
+    def extend(self, specs: Iterable[FigureSpec]) -> None:
+        if isinstance(specs, FigureBatch):
+            for ftype, ends in specs._ends.items():
+                base = len(self._params[ftype])
+                # ends are shifted into new array first, specs
+                # may be self and its ends grow by this extend
+                self._ends[ftype].extend(array("q", (end + base for end in ends)))
+            self._codes.extend(specs._codes)
+            for ftype, params in specs._params.items():
+                self._params[ftype].extend(params)
+            return
+        for spec in specs:
+            self.append_figure(spec.ftype, *spec.args)
+
+    def to_specs(self) -> list[FigureSpec]:
+        return list(self)
+
+    def count(self, ftype: FigureType) -> int:
+        """get count of figures with ftype."""
+        if ftype in self._ends:
+            return len(self._ends[ftype])
+        return len(self._params[ftype]) // _ArgsCounter.get_args_count(ftype)
+
+    @property
+    def nbytes(self) -> int:
+        """memory used by codes, params and ends buffers."""
+        bufs: list[Union["array[float]", "array[int]"]] = [
+                self._codes, *self._params.values(), *self._ends.values(),
+                ]
+        return sum(buf.itemsize * len(buf) for buf in bufs)
+
+    def type_codes(self) -> "npt.NDArray[np.uint8]":
+        """numpy view of type codes (no copy), see type_code().
+        Batch can`t be resized while view is alive."""
+        import numpy as np
+        return np.frombuffer(self._codes, dtype=np.uint8)
+
+    def params(self, ftype: FigureType) -> AreasT:
+        """numpy view (no copy) of params with shape (count, args count),
+        flat params of all figures for variable arity types (see offsets()).
+        Batch can`t be resized while view is alive."""
+        import numpy as np
+        params = np.frombuffer(self._params[ftype], dtype=np.float64)
+        if ftype in self._ends:
+            return params
+        return params.reshape(-1, _ArgsCounter.get_args_count(ftype))
+
+    def offsets(self, ftype: FigureType) -> "npt.NDArray[np.int64]":
+        """offsets for variable arity type (count + 1 items),
+        figure i takes params(ftype)[offsets[i]:offsets[i + 1]]."""
+        import numpy as np
+        if ftype not in self._ends:
+            raise FigureTypeError(f"Type <{ftype}> has fixed args count.")
+        offsets = np.zeros(len(self._ends[ftype]) + 1, dtype=np.int64)
+        offsets[1:] = np.frombuffer(self._ends[ftype], dtype=np.int64)
+        return offsets
+
+    def _bound(self, ftype: FigureType, row: int) -> int:
+        """start of row params of ftype (end of previous row)."""
+        if ftype in self._ends:
+            return self._ends[ftype][row - 1] if row else 0
+        return row * _ArgsCounter.get_args_count(ftype)
+
+    def _row(self, ftype: FigureType, row: int) -> FigureSpec:
+        start, stop = self._bound(ftype, row), self._bound(ftype, row + 1)
+        return FigureSpec(ftype, tuple(self._params[ftype][start:stop]))
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator[FigureSpec]:
+        rows = dict.fromkeys(self._params, 0)
+        for code in self._codes:
+            ftype = _TypeCoder.get_type(code)
+            row = rows[ftype]
+            rows[ftype] = row + 1
+            yield self._row(ftype, row)
+
+    @overload
+    def __getitem__(self, idx: int) -> FigureSpec: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> "FigureBatch": ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[FigureSpec, "FigureBatch"]:
+        if isinstance(idx, slice):
+            return self._slice(idx)
+        code = self._codes[idx]
+        if idx < 0:
+            idx += len(self._codes)
+        import numpy as np
+        row = np.count_nonzero(np.frombuffer(self._codes, dtype=np.uint8)[:idx] == code)
+        return self._row(_TypeCoder.get_type(code), int(row))
+
+    def _first_rows(self, start: int) -> dict[FigureType, int]:
+        """rows count of every type before start row
+        (one counting pass over codes, no copy)."""
+        import numpy as np
+        found = np.bincount(
+                np.frombuffer(self._codes, dtype=np.uint8)[:start],
+                minlength=len(_TypeCoder.types()),
+                )
+        return {ftype: int(found[_TypeCoder.get_code(ftype)]) for ftype in self._params}
+
+    def _slice(self, idx: slice) -> "FigureBatch":
+        start, stop, step = idx.indices(len(self._codes))
+        if step != 1:
+            return FigureBatch(self.to_specs()[idx])
+        return self._rows_slice(start, max(start, stop), self._first_rows(start))
+
+    def _rows_slice(
+            self,
+            start: int,
+            stop: int,
+            first_rows: Mapping[FigureType, int],
+            ) -> "FigureBatch":
+        """rows [start, stop), first_rows are rows of every type before start."""
+        sliced = FigureBatch()
+        codes = self._codes[start:stop]
+        sliced._codes = codes
+        for ftype, params in self._params.items():
+            first_row = first_rows[ftype]
+            last_row = first_row + codes.count(_TypeCoder.get_code(ftype))
+            first = self._bound(ftype, first_row)
+            sliced._params[ftype] = params[first:self._bound(ftype, last_row)]
+            if ftype in self._ends:
+                sliced._ends[ftype] = array(
+                        "q", (end - first for end in self._ends[ftype][first_row:last_row]),
+                        )
+        return sliced
+
+    def chunks(self, size: int) -> Iterator["FigureBatch"]:
+        """consecutive batches of size rows (last one can be shorter).
+        Rows of every type are counted while walking forward,
+        so all chunks take one pass over batch."""
+        if size < 1:
+            raise ValueError(f"size should be bigger as zero, got: {size}")
+        first_rows = dict.fromkeys(self._params, 0)
+        for start in range(0, len(self._codes), size):
+            chunk = self._rows_slice(start, min(start + size, len(self._codes)), first_rows)
+            for ftype in first_rows:
+                first_rows[ftype] += chunk.count(ftype)
+            yield chunk
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FigureBatch):
+            return NotImplemented
+        return (
+                self._codes == other._codes
+                and self._params == other._params
+                and self._ends == other._ends
+                )
+
+
+def _records_dtype() -> "np.dtype[Any]":
+    import numpy as np
+    return np.dtype(
+            [
+                ("code", "u1"),
+                ("pad", "V7"),
+                ("params", "<f8", (_BIN_PARAMS, )),
+                ]
+            )
+
+
+def _group_params(
+        ftype: FigureType,
+        group: list[Any],
+        ) -> tuple[AreasT, Optional[list[int]]]:
+    """float params of group rows (one row of params per figure,
+    flat params for variable arity types) and positions of rows
+    which args aren`t numbers (None if all rows are fine).
+    Args are converted by array("d") like append_figure()
+    does, so strings aren`t parsed as numbers. Per row conversion
+    is used only if group conversion fails."""
+    import numpy as np
+    variadic = _ArgsCounter.is_variadic(ftype)
+    try:
+        flat = np.frombuffer(array("d", chain.from_iterable(group)), dtype=np.float64)
+        return (flat if variadic else flat.reshape(len(group), -1)), None
+    except (TypeError, OverflowError):
+        pass
+    bad: list[int] = []
+    rows: list["array[float]"] = []
+    for pos, args in enumerate(group):
+        try:
+            rows.append(array("d", args))
+        except (TypeError, OverflowError):
+            bad.append(pos)
+            rows.append(array("d", [math.nan]) * len(args))
+    flat = np.frombuffer(array("d", chain.from_iterable(rows)), dtype=np.float64)
+    return (flat if variadic else flat.reshape(len(group), -1)), bad
+
+
+class FigureRecords:
+    """Fixed width binary figure records (see write_figures_binary()),
+    usually memory mapped from file, so pages are read only when
+    they are touched. codes and params are numpy views (no copy),
+    unused params are NaN."""
+
+    __slots__ = ("_records", )
+
+    def __init__(self, records: "npt.NDArray[Any]") -> None:
+        self._records = records
+
+    @property
+    def codes(self) -> "npt.NDArray[np.uint8]":
+        """type codes, see FigureBatch.type_code()."""
+        return cast("npt.NDArray[np.uint8]", self._records["code"])
+
+    @property
+    def params(self) -> AreasT:
+        """params with shape (count, 3)."""
+        return cast(AreasT, self._records["params"])
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(size={len(self)})"
+
+    @overload
+    def __getitem__(self, idx: int) -> FigureSpec: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> "FigureRecords": ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[FigureSpec, "FigureRecords"]:
+        if isinstance(idx, slice):
+            return FigureRecords(self._records[idx])
+        rec = self._records[idx]
+        ftype = _TypeCoder.get_type(int(rec["code"]))
+        cnt = _ArgsCounter.get_args_count(ftype)
+        return FigureSpec(ftype, tuple(rec["params"][:cnt].tolist()))
+
+    def __iter__(self) -> Iterator[FigureSpec]:
+        for idx in range(len(self)):
+            yield self[idx]
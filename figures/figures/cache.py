@@ -0,0 +1,293 @@
+"""Area cache of calculate_*_area(), calculate_figure_area()
+and is_triangle_right(), see enable_area_cache().
+"""
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+        TYPE_CHECKING,
+        cast,
+        Optional,
+        Final,
+        Callable,
+        TypeVar,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
+
+from .core import _CACHE_SIZE
+
+
+__all__ = (
+        "FigureAreaCache",
+        "CacheStats",
+        )
+
+
+_CACHE_POLICIES: Final[frozenset[str]] = frozenset(("lru", "fifo"))
+# marks missing cache entry (None can be cached value)
+_MISSING: Final[object] = object()
+
+_T = TypeVar("_T")
+
+
+class _Carried(Exception):
+    """miss of carried lru cache, value isn`t calculated by it."""
+
+
+class _Probing(threading.local):
+    """set while carried lru cache is probed by this thread."""
+    on = False
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class FigureAreaCache:
+    """Thread-safe size bounded cache for calculated values.
+    Key is (calc, args): every kernel serves one figure type,
+    so for areas it`s the same as (FigureType, args), for right
+    triangle checks tolerance is one of args.
+    Policy <lru> evicts least recently used entry, it`s
+    functools.lru_cache, so hits are served in C.
+    Policy <fifo> evicts the oldest one, hits are lock-free dict
+    reads counted per thread. Lock is taken by misses only.
+    Unhashable args can`t be cached, lookup() raises TypeError
+    for them (callers calculate such values without cache)."""
+
+    __slots__ = (
+            "lookup",
+            "_lru",
+            "_probing",
+            "_carried",
+            "_carried_hits",
+            "_carried_size",
+            "_moved",
+            "_maxsize",
+            "_policy",
+            "_data",
+            "_lock",
+            "_hits",
+            "_misses",
+            "_stored",
+            "_evictions",
+            )
+
+    lookup: Callable[..., Any]
+
+    def __init__(self, maxsize: int = _CACHE_SIZE, policy: str = "lru") -> None:
+        if policy not in _CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy <{policy}>, use <lru> or <fifo>.")
+        self._policy = policy
+        self._maxsize = self._checked_size(maxsize)
+        self._data: dict[tuple[Callable[..., Any], tuple[Any, ...]], Any] = {}
+        self._lock = threading.Lock()
+        # fifo hits by thread id, lru counters are in
+        # lookup.cache_info(), here are ones of dropped lru caches
+        self._hits: dict[int, int] = {}
+        self._misses = 0
+        self._stored = 0
+        self._evictions = 0
+        self._lru: Optional[_lru_cache_wrapper[Any]] = None
+        # lru_cache size is fixed, resize() builds new one and old one
+        # is carried: it serves misses of new cache (entries move to
+        # new one) until new cache is full, but doesn`t calculate
+        # while it`s probed
+        self._probing = _Probing()
+        self._carried: Optional[_lru_cache_wrapper[Any]] = None
+        self._carried_hits = 0
+        self._carried_size = 0
+        # entries moved from carried cache (they are hits)
+        self._moved = 0
+        self.lookup = self._new_lookup()
+
+    @staticmethod
+    def _checked_size(maxsize: int) -> int:
+        if maxsize < 1:
+            raise ValueError(f"maxsize should be bigger as zero, got: {maxsize}")
+        return maxsize
+
+    def __repr__(self) -> str:
+        return (
+            f"class {type(self).__name__}(maxsize={self._maxsize}, "
+            f"policy={self._policy})"
+            )
+
+    def __len__(self) -> int:
+        return self.stats().size
+
+    def _new_lookup(self) -> Callable[..., Any]:
+        """lookup(calc, *args) get cached value or calculate
+        it by calc(*args) and store. Errors aren`t cached."""
+        if self._policy == "lru":
+            self._lru = lru_cache(maxsize=self._maxsize)(self._calc)
+            return self._lru
+        return self._fifo_lookup
+
+    def _calc(self, calc: Callable[..., _T], *args: Any) -> _T:
+        """lru miss, value is taken from carried cache if it`s there,
+        stored entries are counted for evictions."""
+        carried = self._carried
+        if carried is not None:
+            probing = self._probing
+            if probing.on:
+                # miss of carried cache
+                raise _Carried
+            probing.on = True
+            try:
+                return cast(_T, carried(calc, *args))
+            except _Carried:
+                pass
+            finally:
+                probing.on = False
+        value = calc(*args)
+        with self._lock:
+            self._stored += 1
+            lru = self._lru
+            if (
+                    self._carried is not None and lru is not None
+                    and lru.cache_info().currsize + self._carried_left() >= self._maxsize
+                    ):
+                # cache is full, entries which aren`t moved
+                # yet are least recently used ones
+                self._drop_carried(evicted=True)
+        return value
+
+    def _fifo_lookup(self, calc: Callable[..., _T], *args: Any) -> _T:
+        key = (calc, args)
+        data = self._data
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            # only this thread writes its cell
+            hits, ident = self._hits, threading.get_ident()
+            hits[ident] = hits.get(ident, 0) + 1
+            return cast(_T, value)
+        try:
+            value = calc(*args)
+        except BaseException:
+            with self._lock:
+                self._misses += 1
+            raise
+        with self._lock:
+            self._misses += 1
+            if key not in data:
+                data[key] = value
+                self._evict()
+        return cast(_T, value)
+
+    def _evict(self) -> None:
+        """fifo only, lock should be held."""
+        data = self._data
+        while len(data) > self._maxsize:
+            del data[next(iter(data))]
+            self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """lru evictions are stored entries which aren`t in cache,
+        a key calculated by two threads at once is counted twice."""
+        with self._lock:
+            hits = sum(list(self._hits.values()))
+            if self._lru is not None:
+                info = self._lru.cache_info()
+                moved = self._moved_count()
+                return CacheStats(
+                        hits=hits + info.hits + moved,
+                        misses=self._misses + info.misses - moved,
+                        evictions=self._evictions + self._stored + moved - info.currsize,
+                        size=info.currsize + self._carried_left(),
+                        maxsize=self._maxsize,
+                        )
+            return CacheStats(
+                    hits=hits,
+                    misses=self._misses,
+                    evictions=self._evictions,
+                    size=len(self._data),
+                    maxsize=self._maxsize,
+                    )
+
+    def _moved_count(self) -> int:
+        """entries moved from carried cache to current one,
+        lock should be held."""
+        if self._carried is None:
+            return self._moved
+        return self._moved + self._carried.cache_info().hits - self._carried_hits
+
+    def _carried_left(self) -> int:
+        """entries of carried cache which aren`t moved,
+        lock should be held."""
+        if self._carried is None:
+            return 0
+        return max(self._carried_size - self._moved_count() + self._moved, 0)
+
+    def _drop_carried(self, *, evicted: bool) -> None:
+        """drop entries of carried cache which aren`t moved,
+        lock should be held."""
+        carried = self._carried
+        if carried is None:
+            return
+        if evicted:
+            self._evictions += self._carried_left()
+        self._moved = self._moved_count()
+        self._carried = None
+        carried.cache_clear()
+
+    def _fold_lru(self, lru: "_lru_cache_wrapper[Any]") -> None:
+        """move lru counters to own ones, lock should be held."""
+        info = lru.cache_info()
+        self._hits[0] = self._hits.get(0, 0) + info.hits + self._moved
+        self._misses += info.misses - self._moved
+        self._evictions += self._stored + self._moved - info.currsize
+        self._stored = self._moved = 0
+
+    def _drop_lru(self, lru: "_lru_cache_wrapper[Any]", *, evicted: bool) -> None:
+        """move lru counters to own ones and drop lru entries,
+        lock should be held."""
+        self._drop_carried(evicted=evicted)
+        if evicted:
+            self._evictions += lru.cache_info().currsize
+        self._fold_lru(lru)
+        lru.cache_clear()
+
+    def clear(self, *, stats: bool = True) -> None:
+        """drop all entries (and counters if stats is set)."""
+        with self._lock:
+            if self._lru is not None:
+                self._drop_lru(self._lru, evicted=False)
+            self._data.clear()
+            if stats:
+                self._hits.clear()
+                self._misses = self._evictions = 0
+
+    def resize(self, maxsize: int) -> None:
+        """set new maxsize, extra entries are evicted.
+        lru_cache size is fixed, so <lru> cache is built again.
+        When it grows, entries of old one move to new one when
+        they are used, ones which aren`t used before cache is full
+        are evicted. When it shrinks, all entries are evicted."""
+        with self._lock:
+            maxsize = self._checked_size(maxsize)
+            grows = maxsize >= self._maxsize
+            self._maxsize = maxsize
+            lru = self._lru
+            if lru is None:
+                self._evict()
+                return
+            if not grows:
+                self._drop_lru(lru, evicted=True)
+                self.lookup = self._new_lookup()
+                return
+            self._drop_carried(evicted=True)
+            info = lru.cache_info()
+            self._fold_lru(lru)
+            self._carried = lru
+            self._carried_hits = info.hits
+            self._carried_size = info.currsize
+            self.lookup = self._new_lookup()
@@ -0,0 +1,188 @@
+"""Mutable collection of figure objects with running area totals."""
+from itertools import islice
+from typing import (
+        Optional,
+        Mapping,
+        ClassVar,
+        Iterable,
+        Iterator,
+        )
+
+from .core import (
+        AreaT,
+        Base2DFigure,
+        Circle,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        Polygon,
+        Rectangle,
+        Square,
+        Triangle,
+        _TypeMapper,
+        )
+from .aggregation import (
+        _exact_scaled,
+        _scaled_div,
+        )
+
+
+__all__ = (
+        "FigureCollection",
+        )
+
+
+class _FigureClassSwitch(_TypeMapper):
+    """get FigureType by figure class (or its base class)."""
+
+    _cmap: ClassVar[Mapping[type, FigureType]] = {
+            Circle: FigureType.CIRCLE,
+            Rectangle: FigureType.RECTANGLE,
+            Square: FigureType.SQUARE,
+            Triangle: FigureType.TRIANGLE,
+            Polygon: FigureType.POLYGON,
+            }
+
+    @classmethod
+    def find_fig_type(cls, fig_cls: type) -> Optional[FigureType]:
+        for base in fig_cls.__mro__:
+            if (ftype := cls._cmap.get(base)) is not None:
+                return ftype
+        return None
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        return ftype in cls._cmap.values()
+
+
+class FigureCollection:
+    """Figures with lazily cached areas and running totals
+    by FigureType. Area of every figure is calculated once, when
+    it`s needed first time, so add()/remove()/replace() are O(1)
+    and total_area() after small edits calculates only new figures.
+    Totals are exact (scaled ints), removals don`t accumulate
+    rounding errors."""
+
+    __slots__ = ("_figures", "_types", "_areas", "_pending", "_exact", "_counts", "_next_id")
+
+    def __init__(self, figures: Iterable[Base2DFigure] = ()) -> None:
+        self._figures: dict[int, Base2DFigure] = {}
+        self._types: dict[int, FigureType] = {}
+        self._areas: dict[int, AreaT] = {}
+        # ids without calculated area (dict is ordered set)
+        self._pending: dict[int, None] = {}
+        self._exact: dict[FigureType, int] = {}
+        self._counts: dict[FigureType, int] = {}
+        self._next_id = 0
+        for figure in figures:
+            self.add(figure)
+
+    @staticmethod
+    def _fig_type(figure: Base2DFigure) -> FigureType:
+        ftype = _FigureClassSwitch.find_fig_type(type(figure))
+        if ftype is None:
+            raise FigureTypeError(f"No type for <{type(figure).__name__}> specified.")
+        return ftype
+
+    def add(self, figure: Base2DFigure) -> int:
+        """add figure and return its id, area isn`t calculated."""
+        ftype = self._fig_type(figure)
+        fid = self._next_id
+        self._next_id += 1
+        self._put(fid, figure, ftype)
+        return fid
+
+    def _put(self, fid: int, figure: Base2DFigure, ftype: FigureType) -> None:
+        self._figures[fid] = figure
+        self._types[fid] = ftype
+        self._pending[fid] = None
+        self._counts[ftype] = self._counts.get(ftype, 0) + 1
+
+    def remove(self, fid: int) -> Base2DFigure:
+        """remove figure by id and return it."""
+        figure = self._figures.pop(fid)
+        ftype = self._types.pop(fid)
+        self._counts[ftype] -= 1
+        if fid in self._pending:
+            del self._pending[fid]
+        else:
+            self._exact[ftype] -= _exact_scaled(self._areas.pop(fid))
+        return figure
+
+    def replace(self, fid: int, figure: Base2DFigure) -> Base2DFigure:
+        """put figure instead of figure with fid (id is kept),
+        return old one."""
+        ftype = self._fig_type(figure)
+        old = self.remove(fid)
+        self._put(fid, figure, ftype)
+        return old
+
+    def _settle(self, fid: int) -> AreaT:
+        """calculate area of pending figure, nothing is stored if it
+        fails, error of same type names the figure id then."""
+        try:
+            area = self._figures[fid].area()
+            exact = _exact_scaled(area)
+        except (ImpossibleDimention, ValueError, OverflowError) as err:
+            raise type(err)(f"Area of figure {fid} can`t be calculated: {err}") from err
+        self._areas[fid] = area
+        ftype = self._types[fid]
+        self._exact[ftype] = self._exact.get(ftype, 0) + exact
+        return area
+
+    def _settle_pending(self) -> None:
+        if not self._pending:
+            return
+        # new dict, because emptied dict is still iterated
+        # over all its old slots
+        pending, self._pending = self._pending, {}
+        for num, fid in enumerate(pending):
+            try:
+                self._settle(fid)
+            except Exception:
+                self._pending.update(islice(pending.items(), num, None))
+                raise
+
+    def area(self, fid: int) -> AreaT:
+        """cached area of figure."""
+        if fid in self._pending:
+            area = self._settle(fid)
+            del self._pending[fid]
+            return area
+        return self._areas[fid]
+
+    def total_area(self, ftype: Optional[FigureType] = None) -> AreaT:
+        """correctly rounded sum of areas (of one type if set),
+        only figures added since last call are calculated."""
+        self._settle_pending()
+        if ftype is None:
+            return _scaled_div(sum(self._exact.values()), 1)
+        return _scaled_div(self._exact.get(ftype, 0), 1)
+
+    def count(self, ftype: Optional[FigureType] = None) -> int:
+        if ftype is None:
+            return len(self._figures)
+        return self._counts.get(ftype, 0)
+
+    def totals(self) -> dict[FigureType, AreaT]:
+        """total area by every type which has figures."""
+        self._settle_pending()
+        return {
+                ftype: _scaled_div(self._exact.get(ftype, 0), 1)
+                for ftype, cnt in self._counts.items() if cnt
+                }
+
+    def __getitem__(self, fid: int) -> Base2DFigure:
+        return self._figures[fid]
+
+    def __contains__(self, fid: object) -> bool:
+        return fid in self._figures
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._figures)
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(size={len(self)})"
@@ -0,0 +1,785 @@
+"""Figures, area kernels and scalar calculate_*_area() functions.
+
+Optional features live in submodules and are imported on first
+use (see figures.__getattr__()), so import of figures stays cheap.
+"""
+import math
+from enum import Enum
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import (
+        TYPE_CHECKING,
+        TypeAlias,
+        cast,
+        Optional,
+        Union,
+        Final,
+        Mapping,
+        Callable,
+        ClassVar,
+        Sequence,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from .cache import FigureAreaCache
+    from .metrics import FigureMetrics, MetricsSnapshot
+
+
+__all__ = (
+        "Base2DFigure",
+        "AreaT",
+        "FigureType",
+        "ParamT",
+        "ImpossibleDimention",
+        "FigureSpecError",
+        "FigureTypeError",
+        "calculate_figure_area",
+        "is_triangle_right",
+        "calculate_circle_area",
+        "calculate_square_area",
+        "calculate_triangle_area",
+        "build_figure_spec",
+        "calculate_rectangle_area",
+        "calculate_polygon_area",
+        "AreasT",
+        "MaskT",
+        "enable_area_cache",
+        "disable_area_cache",
+        "get_area_cache",
+        "enable_metrics",
+        "disable_metrics",
+        "get_metrics",
+        )
+
+
+AreaT: TypeAlias = float
+ParamT: TypeAlias = Union[float, Any]
+AreasT: TypeAlias = "npt.NDArray[np.float64]"
+MaskT: TypeAlias = "npt.NDArray[np.bool_]"
+
+_DEF_TOLERANCE: Final[ParamT] = 1e-3
+_IMPOSSIBLE_DIM_MSG: Final[str] = "Dimentions shold be bigger as zero."
+_POW2: Final[int] = 2
+_STREAM_CHUNK: Final[int] = 10_000
+_CACHE_SIZE: Final[int] = 65_536
+# upper edges of latency buckets (nanoseconds), last bucket is open
+_LATENCY_EDGES_NS: Final[tuple[int, ...]] = (
+        250, 500, 1_000, 2_500, 5_000, 10_000, 50_000, 100_000, 1_000_000,
+        )
+
+
+class ImpossibleDimention(Exception):
+    """Raises if one of args <= 0."""
+    pass
+
+
+class FigureSpecError(Exception):
+    """Raises if invalid spec parameter found."""
+    pass
+
+
+class FigureTypeError(Exception):
+    """Raises if unknown figure type found."""
+    pass
+
+
+class FigureType(str, Enum):
+    """It`s possible to use int here
+    but str() is most humanreadable."""
+    SQUARE: str = "square"
+    TRIANGLE: str = "triangle"
+    CIRCLE: str = "circle"
+    RECTANGLE: str = "rectangle"
+    POLYGON: str = "polygon"
+
+
+@dataclass(frozen=True, slots=True, init=False)
+class FigureSpec:
+    """Immutable and hashable, so specs can be shared
+    between caches and used as dict keys."""
+
+    ftype: FigureType
+    args: tuple[ParamT, ...]
+
+    def __init__(self, ftype: FigureType, args: tuple[ParamT, ...]) -> None:
+        # generated frozen __init__ sets fields by object.__setattr__(),
+        # slot descriptors are much cheaper (specs are built on hot path)
+        if not isinstance(args, tuple):
+            raise FigureSpecError("Args have to be inside a tuple.")
+        if not isinstance(ftype, FigureType):
+            raise FigureSpecError(
+                    f"Invalid type {type(ftype)} for <ftype> attr. "
+                    f"Need <FigureType>, choose from them."
+                    )
+        _set_spec_ftype(self, ftype)
+        _set_spec_args(self, args)
+
+
+_set_spec_ftype: Final[Callable[[FigureSpec, FigureType], None]] = (
+        getattr(FigureSpec, "ftype").__set__
+        )
+_set_spec_args: Final[Callable[[FigureSpec, tuple[ParamT, ...]], None]] = (
+        getattr(FigureSpec, "args").__set__
+        )
+
+
+class AbcFigure(ABC):
+
+    __slots__ = ()
+
+    @abstractmethod
+    def area(self) -> AreaT: pass
+
+    @abstractmethod
+    def perimeter(self) -> AreaT: pass
+
+
+class Base2DFigure(AbcFigure):
+    """Base class for 2D figures."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}()"
+
+
+class CircleMixin(ABC):
+    """Mixin to create circles.
+    Define object-attrs initializer."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __init__(self, radius: ParamT) -> None: pass
+
+
+class TriangleMixin(ABC):
+    """Mixin to create traingles.
+    Define object-attrs initializer."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __init__(
+            self,
+            leg_a: ParamT,
+            leg_b: ParamT,
+            hopotenuse: ParamT,
+            ) -> None: pass
+
+    @abstractmethod
+    def is_right_triangle(self, *, rel_tol: Optional[ParamT] = None) -> bool:
+        pass
+
+
+class RectangleMixin(ABC):
+    """Mixin to create rectangles.
+    Define object-attrs initializer."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __init__(self, side_a: ParamT, side_b: ParamT) -> None: pass
+
+
+class SquareMixin(ABC):
+    """Mixin to create squares.
+    Define object-attrs initializer."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __init__(self, side: ParamT) -> None: pass
+
+
+class PolygonMixin(ABC):
+    """Mixin to create polygons.
+    Define object-attrs initializer."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __init__(self, *coords: ParamT) -> None: pass
+
+
+class Circle(CircleMixin, Base2DFigure):
+
+    __slots__ = ("_radius", )
+
+    def __init__(self, radius: ParamT) -> None:
+        self._radius = radius
+        if not _args_bigger_as_zero(self._radius):
+            raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(r={self._radius})"
+
+    def area(self) -> AreaT:
+        """return area of circle."""
+        return cast(AreaT, math.pi * math.pow(self._radius, _POW2))
+
+    def perimeter(self) -> AreaT:
+        """return circumference."""
+        return cast(AreaT, 2 * math.pi * self._radius)
+
+
+class Triangle(TriangleMixin, Base2DFigure):
+
+    __slots__ = ("_leg_a", "_leg_b", "_hpt", "_tol")
+
+    def __init__(
+            self,
+            leg_a: ParamT,
+            leg_b: ParamT,
+            hopotenuse: ParamT,
+            *,
+            rel_tol: Optional[ParamT] = None,
+            ) -> None:
+        self._leg_a = leg_a
+        self._leg_b = leg_b
+        self._hpt = hopotenuse
+        self._tol = rel_tol or _DEF_TOLERANCE
+        if not _args_bigger_as_zero(
+                self._leg_a,
+                self._leg_b,
+                self._hpt,
+                ):
+            raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+
+    def __repr__(self) -> str:
+        return (
+            f"class {type(self).__name__}(leg_a={self._leg_a}, "
+            f"leg_b={self._leg_b}, hopotenuse={self._hpt})"
+            )
+
+    def is_right_triangle(self, *, rel_tol: Optional[ParamT] = None) -> bool:
+        """Check do we have right triangle or not.
+        Possible to set tolerance of comparison (safe)."""
+        tol = rel_tol or self._tol
+        return math.isclose(
+            math.pow(self._hpt, _POW2),
+            math.pow(self._leg_a, _POW2) + math.pow(self._leg_b, _POW2),
+            rel_tol=tol,
+            )
+
+    def area(self) -> AreaT:
+        """Heron`s method (we know all 3 sides), stable form."""
+        return cast(
+                AreaT,
+                math.sqrt(_kahan_radicand(self._leg_a, self._leg_b, self._hpt)) / 4,
+                )
+
+    def perimeter(self) -> AreaT:
+        return cast(AreaT, self._leg_a + self._leg_b + self._hpt)
+
+
+class Rectangle(RectangleMixin, Base2DFigure):
+
+    __slots__ = ("_side_a", "_side_b")
+
+    def __init__(self, side_a: ParamT, side_b: ParamT) -> None:
+        self._side_a = side_a
+        self._side_b = side_b
+        if not _args_bigger_as_zero(
+                self._side_a,
+                self._side_b,
+                ):
+            raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+
+    def __repr__(self) -> str:
+        return (
+            f"class {type(self).__name__}(side_a={self._side_a}, "
+            f"side_b={self._side_b})"
+            )
+
+    def area(self) -> AreaT:
+        return cast(AreaT, self._side_a * self._side_b)
+
+    def perimeter(self) -> AreaT:
+        return cast(AreaT, 2 * (self._side_a + self._side_b))
+
+
+class Square(SquareMixin, Base2DFigure):
+
+    __slots__ = ("_side", )
+
+    def __init__(self, side: ParamT) -> None:
+        self._side = side
+        if not _args_bigger_as_zero(self._side):
+            raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(side={self._side})"
+
+    def area(self) -> AreaT:
+        return cast(AreaT, math.pow(self._side, _POW2))
+
+    def perimeter(self) -> AreaT:
+        return cast(AreaT, 4 * self._side)
+
+
+class Polygon(PolygonMixin, Base2DFigure):
+    """Simple (not self intersecting) polygon,
+    coords are <x0, y0, x1, y1, ...>, 3 vertices at least."""
+
+    __slots__ = ("_coords", )
+
+    def __init__(self, *coords: ParamT) -> None:
+        self._coords = coords
+        if not _ArgsCounter.args_count_matched(FigureType.POLYGON, coords):
+            raise FigureSpecError(
+                    f"Args count in {coords} not mathed. Got: {len(coords)}, "
+                    f"need: {_ArgsCounter.expected_args(FigureType.POLYGON)}"
+                    )
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(vertices={len(self._coords) // 2})"
+
+    def area(self) -> AreaT:
+        """shoelace formula."""
+        return _polygon_area_kernel(*self._coords)
+
+    def perimeter(self) -> AreaT:
+        return _polygon_perimeter(self._coords)
+
+
+def _args_bigger_as_zero(*args) -> bool:
+    """Check that args are bigger as zero."""
+    for a in args:
+        if a <= 0:
+            return False
+    return True
+
+
+def _new_circle(radius: ParamT) -> Circle:
+    """base factory func for circle creation.
+    Prefer using that func creating object directly."""
+    return Circle(radius)
+
+
+def _new_triangle(
+        leg_a: ParamT,
+        leg_b: ParamT,
+        hopotenuse: ParamT,
+        *,
+        rel_tolerance: Optional[ParamT] = None,
+        ) -> Triangle:
+    """base factory func for circle creation.
+    Prefer using that func creating object directly."""
+    return Triangle(leg_a, leg_b, hopotenuse, rel_tol=rel_tolerance)
+
+
+def _new_square(side: ParamT) -> Square:
+    """base factory func for square creation.
+    Prefer using that func creating object directly."""
+    return Square(side)
+
+
+def _new_rectangle(side_a: ParamT, side_b: ParamT) -> Rectangle:
+    """base factory func for rectangle creation.
+    Prefer using that func creating object directly."""
+    return Rectangle(side_a, side_b)
+
+
+def _new_polygon(*coords: ParamT) -> Polygon:
+    """base factory func for polygon creation.
+    Prefer using that func creating object directly."""
+    return Polygon(*coords)
+
+
+def _circle_area_kernel(radius: ParamT) -> AreaT:
+    """Circle(radius).area() without object creation."""
+    if radius <= 0:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    return math.pi * math.pow(radius, _POW2)
+
+
+def _square_area_kernel(side: ParamT) -> AreaT:
+    """Square(side).area() without object creation."""
+    if side <= 0:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    return math.pow(side, _POW2)
+
+
+def _rectangle_area_kernel(side_a: ParamT, side_b: ParamT) -> AreaT:
+    """Rectangle(side_a, side_b).area() without object creation."""
+    if side_a <= 0 or side_b <= 0:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    return side_a * side_b
+
+
+def _triangle_area_kernel(leg_a: ParamT, leg_b: ParamT, hopotenuse: ParamT) -> AreaT:
+    """Triangle(...).area() without object creation."""
+    if leg_a <= 0 or leg_b <= 0 or hopotenuse <= 0:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    # _kahan_radicand() inlined, it`s hot path
+    a, b, c = leg_a, leg_b, hopotenuse
+    if a < b:
+        a, b = b, a
+    if b < c:
+        b, c = c, b
+        if a < b:
+            a, b = b, a
+    return math.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))) / 4
+
+
+def _kahan_radicand(leg_a: ParamT, leg_b: ParamT, hopotenuse: ParamT) -> ParamT:
+    """16 * area ** 2 by Kahan`s form of Heron`s method: sides
+    are sorted (a >= b >= c) and brackets mustn`t be opened.
+    Textbook <p * (p - a) * (p - b) * (p - c)> loses most of digits
+    for needle-like triangles (p - a is a difference of close
+    numbers), this form keeps relative error of few ulps.
+    Negative for impossible triangles."""
+    a, b, c = leg_a, leg_b, hopotenuse
+    if a < b:
+        a, b = b, a
+    if b < c:
+        b, c = c, b
+        if a < b:
+            a, b = b, a
+    return (a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))
+
+
+def _polygon_area_kernel(*coords: ParamT) -> AreaT:
+    """shoelace formula, coords are <x0, y0, x1, y1, ...>.
+    Vertices are shifted by the first one (less cancellation
+    far from origin), terms order is the same as in
+    calculate_polygon_areas(), so results are equal."""
+    if len(coords) < 6 or len(coords) % 2:
+        raise FigureSpecError(
+                f"Args count in {coords} not mathed. Got: {len(coords)}, "
+                f"need: {_ArgsCounter.expected_args(FigureType.POLYGON)}"
+                )
+    x0, y0 = coords[0], coords[1]
+    xs = [x - x0 for x in coords[0::2]]
+    ys = [y - y0 for y in coords[1::2]]
+    twice = 0.0
+    for i in range(len(xs) - 1):
+        twice += xs[i] * ys[i + 1] - xs[i + 1] * ys[i]
+    twice += xs[-1] * ys[0] - xs[0] * ys[-1]
+    area = abs(twice) / 2
+    if not math.isfinite(area):
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    return area
+
+
+def _polygon_perimeter(coords: Sequence[ParamT]) -> AreaT:
+    """sum of edges lengths, edges are added in vertices
+    order (as in vectorized kernel)."""
+    xs, ys = coords[0::2], coords[1::2]
+    total = 0.0
+    for i in range(len(xs)):
+        j = i + 1 if i + 1 < len(xs) else 0
+        total += math.hypot(xs[j] - xs[i], ys[j] - ys[i])
+    return total
+
+
+def _triangle_right_kernel(
+        leg_a: ParamT,
+        leg_b: ParamT,
+        hopotenuse: ParamT,
+        rel_tol: Optional[ParamT],
+        ) -> bool:
+    """Triangle(...).is_right_triangle() without object creation."""
+    if leg_a <= 0 or leg_b <= 0 or hopotenuse <= 0:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    return math.isclose(
+        math.pow(hopotenuse, _POW2),
+        math.pow(leg_a, _POW2) + math.pow(leg_b, _POW2),
+        rel_tol=rel_tol or _DEF_TOLERANCE,
+        )
+
+
+_area_cache: Optional["FigureAreaCache"] = None
+
+
+def enable_area_cache(
+        maxsize: int = _CACHE_SIZE,
+        policy: str = "lru",
+        ) -> "FigureAreaCache":
+    """turn on cache for calculate_*_area(), calculate_figure_area()
+    and is_triangle_right(). Cache is off by default."""
+    from .cache import FigureAreaCache
+    global _area_cache
+    _area_cache = FigureAreaCache(maxsize, policy)
+    return _area_cache
+
+
+def disable_area_cache() -> None:
+    global _area_cache
+    _area_cache = None
+
+
+def get_area_cache() -> Optional["FigureAreaCache"]:
+    return _area_cache
+
+
+_metrics: Optional["FigureMetrics"] = None
+
+
+def enable_metrics(
+        exporter: Optional[Callable[["MetricsSnapshot"], None]] = None,
+        latency_edges_ns: Sequence[int] = _LATENCY_EDGES_NS,
+        ) -> "FigureMetrics":
+    """turn on metrics (off by default), when off
+    hot paths pay only for one global check."""
+    from .metrics import FigureMetrics
+    global _metrics
+    _metrics = FigureMetrics(exporter, latency_edges_ns)
+    return _metrics
+
+
+def disable_metrics() -> None:
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional["FigureMetrics"]:
+    return _metrics
+
+
+def _cached_call(kernel: Callable[..., Any], /, *args: Any) -> Any:
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(kernel, *args)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return kernel(*args)
+
+
+def calculate_circle_area(radius: ParamT) -> AreaT:
+    """calculate circle area."""
+    if _metrics is not None:
+        return _metrics.observe(
+                "calculate_circle_area", FigureType.CIRCLE, _cached_call,
+                _circle_area_kernel, radius,
+                )
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(_circle_area_kernel, radius)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return _circle_area_kernel(radius)
+
+
+def calculate_square_area(side: ParamT) -> AreaT:
+    """calculate square area."""
+    if _metrics is not None:
+        return _metrics.observe(
+                "calculate_square_area", FigureType.SQUARE, _cached_call,
+                _square_area_kernel, side,
+                )
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(_square_area_kernel, side)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return _square_area_kernel(side)
+
+
+def calculate_triangle_area(leg_a: ParamT, leg_b: ParamT, hopotenuse: ParamT) -> AreaT:
+    """calculate triangle area."""
+    if _metrics is not None:
+        return _metrics.observe(
+                "calculate_triangle_area", FigureType.TRIANGLE, _cached_call,
+                _triangle_area_kernel, leg_a, leg_b, hopotenuse,
+                )
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(_triangle_area_kernel, leg_a, leg_b, hopotenuse)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return _triangle_area_kernel(leg_a, leg_b, hopotenuse)
+
+
+def calculate_rectangle_area(side_a: ParamT, side_b: ParamT) -> AreaT:
+    """calculate reactangle area."""
+    if _metrics is not None:
+        return _metrics.observe(
+                "calculate_rectangle_area", FigureType.RECTANGLE, _cached_call,
+                _rectangle_area_kernel, side_a, side_b,
+                )
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(_rectangle_area_kernel, side_a, side_b)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return _rectangle_area_kernel(side_a, side_b)
+
+
+def calculate_polygon_area(*coords: ParamT) -> AreaT:
+    """calculate polygon area, coords are <x0, y0, x1, y1, ...>."""
+    if _metrics is not None:
+        return _metrics.observe(
+                "calculate_polygon_area", FigureType.POLYGON, _cached_call,
+                _polygon_area_kernel, *coords,
+                )
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(_polygon_area_kernel, *coords)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return _polygon_area_kernel(*coords)
+
+
+def is_triangle_right(
+        leg_a: ParamT,
+        leg_b: ParamT,
+        hopotenuse: ParamT,
+        *,
+        rel_tolerance: ParamT,
+        ) -> bool:
+    """check on 90 degree angle (in triangle)
+    Can set wished tolerance, if not set, tolerance will be
+    1e-3 by default (see _DEF_TOLERANCE)."""
+    if _metrics is not None:
+        return _metrics.observe(
+                "is_triangle_right", FigureType.TRIANGLE, _cached_call,
+                _triangle_right_kernel, leg_a, leg_b, hopotenuse, rel_tolerance,
+                )
+    if _area_cache is not None:
+        # result depends on tolerance, so it`s a part of key
+        try:
+            return _area_cache.lookup(
+                    _triangle_right_kernel, leg_a, leg_b, hopotenuse, rel_tolerance,
+                    )
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return _triangle_right_kernel(leg_a, leg_b, hopotenuse, rel_tolerance)
+
+
+class _TypeMapper(ABC):
+
+    @classmethod
+    @abstractmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool: pass
+
+
+class _TypeSwitch(_TypeMapper):
+    """switch type for internal using.
+    Types are mapped to area kernels, so figure
+    objects aren`t created."""
+
+    _tmap: ClassVar[Mapping[FigureType, Callable[..., AreaT]]] = {
+            FigureType.SQUARE: _square_area_kernel,
+            FigureType.TRIANGLE: _triangle_area_kernel,
+            FigureType.CIRCLE: _circle_area_kernel,
+            FigureType.RECTANGLE: _rectangle_area_kernel,
+            FigureType.POLYGON: _polygon_area_kernel,
+            }
+
+    @classmethod
+    def choose_fig_type(cls, ftype: FigureType) -> Callable[..., AreaT]:
+        """we needn`t call .get(), because we`re calling
+        fig_type_contains() before."""
+        return cls._tmap[ftype]
+
+    @classmethod
+    def find_fig_type(cls, ftype: FigureType) -> Optional[Callable[..., AreaT]]:
+        """check and choose type by one lookup (hot path)."""
+        return cls._tmap.get(ftype)
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        """check that type is specified."""
+        return ftype in cls._tmap
+
+
+class _ArgsCounter(_TypeMapper):
+    """get args count for check by FigureType."""
+
+    _args_cnt_map: ClassVar[Mapping[FigureType, int]] = {
+            FigureType.CIRCLE: 1,
+            FigureType.RECTANGLE: 2,
+            FigureType.SQUARE: 1,
+            FigureType.TRIANGLE: 3,
+            }
+    # variable arity: <min args count, args count multiple>
+    _var_args_map: ClassVar[Mapping[FigureType, tuple[int, int]]] = {
+            FigureType.POLYGON: (6, 2),
+            }
+
+    @classmethod
+    def args_count_matched(cls, ftype: FigureType, args: Sequence[ParamT]) -> bool:
+        cnt = cls._args_cnt_map.get(ftype)
+        if cnt is not None:
+            return len(args) == cnt
+        least, step = cls._var_args_map[ftype]
+        return len(args) >= least and not len(args) % step
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        """check that type is specified."""
+        return ftype in cls._args_cnt_map or ftype in cls._var_args_map
+
+    @classmethod
+    def is_variadic(cls, ftype: FigureType) -> bool:
+        return ftype in cls._var_args_map
+
+    @classmethod
+    def fixed_types(cls) -> tuple[FigureType, ...]:
+        """types with fixed args count (columnar paths)."""
+        return tuple(cls._args_cnt_map)
+
+    @classmethod
+    def get_args_count(cls, ftype: FigureType) -> int:
+        """get args count from preset (fixed arity types only)."""
+        return cls._args_cnt_map[ftype]
+
+    @classmethod
+    def expected_args(cls, ftype: FigureType) -> str:
+        """args count for error messages."""
+        if ftype in cls._var_args_map:
+            least, step = cls._var_args_map[ftype]
+            return f"{least} or more, multiple of {step}"
+        return str(cls._args_cnt_map[ftype])
+
+
+def calculate_figure_area(spec: FigureSpec) -> AreaT:
+    """calculate area without knowledge
+    about exact figure type."""
+    areaf = _TypeSwitch.find_fig_type(spec.ftype)
+    if areaf is None:
+        if _metrics is not None:
+            _metrics.record("calculate_figure_area", spec.ftype, 0, FigureTypeError.__name__)
+        raise FigureTypeError(f"No type <{spec.ftype}> specified.")
+    if _metrics is not None:
+        return _metrics.observe(
+                "calculate_figure_area", spec.ftype, _cached_call, areaf, *spec.args,
+                )
+    if _area_cache is not None:
+        try:
+            return _area_cache.lookup(areaf, *spec.args)
+        except TypeError:
+            # unhashable args aren`t cached
+            pass
+    return areaf(*spec.args)
+
+
+def build_figure_spec(ftype: FigureType, /, *args) -> FigureSpec:
+    if _metrics is not None:
+        return _metrics.observe("build_figure_spec", ftype, _build_figure_spec, ftype, *args)
+    return _build_figure_spec(ftype, *args)
+
+
+def _build_figure_spec(ftype: FigureType, /, *args) -> FigureSpec:
+    # messages are built on error path only
+    if _ArgsCounter.fig_type_contains(ftype):
+        if _ArgsCounter.args_count_matched(ftype, args):
+            return FigureSpec(ftype=ftype, args=args)
+        cnt = _ArgsCounter.expected_args(ftype)
+        raise FigureSpecError(
+                f"Args count in {args} not mathed. Got: {len(args)}, need: {cnt}"
+                )
+    raise FigureTypeError(f"No type <{ftype}> specified.")
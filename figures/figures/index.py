@@ -0,0 +1,191 @@
+"""Index of figures by area with range and nearest queries."""
+import bisect
+import math
+from array import array
+from typing import (
+        TYPE_CHECKING,
+        cast,
+        Optional,
+        Iterable,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        AreaT,
+        calculate_figure_area,
+        FigureSpec,
+        FigureType,
+        ImpossibleDimention,
+        _IMPOSSIBLE_DIM_MSG,
+        )
+from .batch import (
+        FigureBatch,
+        _TypeCoder,
+        )
+from .vectorized import calculate_figure_areas
+
+
+__all__ = (
+        "FigureIndex",
+        )
+
+
+class _SortedAreas:
+    """areas sorted by <area, id> in two parallel arrays,
+    ids of equal areas are sorted too, so every entry is found
+    by two binary searches."""
+
+    __slots__ = ("areas", "ids")
+
+    def __init__(self) -> None:
+        self.areas: "array[float]" = array("d")
+        self.ids: "array[int]" = array("q")
+
+    def _position(self, area: float, fid: int) -> int:
+        lo = bisect.bisect_left(self.areas, area)
+        hi = bisect.bisect_right(self.areas, area, lo)
+        return bisect.bisect_left(self.ids, fid, lo, hi)
+
+    def insert(self, area: float, fid: int) -> None:
+        pos = self._position(area, fid)
+        self.areas.insert(pos, area)
+        self.ids.insert(pos, fid)
+
+    def remove(self, area: float, fid: int) -> None:
+        pos = self._position(area, fid)
+        del self.areas[pos]
+        del self.ids[pos]
+
+    def merge(self, areas: AreasT, ids: "npt.NDArray[np.int64]") -> None:
+        """bulk insert, sort once instead of many inserts."""
+        import numpy as np
+        all_areas = np.concatenate((np.frombuffer(self.areas, dtype=np.float64), areas))
+        all_ids = np.concatenate((np.frombuffer(self.ids, dtype=np.int64), ids))
+        order = np.lexsort((all_ids, all_areas))
+        self.areas = array("d", all_areas[order].tobytes())
+        self.ids = array("q", all_ids[order].tobytes())
+
+    def top(self, k: int) -> list[int]:
+        return self.ids[max(len(self.ids) - k, 0):].tolist()[::-1]
+
+    def bottom(self, k: int) -> list[int]:
+        return self.ids[:max(k, 0)].tolist()
+
+    def between(self, min_area: float, max_area: float) -> list[int]:
+        lo = bisect.bisect_left(self.areas, min_area)
+        hi = bisect.bisect_right(self.areas, max_area, lo)
+        return self.ids[lo:hi].tolist()
+
+
+class FigureIndex:
+    """Figures sorted by area for top-k and range queries.
+    Areas are calculated once on insert, every figure gets int id.
+    Queries are O(log n + k) (k - size of result), also inside
+    one FigureType. insert()/delete() move tail of sorted arrays
+    (memmove), use extend() for many figures."""
+
+    __slots__ = ("_all", "_by_type", "_entries", "_next_id")
+
+    def __init__(self, specs: Iterable[FigureSpec] = ()) -> None:
+        self._all = _SortedAreas()
+        self._by_type: dict[FigureType, _SortedAreas] = {}
+        self._entries: dict[int, tuple[FigureSpec, float]] = {}
+        self._next_id = 0
+        self.extend(specs)
+
+    def _sorted(self, ftype: FigureType) -> _SortedAreas:
+        if (areas := self._by_type.get(ftype)) is None:
+            areas = self._by_type[ftype] = _SortedAreas()
+        return areas
+
+    def insert(self, spec: FigureSpec) -> int:
+        """add figure and return its id, raises
+        as calculate_figure_area() for bad specs. NaN and infinite
+        areas are rejected, they would break sorted order."""
+        area = calculate_figure_area(spec)
+        if not math.isfinite(area):
+            raise ImpossibleDimention(f"{_IMPOSSIBLE_DIM_MSG} Spec: {spec}, area: {area}")
+        fid = self._next_id
+        self._next_id += 1
+        self._entries[fid] = (spec, area)
+        self._all.insert(area, fid)
+        self._sorted(spec.ftype).insert(area, fid)
+        return fid
+
+    def extend(self, specs: Iterable[FigureSpec]) -> list[int]:
+        """add many figures (areas are calculated as batch) and
+        return their ids. Nothing is added if some spec is bad
+        (area can`t be calculated or isn`t finite)."""
+        import numpy as np
+        specs = list(specs)
+        if not specs:
+            return []
+        batch = FigureBatch(specs)
+        areas = calculate_figure_areas(batch)
+        bad = np.flatnonzero(~np.isfinite(areas))
+        if len(bad):
+            raise ImpossibleDimention(
+                    f"{_IMPOSSIBLE_DIM_MSG} Spec: {specs[bad[0]]}, pos: {bad[0]}"
+                    )
+        ids = np.arange(self._next_id, self._next_id + len(specs), dtype=np.int64)
+        self._next_id += len(specs)
+        self._entries.update(zip(ids.tolist(), zip(specs, areas.tolist())))
+        self._all.merge(areas, ids)
+        codes = batch.type_codes()
+        for ftype in _TypeCoder.types():
+            if batch.count(ftype):
+                mask = codes == _TypeCoder.get_code(ftype)
+                self._sorted(ftype).merge(areas[mask], ids[mask])
+        return cast(list[int], ids.tolist())
+
+    def delete(self, fid: int) -> FigureSpec:
+        """remove figure by id and return its spec."""
+        spec, area = self._entries.pop(fid)
+        self._all.remove(area, fid)
+        self._by_type[spec.ftype].remove(area, fid)
+        return spec
+
+    def _scope(self, ftype: Optional[FigureType]) -> _SortedAreas:
+        if ftype is None:
+            return self._all
+        return self._by_type.get(ftype) or _SortedAreas()
+
+    def top_k(self, k: int, ftype: Optional[FigureType] = None) -> list[int]:
+        """ids of k biggest figures, biggest first."""
+        return self._scope(ftype).top(k)
+
+    def bottom_k(self, k: int, ftype: Optional[FigureType] = None) -> list[int]:
+        """ids of k smallest figures, smallest first."""
+        return self._scope(ftype).bottom(k)
+
+    def between(
+            self,
+            min_area: float,
+            max_area: float,
+            ftype: Optional[FigureType] = None,
+            ) -> list[int]:
+        """ids of figures with min_area <= area <= max_area,
+        sorted by area."""
+        return self._scope(ftype).between(min_area, max_area)
+
+    def spec(self, fid: int) -> FigureSpec:
+        return self._entries[fid][0]
+
+    def specs(self, ids: Iterable[int]) -> list[FigureSpec]:
+        return [self._entries[fid][0] for fid in ids]
+
+    def area(self, fid: int) -> AreaT:
+        return self._entries[fid][1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, fid: object) -> bool:
+        return fid in self._entries
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(size={len(self)})"
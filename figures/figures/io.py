@@ -0,0 +1,468 @@
+"""Streaming areas of CSV/JSONL records, binary and Parquet files."""
+import importlib
+import math
+import os
+import struct
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+        TYPE_CHECKING,
+        TypeAlias,
+        cast,
+        Optional,
+        Union,
+        Final,
+        Sequence,
+        Iterable,
+        Iterator,
+        TextIO,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        AreaT,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        MaskT,
+        ParamT,
+        _ArgsCounter,
+        _IMPOSSIBLE_DIM_MSG,
+        _STREAM_CHUNK,
+        )
+from .batch import (
+        FigureBatch,
+        FigureRecords,
+        _BIN_PARAMS,
+        _records_dtype,
+        _TypeCoder,
+        )
+from .vectorized import (
+        calculate_areas,
+        calculate_figure_areas,
+        classify_triangles,
+        _float_columns,
+        )
+
+
+__all__ = (
+        "AreaResult",
+        "iter_figure_areas",
+        "write_figure_areas",
+        "read_figures_parquet",
+        "compute_areas_parquet",
+        "write_figures_binary",
+        "read_figures_binary",
+        )
+
+
+# binary format: header <magic, version, params per record, records count>
+# then fixed width records (see _records_dtype())
+_BIN_MAGIC: Final[bytes] = b"FIGB"
+_BIN_VERSION: Final[int] = 1
+_BIN_HEADER: Final[struct.Struct] = struct.Struct("<4sHHQ")
+_BIN_CHUNK: Final[int] = 65_536
+_PARQUET_BATCH: Final[int] = 65_536
+
+
+SourceT: TypeAlias = Union[str, "os.PathLike[str]", Iterable[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class AreaResult:
+    """Area of one streamed record or error
+    (as a value) if area can`t be calculated."""
+    index: int
+    area: Optional[AreaT] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@contextmanager
+def _open_source(source: SourceT) -> Iterator[Iterable[str]]:
+    """open path or use given lines (file object) as is."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8", newline="") as f:
+            yield f
+    else:
+        yield source
+
+
+def _guess_fmt(source: SourceT, first_line: str) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        ext = os.path.splitext(source)[1].lower()
+        if ext in (".jsonl", ".ndjson", ".json"):
+            return "jsonl"
+        if ext == ".csv":
+            return "csv"
+    return "jsonl" if first_line.lstrip().startswith("{") else "csv"
+
+
+RawRecordT: TypeAlias = Union[tuple[Any, Sequence[Any]], FigureSpecError]
+
+
+def _iter_csv_records(lines: Iterable[str]) -> Iterator[RawRecordT]:
+    """rows like <ftype,arg[,arg...]>, header row is skipped."""
+    import csv
+    for row in csv.reader(lines):
+        if not row or not any(row):
+            continue
+        if row[0].strip() == "ftype":
+            continue
+        yield row[0].strip(), row[1:]
+
+
+def _iter_jsonl_records(lines: Iterable[str]) -> Iterator[RawRecordT]:
+    """rows like <{"ftype": "circle", "args": [1.0]}>."""
+    import json
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+            yield rec["ftype"], rec["args"]
+        except (ValueError, KeyError, TypeError) as err:
+            yield FigureSpecError(f"Invalid record {line.strip()!r}: {err}.")
+
+
+def _iter_records(
+        source: SourceT,
+        lines: Iterable[str],
+        fmt: Optional[str],
+        ) -> Iterator[RawRecordT]:
+    it = iter(lines)
+    first = next(it, "")
+    fmt = fmt or _guess_fmt(source, first)
+    lines = _chain_first(first, it)
+    if fmt == "csv":
+        return _iter_csv_records(lines)
+    if fmt == "jsonl":
+        return _iter_jsonl_records(lines)
+    raise ValueError(f"Unknown format <{fmt}>, use <csv> or <jsonl>.")
+
+
+def _chain_first(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
+
+
+def _parse_record(
+        ftype: Any,
+        args: Sequence[Any],
+        ) -> tuple[FigureType, tuple[float, ...]]:
+    try:
+        ftype = FigureType(ftype)
+    except ValueError:
+        raise FigureTypeError(f"No type <{ftype}> specified.") from None
+    # str or bytes args would be read one character per arg
+    if not isinstance(args, (list, tuple)):
+        raise FigureSpecError(f"Args {args!r} for <{ftype}> should be a list.")
+    try:
+        return ftype, tuple(float(a) for a in args)
+    except (ValueError, TypeError):
+        raise FigureSpecError(f"Invalid args {args} for <{ftype}>.") from None
+
+
+def _chunk_areas(chunk: list[RawRecordT], first: int) -> Iterator[AreaResult]:
+    """calculate areas for one chunk, errors become values."""
+    batch = FigureBatch()
+    errors: dict[int, Exception] = {}
+    for pos, rec in enumerate(chunk):
+        try:
+            if isinstance(rec, FigureSpecError):
+                raise rec
+            ftype, args = _parse_record(*rec)
+            batch.append_figure(ftype, *args)
+        except (FigureTypeError, FigureSpecError) as err:
+            errors[pos] = err
+    areas = iter(calculate_figure_areas(batch).tolist())
+    for pos in range(len(chunk)):
+        if pos in errors:
+            yield AreaResult(first + pos, error=errors[pos])
+            continue
+        area = next(areas)
+        if math.isnan(area):
+            yield AreaResult(
+                    first + pos,
+                    error=ImpossibleDimention(_IMPOSSIBLE_DIM_MSG),
+                    )
+        else:
+            yield AreaResult(first + pos, area=area)
+
+
+def iter_figure_areas(
+        source: SourceT,
+        chunk_size: int = _STREAM_CHUNK,
+        *,
+        fmt: Optional[str] = None,
+        ) -> Iterator[AreaResult]:
+    """calculate areas for CSV or JSONL records chunk by chunk,
+    so memory depends on chunk_size only. Source is a path or
+    an iterable of lines (opened file). Records order is kept and
+    bad records give AreaResult with error instead of raising.
+    Format is taken from file extension or from first line
+    if fmt (<csv> or <jsonl>) isn`t set."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size should be bigger as zero, got: {chunk_size}")
+    with _open_source(source) as lines:
+        records = _iter_records(source, lines, fmt)
+        first = 0
+        while chunk := list(islice(records, chunk_size)):
+            yield from _chunk_areas(chunk, first)
+            first += len(chunk)
+
+
+@contextmanager
+def _open_sink(sink: Union[str, "os.PathLike[str]", TextIO]) -> Iterator[TextIO]:
+    if isinstance(sink, (str, os.PathLike)):
+        with open(sink, "w", encoding="utf-8", newline="") as f:
+            yield f
+    else:
+        yield sink
+
+
+def write_figure_areas(
+        source: SourceT,
+        sink: Union[str, "os.PathLike[str]", TextIO],
+        chunk_size: int = _STREAM_CHUNK,
+        *,
+        fmt: Optional[str] = None,
+        ) -> int:
+    """write results of iter_figure_areas() into CSV sink
+    (path or text file) as <index,area,error> rows.
+    Return count of written records."""
+    import csv
+    cnt = 0
+    with _open_sink(sink) as out:
+        writer = csv.writer(out)
+        writer.writerow(("index", "area", "error"))
+        for res in iter_figure_areas(source, chunk_size, fmt=fmt):
+            if res.error is None:
+                writer.writerow((res.index, repr(res.area), ""))
+            else:
+                writer.writerow(
+                        (res.index, "", f"{type(res.error).__name__}: {res.error}")
+                        )
+            cnt += 1
+    return cnt
+
+
+def _parquet_file(
+        source: Union[str, "os.PathLike[str]", Any],
+        columns: Sequence[str],
+        batch_size: int,
+        ) -> Any:
+    """open parquet file and check that columns are in it."""
+    pq = importlib.import_module("pyarrow.parquet")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    pf = pq.ParquetFile(source)
+    missing = [c for c in columns if c not in pf.schema_arrow.names]
+    if missing:
+        raise ValueError(f"No columns {missing} in parquet file.")
+    return pf
+
+
+def _figure_columns(ftype: str, params: Sequence[str], columns: Sequence[str]) -> list[str]:
+    """projection: extra columns, then type and params (no repeats)."""
+    return list(dict.fromkeys([*columns, ftype, *params]))
+
+
+def read_figures_parquet(
+        source: Union[str, "os.PathLike[str]", Any],
+        *,
+        ftype: str = "ftype",
+        params: Sequence[str] = ("p0", "p1", "p2"),
+        columns: Sequence[str] = (),
+        batch_size: int = _PARQUET_BATCH,
+        use_threads: bool = False,
+        ) -> Iterator[Any]:
+    """stream pyarrow RecordBatches (at most batch_size rows) of figure
+    type, params and extra columns from parquet path or file, other
+    columns aren`t read. use_threads decodes columns of row groups
+    in parallel."""
+    cols = _figure_columns(ftype, params, columns)
+    pf = _parquet_file(source, cols, batch_size)
+    yield from pf.iter_batches(batch_size=batch_size, columns=cols, use_threads=use_threads)
+
+
+def _type_codes_lut(values: Iterable[Any]) -> "npt.NDArray[np.uint8]":
+    """type codes (see FigureBatch.type_code()) of distinct type
+    values and one more for missing value (index len(values)),
+    unknown types get code which isn`t used."""
+    import numpy as np
+    types = _TypeCoder.types()
+    unknown = max(_TypeCoder.get_code(t) for t in types) + 1
+    # FigureType is str, so its members and values are same keys
+    codes = {t.value: _TypeCoder.get_code(t) for t in types}
+    return np.array(
+            [codes.get(v, unknown) if isinstance(v, str) else unknown for v in values]
+            + [unknown],
+            dtype=np.uint8,
+            )
+
+
+def _arrow_type_codes(column: Any) -> "npt.NDArray[np.uint8]":
+    """type codes of string or dictionary arrow column, nulls are
+    unknown types. Strings are matched by pyarrow.compute,
+    dictionary columns by their (small) dictionary."""
+    pa = importlib.import_module("pyarrow")
+    pc = importlib.import_module("pyarrow.compute")
+    if pa.types.is_dictionary(column.type):
+        values = column.dictionary.to_pylist()
+        idx = column.indices.fill_null(len(values)).to_numpy(zero_copy_only=False)
+    else:
+        values = [t.value for t in _TypeCoder.types()]
+        idx = pc.index_in(column, value_set=pa.array(values)).fill_null(len(values))
+        idx = idx.to_numpy(zero_copy_only=False)
+    return cast("npt.NDArray[np.uint8]", _type_codes_lut(values)[idx])
+
+
+def _coded_column_measures(
+        codes: "npt.NDArray[np.uint8]",
+        params: Sequence[AreasT],
+        rel_tol: Optional[ParamT],
+        ) -> tuple[AreasT, MaskT]:
+    """areas and right triangle flags of fixed arity figures,
+    triangles are classified once for both."""
+    import numpy as np
+    areas = np.full(len(codes), np.nan, dtype=np.float64)
+    right = np.zeros(len(codes), dtype=np.bool_)
+    for ftype in _ArgsCounter.fixed_types():
+        mask = codes == _TypeCoder.get_code(ftype)
+        if not mask.any():
+            continue
+        cols = [c[mask] for c in _float_columns(params, _ArgsCounter.get_args_count(ftype), ftype)]
+        if ftype is FigureType.TRIANGLE:
+            tc = classify_triangles(*cols, rel_tol=rel_tol)
+            areas[mask] = tc.areas
+            right[mask] = tc.right
+        else:
+            areas[mask] = calculate_areas(ftype, *cols)
+    return areas, right
+
+
+def compute_areas_parquet(
+        source: Union[str, "os.PathLike[str]", Any],
+        sink: Union[str, "os.PathLike[str]", Any],
+        *,
+        ftype: str = "ftype",
+        params: Sequence[str] = ("p0", "p1", "p2"),
+        columns: Sequence[str] = (),
+        rel_tol: Optional[ParamT] = None,
+        area_col: str = "area",
+        right_col: str = "is_right",
+        batch_size: int = _PARQUET_BATCH,
+        use_threads: bool = False,
+        ) -> int:
+    """read figures by read_figures_parquet() batch by batch, calculate
+    areas and right triangle flags by vectorized kernels and write
+    read columns with area and right flag columns into parquet sink.
+    Every figure uses as many first params as it needs (see
+    calculate_column_areas()), area is null for unknown types,
+    polygons and impossible dimentions. Memory is bounded by
+    batch_size rows. Return count of written rows."""
+    import numpy as np
+    pa = importlib.import_module("pyarrow")
+    pq = importlib.import_module("pyarrow.parquet")
+    cols = _figure_columns(ftype, params, columns)
+    pf = _parquet_file(source, cols, batch_size)
+    schema = pa.schema([
+            *(pf.schema_arrow.field(c) for c in cols),
+            pa.field(area_col, pa.float64()),
+            pa.field(right_col, pa.bool_()),
+            ])
+    rows = 0
+    with pq.ParquetWriter(sink, schema) as writer:
+        for batch in pf.iter_batches(batch_size=batch_size, columns=cols, use_threads=use_threads):
+            codes = _arrow_type_codes(batch.column(ftype))
+            # nulls become NaN, so they`re impossible dimentions
+            values = [
+                    batch.column(p).cast(pa.float64()).to_numpy(zero_copy_only=False)
+                    for p in params
+                    ]
+            areas, right = _coded_column_measures(codes, values, rel_tol)
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                    [*batch.columns, pa.array(areas, mask=np.isnan(areas)), pa.array(right)],
+                    schema=schema,
+                    ))
+            rows += batch.num_rows
+    return rows
+
+
+def _batch_records(batch: FigureBatch) -> "npt.NDArray[Any]":
+    import numpy as np
+    codes = batch.type_codes()
+    records = np.zeros(len(codes), dtype=_records_dtype())
+    records["code"] = codes
+    records["params"] = np.nan
+    for ftype in _TypeCoder.types():
+        if not batch.count(ftype):
+            continue
+        if _ArgsCounter.is_variadic(ftype):
+            raise FigureTypeError(f"Type <{ftype}> can`t be stored in fixed width records.")
+        cnt = _ArgsCounter.get_args_count(ftype)
+        mask = codes == _TypeCoder.get_code(ftype)
+        records["params"][mask, :cnt] = batch.params(ftype)
+    return records
+
+
+def _iter_record_chunks(
+        figures: Union[FigureBatch, Iterable[FigureSpec]],
+        ) -> Iterator["npt.NDArray[Any]"]:
+    if isinstance(figures, FigureBatch):
+        yield from map(_batch_records, figures.chunks(_BIN_CHUNK))
+        return
+    it = iter(figures)
+    while chunk := list(islice(it, _BIN_CHUNK)):
+        yield _batch_records(FigureBatch(chunk))
+
+
+def write_figures_binary(
+        path: Union[str, "os.PathLike[str]"],
+        figures: Union[FigureBatch, Iterable[FigureSpec]],
+        ) -> int:
+    """write figures as fixed width binary records
+    chunk by chunk, return count of written records."""
+    cnt = 0
+    with open(path, "wb") as f:
+        f.write(_BIN_HEADER.pack(_BIN_MAGIC, _BIN_VERSION, _BIN_PARAMS, 0))
+        for records in _iter_record_chunks(figures):
+            f.write(records.tobytes())
+            cnt += len(records)
+        f.seek(0)
+        f.write(_BIN_HEADER.pack(_BIN_MAGIC, _BIN_VERSION, _BIN_PARAMS, cnt))
+    return cnt
+
+
+def read_figures_binary(path: Union[str, "os.PathLike[str]"]) -> FigureRecords:
+    """memory map binary records file (read only), nothing is
+    read except header until records are touched."""
+    import numpy as np
+    with open(path, "rb") as f:
+        header = f.read(_BIN_HEADER.size)
+    if len(header) < _BIN_HEADER.size:
+        raise ValueError(f"File {path} is too short for figures header.")
+    magic, version, params, cnt = _BIN_HEADER.unpack(header)
+    if magic != _BIN_MAGIC or version != _BIN_VERSION or params != _BIN_PARAMS:
+        raise ValueError(f"File {path} isn`t figures binary v{_BIN_VERSION}.")
+    dtype = _records_dtype()
+    if cnt == 0:
+        return FigureRecords(np.zeros(0, dtype=dtype))
+    expected = _BIN_HEADER.size + cnt * dtype.itemsize
+    if os.path.getsize(path) < expected:
+        raise ValueError(f"File {path} is truncated, expected {expected} bytes.")
+    return FigureRecords(
+            np.memmap(path, dtype=dtype, mode="r", offset=_BIN_HEADER.size, shape=(cnt, ))
+            )
@@ -0,0 +1,306 @@
+"""Area, perimeter and right angle flag of one or many figures."""
+import math
+from dataclasses import dataclass
+from typing import (
+        TYPE_CHECKING,
+        TypeAlias,
+        cast,
+        Optional,
+        Union,
+        Mapping,
+        Callable,
+        ClassVar,
+        Sequence,
+        Iterable,
+        Iterator,
+        NamedTuple,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        AreaT,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        MaskT,
+        ParamT,
+        _ArgsCounter,
+        _circle_area_kernel,
+        _DEF_TOLERANCE,
+        _IMPOSSIBLE_DIM_MSG,
+        _kahan_radicand,
+        _polygon_area_kernel,
+        _polygon_perimeter,
+        _POW2,
+        _rectangle_area_kernel,
+        _square_area_kernel,
+        _TypeMapper,
+        )
+from .batch import (
+        FigureBatch,
+        _TypeCoder,
+        _group_params,
+        )
+from .vectorized import (
+        classify_triangles,
+        _masked_areas,
+        _polygon_vertex_areas,
+        _polygon_vertex_perimeters,
+        _polygon_vertices,
+        )
+
+
+__all__ = (
+        "FigureMeasures",
+        "measure_figure",
+        "BatchMeasures",
+        "measure_figures",
+        )
+
+
+class FigureMeasures(NamedTuple):
+    """area, perimeter and right angle flag of one figure,
+    right is None for figures which aren`t triangles.
+    NamedTuple (not frozen dataclass), because it`s created
+    faster and it matters for per spec calls."""
+    area: AreaT
+    perimeter: AreaT
+    right: Optional[bool] = None
+
+
+def _circle_measures(args: tuple[ParamT, ...], rel_tol: Optional[ParamT]) -> FigureMeasures:
+    (radius, ) = args
+    return FigureMeasures(_circle_area_kernel(radius), 2 * math.pi * radius)
+
+
+def _square_measures(args: tuple[ParamT, ...], rel_tol: Optional[ParamT]) -> FigureMeasures:
+    (side, ) = args
+    return FigureMeasures(_square_area_kernel(side), 4 * side)
+
+
+def _rectangle_measures(args: tuple[ParamT, ...], rel_tol: Optional[ParamT]) -> FigureMeasures:
+    side_a, side_b = args
+    return FigureMeasures(_rectangle_area_kernel(side_a, side_b), 2 * (side_a + side_b))
+
+
+def _triangle_measures(args: tuple[ParamT, ...], rel_tol: Optional[ParamT]) -> FigureMeasures:
+    """sides are checked once, inequality sums are shared by
+    validity and degeneracy checks, squares of sides are used by
+    right angle check only. Same rules as classify_triangles():
+    degenerate triangle has area 0.0 and isn`t right."""
+    leg_a, leg_b, hopotenuse = args
+    if leg_a <= 0 or leg_b <= 0 or hopotenuse <= 0:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    bc, ac, ab = leg_b + hopotenuse, leg_a + hopotenuse, leg_a + leg_b
+    if leg_a > bc or leg_b > ac or hopotenuse > ab:
+        raise ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    perimeter = leg_a + leg_b + hopotenuse
+    if leg_a == bc or leg_b == ac or hopotenuse == ab:
+        return FigureMeasures(0.0, perimeter, False)
+    return FigureMeasures(
+            math.sqrt(max(_kahan_radicand(leg_a, leg_b, hopotenuse), 0.0)) / 4,
+            perimeter,
+            math.isclose(
+                math.pow(hopotenuse, _POW2),
+                math.pow(leg_a, _POW2) + math.pow(leg_b, _POW2),
+                rel_tol=rel_tol or _DEF_TOLERANCE,
+                ),
+            )
+
+
+def _polygon_measures(args: tuple[ParamT, ...], rel_tol: Optional[ParamT]) -> FigureMeasures:
+    return FigureMeasures(_polygon_area_kernel(*args), _polygon_perimeter(args))
+
+
+class _MeasureSwitch(_TypeMapper):
+    """switch type for fused measures kernels."""
+
+    _tmap: ClassVar[Mapping[
+            FigureType,
+            Callable[[tuple[ParamT, ...], Optional[ParamT]], FigureMeasures],
+            ]] = {
+            FigureType.SQUARE: _square_measures,
+            FigureType.TRIANGLE: _triangle_measures,
+            FigureType.CIRCLE: _circle_measures,
+            FigureType.RECTANGLE: _rectangle_measures,
+            FigureType.POLYGON: _polygon_measures,
+            }
+
+    @classmethod
+    def find_fig_type(
+            cls,
+            ftype: FigureType,
+            ) -> Optional[Callable[[tuple[ParamT, ...], Optional[ParamT]], FigureMeasures]]:
+        return cls._tmap.get(ftype)
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        """check that type is specified."""
+        return ftype in cls._tmap
+
+
+def measure_figure(spec: FigureSpec, *, rel_tol: Optional[ParamT] = None) -> FigureMeasures:
+    """area, perimeter and (for triangles) right angle flag in one
+    call, args are checked once. Raises same errors as
+    calculate_figure_area(), triangle which breaks triangle
+    inequality raises ImpossibleDimention."""
+    measuref = _MeasureSwitch.find_fig_type(spec.ftype)
+    if measuref is None:
+        raise FigureTypeError(f"No type <{spec.ftype}> specified.")
+    if not _ArgsCounter.args_count_matched(spec.ftype, spec.args):
+        raise FigureSpecError(
+                f"Args count in {spec.args} not mathed. Got: {len(spec.args)}, "
+                f"need: {_ArgsCounter.expected_args(spec.ftype)}"
+                )
+    return measuref(spec.args, rel_tol)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchMeasures:
+    """areas, perimeters and right angle flags of many figures
+    (rows order). Rows which can`t be measured get NaN area and
+    perimeter, right is False for them and for not triangles."""
+    areas: AreasT
+    perimeters: AreasT
+    right: MaskT
+
+
+def _circle_perimeters(radius: AreasT) -> AreasT:
+    import numpy as np
+    return cast(AreasT, 2 * np.pi * radius)
+
+
+def _square_perimeters(side: AreasT) -> AreasT:
+    return 4 * side
+
+
+def _rectangle_perimeters(side_a: AreasT, side_b: AreasT) -> AreasT:
+    return 2 * (side_a + side_b)
+
+
+class _VecPerimeterSwitch(_TypeMapper):
+    """switch type for vectorized perimeters (triangles
+    are measured by classify_triangles())."""
+
+    _tmap: ClassVar[Mapping[FigureType, Callable[..., AreasT]]] = {
+            FigureType.SQUARE: _square_perimeters,
+            FigureType.CIRCLE: _circle_perimeters,
+            FigureType.RECTANGLE: _rectangle_perimeters,
+            }
+
+    @classmethod
+    def choose_fig_type(cls, ftype: FigureType) -> Callable[..., AreasT]:
+        return cls._tmap[ftype]
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        """check that type is specified."""
+        return ftype in cls._tmap
+
+
+_TypeMeasuresT: TypeAlias = tuple[AreasT, AreasT, MaskT]
+
+
+def _measure_columns(
+        ftype: FigureType,
+        params: AreasT,
+        rel_tol: Optional[ParamT],
+        ) -> _TypeMeasuresT:
+    """measures of fixed arity figures, params is (rows, args) array."""
+    import numpy as np
+    cols = params.T
+    if ftype is FigureType.TRIANGLE:
+        # one pass: validity masks, squares of sides and semi-perimeter
+        # are computed once for area and right angle flag
+        tc = classify_triangles(*cols, rel_tol=rel_tol)
+        perimeters = cols[0] + cols[1] + cols[2]
+        perimeters[~(tc.valid | tc.degenerate)] = np.nan
+        return tc.areas, perimeters, tc.right
+    areas, mask = _masked_areas(ftype, tuple(cols))
+    perimeters = np.asarray(
+            _VecPerimeterSwitch.choose_fig_type(ftype)(*cols), dtype=np.float64,
+            )
+    perimeters[~mask] = np.nan
+    return areas, perimeters, np.zeros(len(areas), dtype=np.bool_)
+
+
+def _measure_polygons(coords: "npt.ArrayLike", offsets: "npt.ArrayLike") -> _TypeMeasuresT:
+    """vertices layout is built once for areas and perimeters."""
+    import numpy as np
+    vertices = _polygon_vertices(coords, offsets)
+    areas = _polygon_vertex_areas(vertices)
+    perimeters = _polygon_vertex_perimeters(vertices)
+    perimeters[np.isnan(areas)] = np.nan
+    return areas, perimeters, np.zeros(len(areas), dtype=np.bool_)
+
+
+def _iter_batch_measures(
+        batch: FigureBatch,
+        rel_tol: Optional[ParamT],
+        ) -> Iterator[tuple[MaskT, _TypeMeasuresT]]:
+    codes = batch.type_codes()
+    for ftype in _TypeCoder.types():
+        if not batch.count(ftype):
+            continue
+        mask = codes == _TypeCoder.get_code(ftype)
+        if ftype is FigureType.POLYGON:
+            yield mask, _measure_polygons(batch.params(ftype), batch.offsets(ftype))
+        else:
+            yield mask, _measure_columns(ftype, batch.params(ftype), rel_tol)
+
+
+def _iter_specs_measures(
+        specs: Sequence[FigureSpec],
+        rel_tol: Optional[ParamT],
+        ) -> Iterator[tuple[list[int], _TypeMeasuresT]]:
+    import numpy as np
+    groups: dict[FigureType, list[int]] = {}
+    for idx, spec in enumerate(specs):
+        ftype = spec.ftype
+        if (
+                _ArgsCounter.fig_type_contains(ftype)
+                and _ArgsCounter.args_count_matched(ftype, spec.args)
+                ):
+            groups.setdefault(ftype, []).append(idx)
+    for ftype, idxs in groups.items():
+        group = [specs[i].args for i in idxs]
+        # rows which args aren`t numbers have NaN params
+        params, _ = _group_params(ftype, group)
+        if ftype is FigureType.POLYGON:
+            offsets = np.cumsum([0, *map(len, group)])
+            yield idxs, _measure_polygons(params, offsets)
+        else:
+            yield idxs, _measure_columns(ftype, params, rel_tol)
+
+
+def measure_figures(
+        figures: Union[FigureBatch, Sequence[FigureSpec]],
+        *,
+        rel_tol: Optional[ParamT] = None,
+        ) -> BatchMeasures:
+    """vectorized measure_figure(): areas, perimeters and right angle
+    flags of a batch or a sequence of specs in one pass per type.
+    Rows which can`t be measured (unknown type, wrong args count, args
+    which aren`t numbers, impossible dimentions) get NaN, as in
+    calculate_figure_areas()."""
+    import numpy as np
+    groups: Iterable[tuple[Any, _TypeMeasuresT]]
+    if isinstance(figures, FigureBatch):
+        groups = _iter_batch_measures(figures, rel_tol)
+    else:
+        groups = _iter_specs_measures(figures, rel_tol)
+    areas = np.full(len(figures), np.nan, dtype=np.float64)
+    perimeters = np.full(len(figures), np.nan, dtype=np.float64)
+    right = np.zeros(len(figures), dtype=np.bool_)
+    for rows, (type_areas, type_perimeters, type_right) in groups:
+        areas[rows] = type_areas
+        perimeters[rows] = type_perimeters
+        right[rows] = type_right
+    return BatchMeasures(areas=areas, perimeters=perimeters, right=right)
@@ -0,0 +1,144 @@
+"""Opt-in call metrics of scalar functions, see enable_metrics()."""
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from typing import (
+        Optional,
+        Mapping,
+        Callable,
+        Sequence,
+        TypeVar,
+        Any,
+        )
+
+from .core import _LATENCY_EDGES_NS
+
+
+__all__ = (
+        "OpStats",
+        "MetricsSnapshot",
+        "FigureMetrics",
+        )
+
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class OpStats:
+    """Stats of one operation for one figure type.
+    latency_hist[i] counts calls faster than latency_edges_ns[i]
+    (and not faster than previous edge), last bucket is open.
+    errors are counted by exception class name."""
+    calls: int
+    total_ns: int
+    latency_edges_ns: tuple[int, ...]
+    latency_hist: tuple[int, ...]
+    errors: Mapping[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """stats by <operation name, figure type value>."""
+    ops: Mapping[tuple[str, str], OpStats]
+
+
+class _OpCounter:
+
+    __slots__ = ("calls", "total_ns", "hist", "errors")
+
+    def __init__(self, buckets: int) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.hist = [0] * buckets
+        self.errors: dict[str, int] = {}
+
+
+class FigureMetrics:
+    """Opt-in metrics of calculate_*_area(), calculate_figure_area(),
+    is_triangle_right() and build_figure_spec() calls: counts,
+    latency histograms and errors by operation and figure type.
+    exporter (if set) gets snapshot on export()."""
+
+    __slots__ = ("_edges", "_counters", "_lock", "_exporter")
+
+    def __init__(
+            self,
+            exporter: Optional[Callable[[MetricsSnapshot], None]] = None,
+            latency_edges_ns: Sequence[int] = _LATENCY_EDGES_NS,
+            ) -> None:
+        self._edges = tuple(latency_edges_ns)
+        self._counters: dict[tuple[str, object], _OpCounter] = {}
+        self._lock = threading.Lock()
+        self._exporter = exporter
+
+    def observe(
+            self,
+            op: str,
+            ftype: object,
+            func: Callable[..., _T],
+            /,
+            *args: Any,
+            ) -> _T:
+        """call func(*args) and count it, errors are reraised."""
+        err_name = None
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        except Exception as err:
+            err_name = type(err).__name__
+            raise
+        finally:
+            self.record(op, ftype, time.perf_counter_ns() - start, err_name)
+
+    def record(
+            self,
+            op: str,
+            ftype: object,
+            elapsed_ns: int,
+            err_name: Optional[str] = None,
+            ) -> None:
+        """count one call which took elapsed_ns."""
+        with self._lock:
+            cnt = self._counters.get((op, ftype))
+            if cnt is None:
+                cnt = self._counters[(op, ftype)] = _OpCounter(len(self._edges) + 1)
+            cnt.calls += 1
+            cnt.total_ns += elapsed_ns
+            cnt.hist[bisect.bisect_right(self._edges, elapsed_ns)] += 1
+            if err_name is not None:
+                cnt.errors[err_name] = cnt.errors.get(err_name, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return self._snapshot_unlocked()
+
+    def _snapshot_unlocked(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+                {
+                    (op, getattr(ftype, "value", str(ftype))): OpStats(
+                        calls=cnt.calls,
+                        total_ns=cnt.total_ns,
+                        latency_edges_ns=self._edges,
+                        latency_hist=tuple(cnt.hist),
+                        errors=dict(cnt.errors),
+                        )
+                    for (op, ftype), cnt in self._counters.items()
+                    }
+                )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+    def export(self, *, reset: bool = False) -> MetricsSnapshot:
+        """pass snapshot to exporter, with reset counters are
+        dropped atomically with snapshot (delta export)."""
+        with self._lock:
+            snap = self._snapshot_unlocked()
+            if reset:
+                self._counters.clear()
+        if self._exporter is not None:
+            self._exporter(snap)
+        return snap
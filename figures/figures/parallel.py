@@ -0,0 +1,122 @@
+"""Areas of many figures in process pool."""
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+        TYPE_CHECKING,
+        TypeAlias,
+        Optional,
+        Union,
+        Final,
+        Mapping,
+        Sequence,
+        Iterator,
+        )
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    import numpy as np
+
+from .core import (
+        AreasT,
+        FigureSpec,
+        FigureSpecError,
+        FigureTypeError,
+        ImpossibleDimention,
+        _IMPOSSIBLE_DIM_MSG,
+        )
+from .batch import FigureBatch
+from .vectorized import _calculate_batch_areas
+
+
+__all__ = (
+        "AreasReport",
+        "parallel_figure_areas",
+        )
+
+
+_PARALLEL_CHUNK: Final[int] = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class AreasReport:
+    """Areas for many specs in input order, errors are
+    collected by spec index (area for them is NaN)."""
+    areas: AreasT
+    errors: Mapping[int, Exception]
+
+
+_ChunkT: TypeAlias = tuple[int, FigureBatch, Optional[list[int]]]
+
+
+def _iter_batch_chunks(
+        specs: Union[FigureBatch, Sequence[FigureSpec]],
+        chunk_size: int,
+        errors: dict[int, Exception],
+        ) -> Iterator[_ChunkT]:
+    """split specs into compact batches (cheap to pickle).
+    Yield chunk start, batch and positions of batch rows
+    if some specs of chunk failed (they go into errors)."""
+    if isinstance(specs, FigureBatch):
+        for start, chunk in zip(range(0, len(specs), chunk_size), specs.chunks(chunk_size)):
+            yield start, chunk, None
+        return
+    for start in range(0, len(specs), chunk_size):
+        batch = FigureBatch()
+        positions = []
+        for idx in range(start, min(start + chunk_size, len(specs))):
+            spec = specs[idx]
+            try:
+                batch.append_figure(spec.ftype, *spec.args)
+                positions.append(idx)
+            except (FigureTypeError, FigureSpecError) as err:
+                # not numeric args are FigureSpecError too,
+                # failed append leaves batch as it was
+                errors[idx] = err
+        full = len(positions) == min(chunk_size, len(specs) - start)
+        yield start, batch, None if full else positions
+
+
+def _store_chunk(out: AreasT, chunk: _ChunkT, areas: AreasT) -> None:
+    start, _, positions = chunk
+    if positions is None:
+        out[start:start + len(areas)] = areas
+    else:
+        out[positions] = areas
+
+
+def parallel_figure_areas(
+        specs: Union[FigureBatch, Sequence[FigureSpec]],
+        workers: Optional[int] = None,
+        chunk_size: int = _PARALLEL_CHUNK,
+        ) -> AreasReport:
+    """calculate areas in process pool (os.cpu_count() workers
+    by default) keeping input order. Specs are sent to workers as
+    FigureBatch chunks, not one by one. Failed specs don`t stop
+    calculation, errors are collected by spec index."""
+    import numpy as np
+    from concurrent.futures import ProcessPoolExecutor
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size should be bigger as zero, got: {chunk_size}")
+    workers = workers or os.cpu_count() or 1
+    errors: dict[int, Exception] = {}
+    out = np.full(len(specs), np.nan, dtype=np.float64)
+    chunks = _iter_batch_chunks(specs, chunk_size, errors)
+    if workers == 1:
+        for chunk in chunks:
+            _store_chunk(out, chunk, _calculate_batch_areas(chunk[1]))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # limit chunks in flight to keep memory bounded
+            pending: deque[tuple[_ChunkT, "Future[AreasT]"]] = deque()
+            for chunk in chunks:
+                if len(pending) >= 2 * workers:
+                    done, fut = pending.popleft()
+                    _store_chunk(out, done, fut.result())
+                pending.append((chunk, pool.submit(_calculate_batch_areas, chunk[1])))
+            for done, fut in pending:
+                _store_chunk(out, done, fut.result())
+    for idx in np.flatnonzero(np.isnan(out)).tolist():
+        if idx not in errors:
+            errors[idx] = ImpossibleDimention(_IMPOSSIBLE_DIM_MSG)
+    return AreasReport(areas=out, errors=dict(sorted(errors.items())))
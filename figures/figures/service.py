@@ -0,0 +1,201 @@
+"""Asyncio area service merging concurrent requests into batches."""
+import math
+from typing import (
+        TYPE_CHECKING,
+        TypeAlias,
+        Optional,
+        Final,
+        Iterator,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import asyncio
+
+from .core import (
+        AreaT,
+        FigureSpec,
+        ImpossibleDimention,
+        _IMPOSSIBLE_DIM_MSG,
+        )
+from .batch import FigureBatch
+from .vectorized import calculate_figure_areas
+
+
+__all__ = (
+        "AreaService",
+        )
+
+
+_SERVICE_BATCH: Final[int] = 1024
+_SERVICE_DELAY: Final[float] = 1e-3
+_SERVICE_QUEUE: Final[int] = 65_536
+
+
+_ServiceItemT: TypeAlias = tuple[FigureSpec, "asyncio.Future[AreaT]"]
+
+
+class AreaService:
+    """Asyncio front end for calculate_figure_area().
+    Concurrent area() calls are merged into vectorized batches,
+    batch is calculated when max_batch requests are waiting or
+    max_delay seconds passed since the first one. Queue is bounded
+    by max_queue, so callers wait if service is overloaded.
+
+        async with AreaService() as service:
+            area = await service.area(spec)
+
+    Errors are raised for each request separately: FigureTypeError,
+    FigureSpecError or ImpossibleDimention (impossible triangles
+    included)."""
+
+    def __init__(
+            self,
+            *,
+            max_batch: int = _SERVICE_BATCH,
+            max_delay: float = _SERVICE_DELAY,
+            max_queue: int = _SERVICE_QUEUE,
+            ) -> None:
+        if max_batch < 1 or max_queue < 1:
+            raise ValueError("max_batch and max_queue should be bigger as zero")
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._max_queue = max_queue
+        self._queue: Optional["asyncio.Queue[Optional[_ServiceItemT]]"] = None
+        self._batch_ready: Optional["asyncio.Event"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return (
+            f"class {type(self).__name__}(max_batch={self._max_batch}, "
+            f"max_delay={self._max_delay}, max_queue={self._max_queue})"
+            )
+
+    async def __aenter__(self) -> "AreaService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """start batching worker in running loop."""
+        import asyncio
+        if self._worker is not None:
+            raise RuntimeError("Service is already started.")
+        self._queue = asyncio.Queue(maxsize=self._max_queue)
+        self._batch_ready = asyncio.Event()
+        self._worker = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """stop accepting requests, wait for queued ones."""
+        import asyncio
+        if self._closed or self._worker is None:
+            self._closed = True
+            return
+        self._closed = True
+        assert self._queue is not None and self._batch_ready is not None
+        await self._queue.put(None)
+        self._batch_ready.set()
+        await self._worker
+        # let producers woken by the last batch put their requests
+        await asyncio.sleep(0)
+        items = [item for item in self._drain() if item is not None]
+        if items:
+            self._calculate(items)
+
+    def _drain(self) -> Iterator[Optional[_ServiceItemT]]:
+        assert self._queue is not None
+        while not self._queue.empty():
+            yield self._queue.get_nowait()
+
+    async def area(self, spec: FigureSpec) -> AreaT:
+        """calculate area of figure as a part of batch."""
+        import asyncio
+        if self._closed or self._queue is None or self._batch_ready is None:
+            raise RuntimeError("Service isn`t running.")
+        fut: "asyncio.Future[AreaT]" = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((spec, fut))
+        except asyncio.QueueFull:
+            await self._queue.put((spec, fut))
+        if self._queue.qsize() >= self._max_batch:
+            self._batch_ready.set()
+        return await fut
+
+    async def _run(self) -> None:
+        stop = False
+        while not stop:
+            items: list[_ServiceItemT] = []
+            try:
+                stop = await self._collect(items)
+                if items:
+                    self._calculate(items)
+            except Exception as err:
+                # worker must live, so error goes to requests of batch only
+                self._fail(items, err)
+
+    async def _collect(self, items: list[_ServiceItemT]) -> bool:
+        """wait for batch of requests and put them into items,
+        return True if service is closed."""
+        import asyncio
+        assert self._queue is not None and self._batch_ready is not None
+        queue, ready = self._queue, self._batch_ready
+        stop = False
+        first = await queue.get()
+        if first is None:
+            stop = True
+        else:
+            items.append(first)
+            if queue.qsize() + 1 < self._max_batch:
+                try:
+                    async with asyncio.timeout(self._max_delay):
+                        await ready.wait()
+                except TimeoutError:
+                    pass
+        ready.clear()
+        while len(items) < self._max_batch and not queue.empty():
+            item = queue.get_nowait()
+            if item is None:
+                stop = True
+                continue
+            items.append(item)
+        if queue.qsize() >= self._max_batch:
+            ready.set()
+        return stop
+
+    @staticmethod
+    def _fail(items: list[_ServiceItemT], err: Exception) -> None:
+        for _, fut in items:
+            if not fut.done():
+                fut.set_exception(err)
+
+    @staticmethod
+    def _calculate(items: list[_ServiceItemT]) -> None:
+        batch = FigureBatch()
+        waiting: list["asyncio.Future[AreaT]"] = []
+        for spec, fut in items:
+            if fut.done():
+                # cancelled by caller
+                continue
+            try:
+                batch.append_figure(spec.ftype, *spec.args)
+            except Exception as err:
+                # bad item fails alone, not its batch
+                fut.set_exception(err)
+                continue
+            waiting.append(fut)
+        try:
+            areas = calculate_figure_areas(batch).tolist()
+        except Exception as err:
+            for fut in waiting:
+                fut.set_exception(err)
+            return
+        for fut, area in zip(waiting, areas):
+            if fut.done():
+                continue
+            if math.isnan(area):
+                fut.set_exception(ImpossibleDimention(_IMPOSSIBLE_DIM_MSG))
+            else:
+                fut.set_result(area)
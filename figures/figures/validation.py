@@ -0,0 +1,271 @@
+"""Vectorized validation of many raw figure rows."""
+from enum import IntEnum
+from typing import (
+        TYPE_CHECKING,
+        cast,
+        Optional,
+        Union,
+        Final,
+        Mapping,
+        Sequence,
+        Iterable,
+        Iterator,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        MaskT,
+        _ArgsCounter,
+        _IMPOSSIBLE_DIM_MSG,
+        )
+from .batch import (
+        FigureBatch,
+        _TypeCoder,
+        _group_params,
+        )
+from .vectorized import (
+        calculate_figure_areas,
+        calculate_polygon_areas,
+        _vec_args_bigger_as_zero,
+        )
+
+
+__all__ = (
+        "SpecStatus",
+        "FiguresValidation",
+        "validate_figures",
+        )
+
+
+class SpecStatus(IntEnum):
+    """validation status of one row, see validate_figures()."""
+    OK = 0
+    UNKNOWN_TYPE = 1
+    WRONG_ARGS_COUNT = 2
+    BAD_ARGS = 3
+    IMPOSSIBLE_DIMENTION = 4
+    IMPOSSIBLE_TRIANGLE = 5
+
+
+# error type and message template by status, messages are
+# formatted only when they`re asked for
+_STATUS_ERRORS: Final[Mapping[SpecStatus, tuple[type[Exception], str]]] = {
+        SpecStatus.UNKNOWN_TYPE: (FigureTypeError, "No type <{ftype}> specified."),
+        SpecStatus.WRONG_ARGS_COUNT: (
+            FigureSpecError,
+            "Args count in {args} not mathed. Got: {got}, need: {need}",
+            ),
+        SpecStatus.BAD_ARGS: (FigureSpecError, "Invalid args {args} for <{ftype}>."),
+        SpecStatus.IMPOSSIBLE_DIMENTION: (ImpossibleDimention, _IMPOSSIBLE_DIM_MSG),
+        SpecStatus.IMPOSSIBLE_TRIANGLE: (
+            ImpossibleDimention,
+            "Sides {args} break triangle inequality.",
+            ),
+        }
+
+
+class FiguresValidation:
+    """result of validate_figures(): status code per row and
+    FigureBatch of valid rows (in rows order), which can be passed
+    to calculate_figure_areas() or measure_figures() as is.
+    Bad rows are kept, so messages and errors can be built later."""
+
+    __slots__ = ("_status", "_batch", "_bad")
+
+    def __init__(
+            self,
+            status: "npt.NDArray[np.uint8]",
+            batch: FigureBatch,
+            bad: dict[int, tuple[Any, Any]],
+            ) -> None:
+        self._status = status
+        self._batch = batch
+        self._bad = bad
+
+    @property
+    def status(self) -> "npt.NDArray[np.uint8]":
+        """SpecStatus code per row."""
+        return self._status
+
+    @property
+    def batch(self) -> FigureBatch:
+        return self._batch
+
+    @property
+    def ok(self) -> MaskT:
+        return cast(MaskT, self._status == SpecStatus.OK)
+
+    @property
+    def rows(self) -> "npt.NDArray[np.int64]":
+        """input rows of batch figures."""
+        import numpy as np
+        return np.flatnonzero(self.ok)
+
+    def counts(self) -> dict[SpecStatus, int]:
+        """rows count by status (found statuses only)."""
+        import numpy as np
+        found = np.bincount(self._status, minlength=len(SpecStatus))
+        return {st: int(found[st]) for st in SpecStatus if found[st]}
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def __repr__(self) -> str:
+        return f"class {type(self).__name__}(rows={len(self)}, valid={len(self._batch)})"
+
+    def message(self, row: int) -> Optional[str]:
+        """error message of row, None for valid row."""
+        status = SpecStatus(self._status[row])
+        if status is SpecStatus.OK:
+            return None
+        ftype, args = self._bad[int(row)]
+        template = _STATUS_ERRORS[status][1]
+        if status is SpecStatus.WRONG_ARGS_COUNT:
+            return template.format(
+                    args=args, got=len(args), need=_ArgsCounter.expected_args(ftype),
+                    )
+        return template.format(ftype=ftype, args=args)
+
+    def error(self, row: int) -> Optional[Exception]:
+        """exception which build_figure_spec() or area
+        calculation would raise for row, None for valid row."""
+        msg = self.message(row)
+        if msg is None:
+            return None
+        return _STATUS_ERRORS[SpecStatus(self._status[row])][0](msg)
+
+    def errors(self) -> Iterator[tuple[int, Exception]]:
+        """errors of bad rows in rows order."""
+        for row in sorted(self._bad):
+            err = self.error(row)
+            assert err is not None
+            yield row, err
+
+    def areas(self) -> AreasT:
+        """areas per input row, NaN for bad rows."""
+        import numpy as np
+        out = np.full(len(self._status), np.nan, dtype=np.float64)
+        out[self.ok] = calculate_figure_areas(self._batch)
+        return out
+
+
+def _group_status(
+        ftype: FigureType,
+        params: AreasT,
+        sizes: Optional["npt.NDArray[np.int64]"],
+        ) -> "npt.NDArray[np.uint8]":
+    """vectorized dimentions check of group rows."""
+    import numpy as np
+    if sizes is not None:
+        offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        with np.errstate(over="ignore", invalid="ignore"):
+            bad = np.isnan(calculate_polygon_areas(params, offsets))
+        return cast(
+                "npt.NDArray[np.uint8]",
+                np.where(bad, SpecStatus.IMPOSSIBLE_DIMENTION, SpecStatus.OK).astype(np.uint8),
+                )
+    cols = params.T
+    # not finite dimentions give NaN (or inf) areas
+    positive = _vec_args_bigger_as_zero(*cols) & np.isfinite(params).all(axis=1)
+    status = np.where(positive, SpecStatus.OK, SpecStatus.IMPOSSIBLE_DIMENTION).astype(np.uint8)
+    if ftype is FigureType.TRIANGLE:
+        # degenerate triangles have area 0.0, they aren`t errors
+        a, b, c = cols
+        possible = (a <= b + c) & (b <= a + c) & (c <= a + b)
+        status[positive & ~possible] = SpecStatus.IMPOSSIBLE_TRIANGLE
+    return status
+
+
+def validate_figures(
+        rows: Iterable[Union[FigureSpec, tuple[Any, Sequence[Any]]]],
+        ) -> FiguresValidation:
+    """check many raw <(ftype, args)> rows (or specs) without raising:
+    unknown type, wrong args count, not numeric args, not positive
+    or not finite dimentions and impossible triangles get own
+    SpecStatus code.
+    Type and args count are checked per row, dimentions are checked
+    by vectorized kernels per type, valid rows go to FigureBatch
+    without FigureSpec objects creation."""
+    import numpy as np
+    types = {ftype.value: ftype for ftype in _TypeCoder.types()}
+    # args count by type, None for variable arity types
+    counts = {
+            ftype: None if _ArgsCounter.is_variadic(ftype) else _ArgsCounter.get_args_count(ftype)
+            for ftype in types.values()
+            }
+    bad: dict[int, tuple[Any, Any]] = {}
+    bad_status: dict[int, SpecStatus] = {}
+    # input rows and args of figures by type
+    groups: dict[FigureType, tuple[list[int], list[Any]]] = {
+            ftype: ([], []) for ftype in types.values()
+            }
+    ftype: Any
+    args: Any
+    row = -1
+    for row, rec in enumerate(rows):
+        if isinstance(rec, FigureSpec):
+            ftype, args = rec.ftype, rec.args
+        else:
+            ftype, args = rec
+        found = types.get(ftype) if isinstance(ftype, str) else None
+        if found is None:
+            code = SpecStatus.UNKNOWN_TYPE
+        elif not (
+                type(args) is tuple or type(args) is list
+                or (not isinstance(args, (str, bytes)) and hasattr(args, "__len__"))
+                ):
+            code = SpecStatus.BAD_ARGS
+        elif (
+                len(args) == counts[found]
+                or counts[found] is None and _ArgsCounter.args_count_matched(found, args)
+                ):
+            idxs, group = groups[found]
+            idxs.append(row)
+            group.append(args)
+            continue
+        else:
+            code = SpecStatus.WRONG_ARGS_COUNT
+        bad_status[row] = code
+        bad[row] = (ftype if found is None else found, args)
+    out = np.zeros(row + 1, dtype=np.uint8)
+    if bad_status:
+        out[list(bad_status)] = list(bad_status.values())
+    codes = np.zeros(len(out), dtype=np.uint8)
+    # columns of valid rows by type
+    valid_params: dict[FigureType, AreasT] = {}
+    valid_ends: dict[FigureType, "npt.NDArray[np.int64]"] = {}
+    for ftype, (idxs, group) in groups.items():
+        if not idxs:
+            continue
+        params, bad_args = _group_params(ftype, group)
+        sizes = (
+                np.fromiter(map(len, group), dtype=np.int64, count=len(group))
+                if _ArgsCounter.is_variadic(ftype) else None
+                )
+        type_status = _group_status(ftype, params, sizes)
+        if bad_args is not None:
+            type_status[bad_args] = SpecStatus.BAD_ARGS
+        rows_idx = np.asarray(idxs, dtype=np.int64)
+        out[rows_idx] = type_status
+        good = type_status == SpecStatus.OK
+        for pos in np.flatnonzero(~good).tolist():
+            bad[idxs[pos]] = (ftype, group[pos])
+        codes[rows_idx[good]] = _TypeCoder.get_code(ftype)
+        if sizes is None:
+            valid_params[ftype] = params[good]
+        else:
+            valid_params[ftype] = params[np.repeat(good, sizes)]
+            valid_ends[ftype] = np.cumsum(sizes[good])
+    batch = FigureBatch._from_columns(codes[out == SpecStatus.OK], valid_params, valid_ends)
+    return FiguresValidation(out, batch, bad)
@@ -0,0 +1,507 @@
+"""numpy kernels: areas of many figures, polygons and columns."""
+from dataclasses import dataclass
+from typing import (
+        TYPE_CHECKING,
+        TypeAlias,
+        cast,
+        Optional,
+        Union,
+        Mapping,
+        Callable,
+        ClassVar,
+        Sequence,
+        Iterable,
+        Iterator,
+        Any,
+        )
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+from .core import (
+        AreasT,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        MaskT,
+        ParamT,
+        _ArgsCounter,
+        _DEF_TOLERANCE,
+        _TypeMapper,
+        )
+from .batch import (
+        FigureBatch,
+        FigureRecords,
+        _TypeCoder,
+        _group_params,
+        )
+
+
+__all__ = (
+        "calculate_polygon_areas",
+        "calculate_areas",
+        "calculate_figure_areas",
+        "UniqueAreas",
+        "calculate_unique_areas",
+        "args_valid_mask",
+        "TriangleClasses",
+        "classify_triangles",
+        "calculate_column_areas",
+        "column_triangles_right",
+        )
+
+
+def _circle_areas(radius: AreasT) -> AreasT:
+    import numpy as np
+    return cast(AreasT, np.pi * np.square(radius))
+
+
+def _square_areas(side: AreasT) -> AreasT:
+    import numpy as np
+    return cast(AreasT, np.square(side))
+
+
+def _rectangle_areas(side_a: AreasT, side_b: AreasT) -> AreasT:
+    return side_a * side_b
+
+
+def _triangle_areas(leg_a: AreasT, leg_b: AreasT, hopotenuse: AreasT) -> AreasT:
+    """Heron`s method (stable form), impossible triangles give NaN."""
+    return _vec_kahan_areas(leg_a, leg_b, hopotenuse)
+
+
+def _vec_kahan_areas(
+        leg_a: AreasT,
+        leg_b: AreasT,
+        hopotenuse: AreasT,
+        *,
+        clip: bool = False,
+        ) -> AreasT:
+    """vectorized _kahan_radicand() based areas, keeps dtype of sides.
+    float32 radicand (product of four sides sized factors) overflows
+    for sides ~1e9 and underflows for ~1e-10, so it`s taken as two
+    products of two factors there: they stay at squared sides scale,
+    area is out of range only if it doesn`t fit float32 itself.
+    float64 keeps one product (same results as scalar kernels).
+    Sides are sorted by min/max network (cheaper than np.sort
+    of 3 rows), NaN in any side gives NaN, impossible triangles
+    give NaN (0 if clip is set)."""
+    import numpy as np
+    low, high = np.minimum(leg_a, leg_b), np.maximum(leg_a, leg_b)
+    mid, a = np.minimum(high, hopotenuse), np.maximum(high, hopotenuse)
+    c, b = np.minimum(low, mid), np.maximum(low, mid)
+    # only this product is negative (impossible triangle)
+    outer = (a + (b + c)) * (c - (a - b))
+    if clip:
+        outer = np.maximum(outer, 0)
+    if outer.dtype == np.float32:
+        return cast(AreasT, np.sqrt(outer) * np.sqrt((c + (a - b)) * (a + (b - c))) / 4)
+    return cast(AreasT, np.sqrt(outer * (c + (a - b)) * (a + (b - c))) / 4)
+
+
+def _vec_args_bigger_as_zero(*arrays: AreasT) -> MaskT:
+    """Vectorized _args_bigger_as_zero(), NaN isn`t bigger as zero."""
+    import numpy as np
+    mask = arrays[0] > 0
+    for arr in arrays[1:]:
+        mask &= arr > 0
+    return cast(MaskT, np.asarray(mask))
+
+
+class _VecTypeSwitch(_TypeMapper):
+    """switch type for vectorized kernels."""
+
+    _tmap: ClassVar[Mapping[FigureType, Callable[..., AreasT]]] = {
+            FigureType.SQUARE: _square_areas,
+            FigureType.TRIANGLE: _triangle_areas,
+            FigureType.CIRCLE: _circle_areas,
+            FigureType.RECTANGLE: _rectangle_areas,
+            }
+
+    @classmethod
+    def choose_fig_type(cls, ftype: FigureType) -> Callable[..., AreasT]:
+        return cls._tmap[ftype]
+
+    @classmethod
+    def fig_type_contains(cls, ftype: FigureType) -> bool:
+        """check that type is specified."""
+        return ftype in cls._tmap
+
+
+def _float_dtype(dtype: "npt.DTypeLike") -> "np.dtype[Any]":
+    """float64 (default) or float32 for vectorized kernels."""
+    import numpy as np
+    dt = np.dtype(np.float64 if dtype is None else dtype)
+    if dt != np.float64 and dt != np.float32:
+        raise ValueError(f"dtype must be float32 or float64, got: {dt}")
+    return dt
+
+
+def _masked_areas(
+        ftype: FigureType,
+        arrays: Sequence["npt.ArrayLike"],
+        dtype: "npt.DTypeLike" = None,
+        ) -> tuple[AreasT, MaskT]:
+    """calculate areas and mask of valid rows.
+    Invalid rows are set to NaN."""
+    import numpy as np
+    dt = _float_dtype(dtype)
+    if not _VecTypeSwitch.fig_type_contains(ftype):
+        # polygons have own columns, see calculate_polygon_areas()
+        raise FigureTypeError(f"No columns for type <{ftype}> specified.")
+    cnt = _ArgsCounter.get_args_count(ftype)
+    if len(arrays) != cnt:
+        raise FigureSpecError(
+                f"Arrays count not mathed. Got: {len(arrays)}, need: {cnt}"
+                )
+    cols = np.broadcast_arrays(
+            *(np.asarray(arr, dtype=dt) for arr in arrays)
+            )
+    mask = _vec_args_bigger_as_zero(*cols)
+    # areas out of dtype range are inf
+    with np.errstate(invalid="ignore", over="ignore"):
+        areas = np.array(_VecTypeSwitch.choose_fig_type(ftype)(*cols), dtype=dt)
+    # Heron`s radicand is negative for impossible triangles
+    mask &= ~np.isnan(areas)
+    areas[~mask] = np.nan
+    return areas, mask
+
+
+def calculate_areas(
+        ftype: FigureType,
+        /,
+        *arrays: "npt.ArrayLike",
+        dtype: "npt.DTypeLike" = None,
+        ) -> AreasT:
+    """calculate areas of many figures of one type at once.
+    Each array holds one parameter (same order as for
+    calculate_*_area funcs). Rows with impossible dimentions
+    get NaN instead of raising ImpossibleDimention.
+    dtype=np.float32 halves memory traffic of big arrays, params
+    and areas are float32 then (relative error ~1e-7, areas
+    out of float32 range become inf)."""
+    areas, _ = _masked_areas(ftype, arrays, dtype)
+    return areas
+
+
+def args_valid_mask(ftype: FigureType, /, *arrays: "npt.ArrayLike") -> MaskT:
+    """get mask of rows which area can be calculated for."""
+    _, mask = _masked_areas(ftype, arrays)
+    return mask
+
+
+def calculate_figure_areas(
+        batch: Union[FigureBatch, "FigureRecords", Sequence[FigureSpec]],
+        ) -> AreasT:
+    """calculate areas for a batch, binary records or a sequence
+    of specs, result keeps specs order. Rows which can`t be calculated
+    (unknown type, wrong args count, args which aren`t numbers,
+    impossible dimentions) get NaN."""
+    import numpy as np
+    if isinstance(batch, FigureBatch):
+        return _calculate_batch_areas(batch)
+    if isinstance(batch, FigureRecords):
+        return _calculate_coded_areas(batch.codes, batch.params)
+    groups: dict[FigureType, list[int]] = {}
+    for idx, spec in enumerate(batch):
+        ftype = spec.ftype
+        if (
+                _ArgsCounter.fig_type_contains(ftype)
+                and _ArgsCounter.args_count_matched(ftype, spec.args)
+                ):
+            groups.setdefault(ftype, []).append(idx)
+    out = np.full(len(batch), np.nan, dtype=np.float64)
+    for ftype, idxs in groups.items():
+        group = [batch[i].args for i in idxs]
+        # rows which args aren`t numbers have NaN params
+        params, _ = _group_params(ftype, group)
+        if ftype is FigureType.POLYGON:
+            offsets = np.cumsum([0, *map(len, group)])
+            out[idxs] = calculate_polygon_areas(params, offsets)
+            continue
+        out[idxs] = calculate_areas(ftype, *params.T)
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class UniqueAreas:
+    """areas of rows calculated once per unique spec,
+    areas[i] == unique_areas[inverse[i]]."""
+    areas: AreasT
+    unique_areas: AreasT
+    inverse: "npt.NDArray[np.int64]"
+
+    @property
+    def unique_count(self) -> int:
+        return len(self.unique_areas)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """rows per unique spec (how many times less area
+        calculations are done), 1.0 if there are no rows."""
+        if not self.unique_count:
+            return 1.0
+        return len(self.areas) / self.unique_count
+
+
+def calculate_unique_areas(specs: Iterable[FigureSpec]) -> UniqueAreas:
+    """calculate_figure_areas() for repetitive specs: specs are
+    hashed by type and args, every unique spec is calculated
+    once and areas are scattered back in specs order. Rows which
+    can`t be calculated (args which aren`t numbers included) get NaN. Pays off when there are many rows
+    per unique spec, e.g. standard sizes of parts."""
+    import numpy as np
+    # plain tuple keys: tuples are compared in C, FigureSpec.__eq__
+    # would be called for every repeated spec
+    uniq: dict[tuple[FigureType, tuple[ParamT, ...]], int] = {}
+    add = uniq.setdefault
+
+    def index(spec: FigureSpec) -> int:
+        try:
+            return add((spec.ftype, spec.args), len(uniq))
+        except TypeError:
+            # unhashable args aren`t numbers, row gets NaN
+            # as spec of same type without args
+            return add((spec.ftype, ()), len(uniq))
+
+    inverse = np.fromiter(map(index, specs), dtype=np.int64)
+    unique_areas = calculate_figure_areas([FigureSpec(*key) for key in uniq])
+    return UniqueAreas(
+            areas=unique_areas[inverse],
+            unique_areas=unique_areas,
+            inverse=inverse,
+            )
+
+
+def _calculate_coded_areas(
+        codes: "npt.NDArray[np.uint8]",
+        params: AreasT,
+        ) -> AreasT:
+    """areas for rows of type codes and params (first params
+    are used by figure), unknown codes get NaN."""
+    import numpy as np
+    out = np.full(len(codes), np.nan, dtype=np.float64)
+    for ftype in _ArgsCounter.fixed_types():
+        mask = codes == _TypeCoder.get_code(ftype)
+        if not mask.any():
+            continue
+        cnt = _ArgsCounter.get_args_count(ftype)
+        out[mask] = calculate_areas(ftype, *params[mask, :cnt].T)
+    return out
+
+
+def _calculate_batch_areas(batch: FigureBatch) -> AreasT:
+    """params of one type are stored in rows order,
+    so we can scatter them by type codes mask."""
+    import numpy as np
+    codes = batch.type_codes()
+    out = np.empty(len(codes), dtype=np.float64)
+    for ftype in _TypeCoder.types():
+        if batch.count(ftype):
+            out[codes == _TypeCoder.get_code(ftype)] = _batch_type_areas(batch, ftype)
+    return out
+
+
+def _batch_type_areas(batch: FigureBatch, ftype: FigureType) -> AreasT:
+    """areas of batch figures of ftype (in rows order)."""
+    if ftype is FigureType.POLYGON:
+        return calculate_polygon_areas(batch.params(ftype), batch.offsets(ftype))
+    return calculate_areas(ftype, *batch.params(ftype).T)
+
+
+def calculate_polygon_areas(coords: "npt.ArrayLike", offsets: "npt.ArrayLike") -> AreasT:
+    """shoelace areas of many polygons at once. coords is flat
+    <x0, y0, x1, y1, ...> buffer of all polygons, polygon i takes
+    coords[offsets[i]:offsets[i + 1]] (like Arrow list offsets).
+    Polygons with less than 3 vertices, odd coords count or
+    not finite coords get NaN. Polygons should be simple
+    (not self intersecting)."""
+    return _polygon_vertex_areas(_polygon_vertices(coords, offsets))
+
+
+_VerticesT: TypeAlias = tuple[
+        AreasT,
+        AreasT,
+        "npt.NDArray[np.int64]",
+        "npt.NDArray[np.int64]",
+        "npt.NDArray[np.int64]",
+        MaskT,
+        ]
+
+
+def _polygon_vertices(coords: "npt.ArrayLike", offsets: "npt.ArrayLike") -> _VerticesT:
+    """flat vertices of valid polygons: xs, ys, polygon of vertex,
+    first vertex of its polygon, next vertex and valid polygons mask."""
+    import numpy as np
+    xy = np.asarray(coords, dtype=np.float64)
+    offs = np.asarray(offsets, dtype=np.int64)
+    if offs.ndim != 1 or not len(offs):
+        raise FigureSpecError("Offsets should be 1-d array with first offset.")
+    sizes = np.diff(offs)
+    if (sizes < 0).any() or offs[0] < 0 or offs[-1] > len(xy):
+        raise FigureSpecError("Offsets should be increasing and inside coords.")
+    valid = (sizes >= 6) & (sizes % 2 == 0)
+    # vertices of valid polygons, one group per polygon
+    nverts = np.where(valid, sizes // 2, 0)
+    group_starts = np.cumsum(nverts) - nverts
+    group = np.repeat(np.arange(len(sizes)), nverts)
+    first = group_starts[group]
+    local = np.arange(len(group)) - first
+    xs = xy[offs[:-1][group] + 2 * local]
+    ys = xy[offs[:-1][group] + 2 * local + 1]
+    nxt = np.arange(1, len(group) + 1)
+    last = group_starts + nverts - 1
+    nxt[last[valid]] = group_starts[valid]
+    return xs, ys, group, first, nxt, valid
+
+
+def _polygon_vertex_areas(vertices: _VerticesT) -> AreasT:
+    import numpy as np
+    xs, ys, group, first, nxt, valid = vertices
+    xs = xs - xs[first]
+    ys = ys - ys[first]
+    # bincount adds terms in vertices order, as scalar kernel does
+    twice = np.bincount(
+            group, weights=xs * ys[nxt] - xs[nxt] * ys, minlength=len(valid),
+            )
+    areas = np.abs(twice) / 2
+    areas[~(valid & np.isfinite(areas))] = np.nan
+    return cast(AreasT, areas)
+
+
+def _polygon_vertex_perimeters(vertices: _VerticesT) -> AreasT:
+    import numpy as np
+    xs, ys, group, _, nxt, valid = vertices
+    perimeters = np.bincount(
+            group, weights=np.hypot(xs[nxt] - xs, ys[nxt] - ys), minlength=len(valid),
+            )
+    perimeters[~(valid & np.isfinite(perimeters))] = np.nan
+    return cast(AreasT, perimeters)
+
+
+@dataclass(frozen=True, slots=True)
+class TriangleClasses:
+    """Masks and areas for many triangles.
+    valid - all sides > 0 and triangle inequality is strict,
+    degenerate - sides > 0 but one side is equal to sum of
+    others (area is 0.0), right - valid and right angled.
+    Area is NaN for impossible triangles."""
+    valid: MaskT
+    degenerate: MaskT
+    right: MaskT
+    areas: AreasT
+
+
+def _vec_tolerance(rel_tol: Optional["npt.ArrayLike"]) -> Union[float, AreasT]:
+    """vectorized <rel_tol or _DEF_TOLERANCE>."""
+    import numpy as np
+    if rel_tol is None:
+        return cast(float, _DEF_TOLERANCE)
+    tol = np.asarray(rel_tol, dtype=np.float64)
+    if (tol < 0).any():
+        raise ValueError("tolerances must be non-negative")
+    return cast(AreasT, np.where(tol == 0, _DEF_TOLERANCE, tol))
+
+
+def classify_triangles(
+        leg_a: "npt.ArrayLike",
+        leg_b: "npt.ArrayLike",
+        hopotenuse: "npt.ArrayLike",
+        *,
+        rel_tol: Optional["npt.ArrayLike"] = None,
+        dtype: "npt.DTypeLike" = None,
+        ) -> TriangleClasses:
+    """vectorized validity check, Triangle.is_right_triangle()
+    and Triangle.area() for arrays of sides. rel_tol can be a scalar
+    or an array (per triangle), 0 or None means _DEF_TOLERANCE.
+    Sides and areas are float32 for dtype=np.float32."""
+    import numpy as np
+    dt = _float_dtype(dtype)
+    a, b, c = np.broadcast_arrays(
+            np.asarray(leg_a, dtype=dt),
+            np.asarray(leg_b, dtype=dt),
+            np.asarray(hopotenuse, dtype=dt),
+            )
+    tol = _vec_tolerance(rel_tol)
+    positive = _vec_args_bigger_as_zero(a, b, c)
+    strict = (a < b + c) & (b < a + c) & (c < a + b)
+    valid = positive & strict
+    degenerate = positive & ~strict & (a <= b + c) & (b <= a + c) & (c <= a + b)
+    # areas and squares out of dtype range are inf
+    with np.errstate(over="ignore", invalid="ignore"):
+        # same as math.isclose(c ** 2, a ** 2 + b ** 2, rel_tol=tol)
+        hpt2, legs2 = np.square(c), np.square(a) + np.square(b)
+        right = valid & (
+                np.abs(hpt2 - legs2) <= tol * np.maximum(np.abs(hpt2), np.abs(legs2))
+                )
+        areas = _vec_kahan_areas(a, b, c, clip=True)
+    areas[degenerate] = 0
+    areas[~(valid | degenerate)] = np.nan
+    return TriangleClasses(
+            valid=valid,
+            degenerate=degenerate,
+            right=right,
+            areas=areas,
+            )
+
+
+def _column_type_masks(ftypes: "npt.ArrayLike") -> Iterator[tuple[FigureType, MaskT]]:
+    """masks of rows by figure type (only types which are found),
+    variable arity types don`t fit columns, their rows get NaN."""
+    import numpy as np
+    arr = np.asarray(ftypes)
+    for ftype in _ArgsCounter.fixed_types():
+        mask = np.asarray(arr == ftype.value, dtype=np.bool_)
+        if mask.any():
+            yield ftype, mask
+
+
+def _float_columns(
+        params: Sequence["npt.ArrayLike"],
+        cnt: int,
+        ftype: FigureType,
+        ) -> list[AreasT]:
+    import numpy as np
+    if len(params) < cnt:
+        raise FigureSpecError(
+                f"Not enough param columns for <{ftype}>. "
+                f"Got: {len(params)}, need: {cnt}"
+                )
+    return [np.asarray(p, dtype=np.float64) for p in params[:cnt]]
+
+
+def calculate_column_areas(ftypes: "npt.ArrayLike", /, *params: "npt.ArrayLike") -> AreasT:
+    """calculate areas for columnar data: a column of figure types
+    (FigureType or its values) and param columns. Every figure
+    uses as many first param columns as it needs, others are ignored.
+    Unknown types and impossible dimentions get NaN."""
+    import numpy as np
+    out = np.full(np.shape(ftypes)[0], np.nan, dtype=np.float64)
+    for ftype, mask in _column_type_masks(ftypes):
+        cnt = _ArgsCounter.get_args_count(ftype)
+        cols = _float_columns(params, cnt, ftype)
+        out[mask] = calculate_areas(ftype, *(c[mask] for c in cols))
+    return out
+
+
+def column_triangles_right(
+        ftypes: "npt.ArrayLike",
+        /,
+        *params: "npt.ArrayLike",
+        rel_tol: Optional["npt.ArrayLike"] = None,
+        ) -> MaskT:
+    """right triangle flags for columnar data (see calculate_column_areas()),
+    False for other figures and impossible triangles."""
+    import numpy as np
+    out = np.zeros(np.shape(ftypes)[0], dtype=np.bool_)
+    for ftype, mask in _column_type_masks(ftypes):
+        if ftype is not FigureType.TRIANGLE:
+            continue
+        a, b, c = _float_columns(params, 3, ftype)
+        tol = rel_tol
+        if tol is not None and np.ndim(tol):
+            tol = np.asarray(tol)[mask]
+        out[mask] = classify_triangles(a[mask], b[mask], c[mask], rel_tol=tol).right
+    return out
@@ -0,0 +1,136 @@
+"""Vectorized figures UDFs for pyspark DataFrames.
+
+Figures are described by a type column (FigureType values) and
+param columns, every figure uses as many first params as it needs
+(see figures.calculate_column_areas()). Calculation goes by Arrow
+batches with numpy kernels, not row by row.
+"""
+from functools import partial
+from typing import Iterator, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+from pyspark.sql import Column, DataFrame
+from pyspark.sql import functions as F
+from pyspark.sql.functions import pandas_udf
+from pyspark.sql.types import BooleanType, DoubleType, StructField, StructType
+
+from figures import calculate_column_areas, column_triangles_right
+
+
+ColumnT = Union[Column, str]
+
+_PARAMS_CNT = 3
+
+
+@pandas_udf(DoubleType())
+def _area_udf(
+        ftype: pd.Series,
+        p0: pd.Series,
+        p1: pd.Series,
+        p2: pd.Series,
+        ) -> pd.Series:
+    return pd.Series(
+            calculate_column_areas(ftype.to_numpy(), p0, p1, p2),
+            index=ftype.index,
+            )
+
+
+@pandas_udf(BooleanType())
+def _right_udf(
+        ftype: pd.Series,
+        p0: pd.Series,
+        p1: pd.Series,
+        p2: pd.Series,
+        tol: pd.Series,
+        ) -> pd.Series:
+    right = column_triangles_right(
+            ftype.to_numpy(), p0, p1, p2, rel_tol=tol.to_numpy(),
+            )
+    return pd.Series(right, index=ftype.index)
+
+
+def _padded(params: Sequence[ColumnT]) -> list[Column]:
+    """pad params up to max params count by nulls."""
+    if len(params) > _PARAMS_CNT:
+        raise ValueError(f"Too many param columns, max: {_PARAMS_CNT}")
+    cols = [F.col(p) if isinstance(p, str) else p for p in params]
+    cols += [F.lit(None).cast(DoubleType())] * (_PARAMS_CNT - len(cols))
+    return [c.cast(DoubleType()) for c in cols]
+
+
+def figure_area(ftype: ColumnT, *params: ColumnT) -> Column:
+    """area column, null for unknown types and impossible dimentions.
+    df.withColumn("area", figure_area("ftype", "p0", "p1", "p2"))"""
+    return _area_udf(ftype, *_padded(params))
+
+
+def triangle_right(
+        ftype: ColumnT,
+        *params: ColumnT,
+        rel_tol: Union[ColumnT, float, None] = None,
+        ) -> Column:
+    """right triangle flag column, False for other figures.
+    rel_tol can be a column (per row tolerance) or a number,
+    0 or null means figures default tolerance."""
+    if rel_tol is None or isinstance(rel_tol, (int, float)):
+        tol = F.lit(rel_tol or 0.0)
+    else:
+        tol = F.col(rel_tol) if isinstance(rel_tol, str) else rel_tol
+    tol = F.coalesce(tol.cast(DoubleType()), F.lit(0.0))
+    return _right_udf(ftype, *_padded(params), tol)
+
+
+def figure_metrics_batches(
+        batches: Iterator[pa.RecordBatch],
+        ftype: str,
+        params: Sequence[str],
+        rel_tol: Optional[float],
+        *,
+        area_col: str = "area",
+        right_col: str = "is_right",
+        ) -> Iterator[pa.RecordBatch]:
+    """add area and right triangle flag columns to every batch
+    (mapInArrow function of with_figure_metrics()), NaN areas
+    become nulls."""
+    for batch in batches:
+        ftypes = batch.column(ftype).to_numpy(zero_copy_only=False)
+        cols = [
+                batch.column(p).cast(pa.float64()).to_numpy(zero_copy_only=False)
+                for p in params
+                ]
+        areas = calculate_column_areas(ftypes, *cols)
+        right = column_triangles_right(ftypes, *cols, rel_tol=rel_tol)
+        yield pa.RecordBatch.from_arrays(
+                [*batch.columns, pa.array(areas, from_pandas=True), pa.array(right)],
+                names=[*batch.schema.names, area_col, right_col],
+                )
+
+
+def with_figure_metrics(
+        df: DataFrame,
+        ftype: str = "ftype",
+        params: Sequence[str] = ("p0", "p1", "p2"),
+        *,
+        rel_tol: Optional[float] = None,
+        area_col: str = "area",
+        right_col: str = "is_right",
+        ) -> DataFrame:
+    """add area and right triangle flag columns with one pass
+    over Arrow batches (mapInArrow), other columns are kept."""
+    schema = StructType(
+            [
+                *df.schema.fields,
+                StructField(area_col, DoubleType()),
+                StructField(right_col, BooleanType()),
+                ]
+            )
+    compute = partial(
+            figure_metrics_batches,
+            ftype=ftype,
+            params=params,
+            rel_tol=rel_tol,
+            area_col=area_col,
+            right_col=right_col,
+            )
+    return df.mapInArrow(compute, schema)
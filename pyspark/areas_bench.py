@@ -0,0 +1,91 @@
+"""Local mode benchmark: row-at-a-time python UDF against
+vectorized pandas_udf and mapInArrow figures UDFs (areas.py).
+
+Run: python pyspark/areas_bench.py [-n 2000000]
+"""
+import argparse
+import os
+import time
+from typing import Callable, Optional
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.types import DoubleType
+
+from figures import (
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        build_figure_spec,
+        calculate_figure_area,
+        )
+
+import areas
+
+
+_ARGS_CNT = {"circle": 1, "square": 1, "rectangle": 2, "triangle": 3}
+
+
+@F.udf(DoubleType())
+def row_area(
+        ftype: str,
+        p0: Optional[float],
+        p1: Optional[float],
+        p2: Optional[float],
+        ) -> Optional[float]:
+    """as it`s done now: one spec and one call per row."""
+    args = (p0, p1, p2)[:_ARGS_CNT.get(ftype, 0)]
+    try:
+        return calculate_figure_area(build_figure_spec(FigureType(ftype), *args))
+    except (ValueError, FigureSpecError, FigureTypeError, ImpossibleDimention):
+        return None
+
+
+def synthetic(spark: SparkSession, n: int) -> DataFrame:
+    types = F.array(*(F.lit(t) for t in _ARGS_CNT))
+    return spark.range(n).select(
+            F.element_at(types, (F.col("id") % 4 + 1).cast("int")).alias("ftype"),
+            (F.rand(1) * 10 + 1).alias("p0"),
+            (F.rand(2) * 10 + 1).alias("p1"),
+            (F.rand(3) * 10 + 1).alias("p2"),
+            )
+
+
+def timed(name: str, n: int, run: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    run()
+    spent = time.perf_counter() - start
+    print(f"{name:<24}{spent:>10.2f} s{n / spent:>16,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=2_000_000)
+    opts = parser.parse_args()
+
+    spark = (
+            SparkSession.builder
+            .master("local[*]")
+            .config("spark.sql.execution.arrow.pyspark.enabled", "true")
+            .getOrCreate()
+            )
+    spark.sparkContext.addPyFile(os.path.abspath(areas.__file__))
+    df = synthetic(spark, opts.n).cache()
+    df.count()
+
+    def total(frame: DataFrame) -> object:
+        return frame.agg(F.sum("area")).collect()
+
+    timed("row udf", opts.n, lambda: total(
+        df.withColumn("area", row_area("ftype", "p0", "p1", "p2")),
+        ))
+    timed("pandas_udf", opts.n, lambda: total(
+        df.withColumn("area", areas.figure_area("ftype", "p0", "p1", "p2")),
+        ))
+    timed("mapInArrow", opts.n, lambda: total(areas.with_figure_metrics(df)))
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Local mode benchmark of product/category job (main.py) on synthetic
+skewed relations: hot_share of relations belong to a few hot products.
+
+Compares old queries (full outer join and then left outer join, both
+are computed) with broadcast pairs, salted sort merge join and
+aggregated <product -> categories> output. Every result is computed
+once by noop sink.
+
+Run: python pyspark/join_bench.py [-n 5000000] [--products 100000]
+"""
+import argparse
+import time
+from typing import Callable
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+
+import main as job
+
+
+def synthetic(
+        spark: SparkSession,
+        n: int,
+        products: int,
+        *,
+        hot: int = 3,
+        hot_share: float = 0.5,
+        categories: int = 1000,
+        ) -> tuple[DataFrame, DataFrame]:
+    """products dimension and skewed relations."""
+    prod_df = spark.range(products).select(
+            F.concat(F.lit("prod"), F.col("id").cast("string")).alias("product"),
+            )
+    product_id = F.when(
+            F.rand(1) < hot_share, (F.rand(2) * hot).cast("long"),
+            ).otherwise((F.rand(3) * products).cast("long"))
+    relation_df = spark.range(n).select(
+            F.concat(F.lit("cat"), (F.rand(4) * categories).cast("long").cast("string")).alias("category"),
+            F.concat(F.lit("prod"), product_id.cast("string")).alias("product"),
+            )
+    return prod_df, relation_df
+
+
+def _noop(df: DataFrame) -> None:
+    df.write.format("noop").mode("overwrite").save()
+
+
+def timed(name: str, n: int, run: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    run()
+    spent = time.perf_counter() - start
+    print(f"{name:<28}{spent:>10.2f} s{n / spent:>16,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=5_000_000)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--salt-buckets", type=int, default=16)
+    opts = parser.parse_args()
+
+    spark = SparkSession.builder.master("local[*]").getOrCreate()
+    job.enable_skew_join(spark)
+    prod_df, relation_df = synthetic(spark, opts.n, opts.products)
+    # materialized, so generation isn`t a part of numbers
+    prod_df = prod_df.cache()
+    relation_df = relation_df.cache()
+    prod_df.count()
+    relation_df.count()
+
+    def old() -> None:
+        _noop(relation_df.join(prod_df, ["product"], how="fullouter"))
+        _noop(prod_df.join(relation_df, ["product"], how="leftouter"))
+
+    timed("old fullouter + leftouter", opts.n, old)
+    timed("broadcast pairs", opts.n, lambda: _noop(
+        job.product_categories(prod_df, relation_df),
+        ))
+    # sort merge join, broadcast is off to see salting effect
+    spark.conf.set("spark.sql.autoBroadcastJoinThreshold", "-1")
+    timed("sort merge pairs", opts.n, lambda: _noop(
+        job.product_categories(prod_df, relation_df, broadcast=False),
+        ))
+    timed("salted sort merge pairs", opts.n, lambda: _noop(
+        job.product_categories(
+            prod_df, relation_df, broadcast=False, salt_buckets=opts.salt_buckets,
+            ),
+        ))
+    spark.conf.unset("spark.sql.autoBroadcastJoinThreshold")
+    timed("categories sets", opts.n, lambda: _noop(
+        job.product_category_sets(prod_df, relation_df),
+        ))
+    timed("salted categories sets", opts.n, lambda: _noop(
+        job.product_category_sets(prod_df, relation_df, salt_buckets=opts.salt_buckets),
+        ))
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,217 @@
-from pyspark.sql import SparkSession
-
-
-spark = SparkSession.builder.getOrCreate()
-
-
-prod_df = spark.createDataFrame(
-        [
-            ("prod1", ),
-            ("prod2", ),
-            ("prod3", ),
-            ("prod4", ),
-            ],
-        schema="product string",
-        )
-
-
-relation_df = spark.createDataFrame(
-        [
-            ("A", "prod1", ),
-            ("B", "prod1", ),
-            ("C", "prod1", ),
-            ("A", "prod2", ),
-            ("A", "prod3", ),
-            ("B", "prod2", ),
-            ("C", "prod3", ),
-            ("D", "prod1", ),
-            ("D", "prod2", ),
-            ("D", "prod3", ),
-            ("E", "prod3", ),
-            ],
-        schema="category string, product string",
-        )
-
-
-def main() -> None:
-    """relation_fd implements <many-to-many> relation
-    between product and category, we can think about like:
-        <category FOREIGN_KEY category.name,
-        product FOREIGN_KEY prod_df.product>
-    so, this case (i think) we needn`t have implement
-    DF <category> because anyway we will use relation-table
-    (this task) to create final DF <product:category>.
-    I hope it`s right solution=)
-    """
-    relation_df.join(prod_df, ["product"], how="fullouter").show()
-
-    # or (result will be the same):
-    prod_df.join(relation_df, ["product"], how="leftouter").show()
+"""Product/category job.
+
+relation_df implements <many-to-many> relation between product
+and category, we can think about like:
+    <category FOREIGN_KEY category.name,
+    product FOREIGN_KEY prod_df.product>
+so we needn`t have DF <category>, relation-table is enough
+to create final DF <product:category> (or <product:categories>).
+
+Relations are big (hundreds of millions rows) and skewed (a few
+products have most of rows), products are a small dimension.
+So relations are never shuffled by product:
+    - pairs: relations are joined with broadcasted products,
+      products without categories are found by anti join
+      with distinct relation products (only product column
+      is read, distinct is partially done before shuffle);
+    - categories sets: relations are aggregated first (partial
+      aggregation before shuffle, optional salting of hot
+      products), result has a row per product.
+If products can`t be broadcasted, salt_buckets spreads hot
+products of sort merge join over buckets, AQE skew join
+(see enable_skew_join()) splits what remains skewed.
+
+Run:
+    python pyspark/main.py  # sample data
+    python pyspark/main.py --products p.parquet --relations r.parquet \
+            --output out.parquet [--aggregate] [--salt-buckets 16]
+"""
+import argparse
+from typing import Optional
+
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql import functions as F
+
+
+_PRODUCT = "product"
+_CATEGORY = "category"
+_CATEGORIES = "categories"
+_SALT = "_salt"
+
+
+def sample_frames(spark: SparkSession) -> tuple[DataFrame, DataFrame]:
+    """products and relations of the task."""
+    prod_df = spark.createDataFrame(
+            [
+                ("prod1", ),
+                ("prod2", ),
+                ("prod3", ),
+                ("prod4", ),
+                ],
+            schema="product string",
+            )
+    relation_df = spark.createDataFrame(
+            [
+                ("A", "prod1", ),
+                ("B", "prod1", ),
+                ("C", "prod1", ),
+                ("A", "prod2", ),
+                ("A", "prod3", ),
+                ("B", "prod2", ),
+                ("C", "prod3", ),
+                ("D", "prod1", ),
+                ("D", "prod2", ),
+                ("D", "prod3", ),
+                ("E", "prod3", ),
+                ],
+            schema="category string, product string",
+            )
+    return prod_df, relation_df
+
+
+def enable_skew_join(
+        spark: SparkSession,
+        *,
+        factor: int = 5,
+        threshold: str = "256MB",
+        ) -> None:
+    """AQE splits shuffle partitions which are bigger than factor
+    * median partition and threshold (sort merge joins only)."""
+    spark.conf.set("spark.sql.adaptive.enabled", "true")
+    spark.conf.set("spark.sql.adaptive.skewJoin.enabled", "true")
+    spark.conf.set("spark.sql.adaptive.skewJoin.skewedPartitionFactor", str(factor))
+    spark.conf.set("spark.sql.adaptive.skewJoin.skewedPartitionThresholdInBytes", threshold)
+
+
+def _salt(buckets: int) -> Column:
+    """salt by category hash: deterministic (task retries give
+    same buckets) and spreads rows of one product."""
+    return F.pmod(F.hash(_CATEGORY), F.lit(buckets))
+
+
+def _checked_buckets(salt_buckets: int) -> int:
+    if salt_buckets < 0:
+        raise ValueError("salt_buckets must be non-negative")
+    return salt_buckets
+
+
+def product_categories(
+        prod_df: DataFrame,
+        relation_df: DataFrame,
+        *,
+        broadcast: bool = True,
+        salt_buckets: int = 0,
+        ) -> DataFrame:
+    """<product, category> pairs for every product of prod_df,
+    products without categories get null category (as left
+    outer join of products and relations does). Relations of
+    unknown products are dropped.
+    broadcast=False is for products which don`t fit executors
+    memory, salt_buckets > 1 salts sort merge join then."""
+    buckets = _checked_buckets(salt_buckets)
+    products = prod_df.select(_PRODUCT)
+    relations = relation_df.select(_PRODUCT, _CATEGORY)
+    used = relations.select(_PRODUCT).distinct()
+    if broadcast:
+        pairs = relations.join(F.broadcast(products), _PRODUCT)
+        missing = products.join(F.broadcast(used), _PRODUCT, "left_anti")
+    elif buckets > 1:
+        salted = products.withColumn(
+                _SALT, F.explode(F.sequence(F.lit(0), F.lit(buckets - 1))),
+                )
+        pairs = (
+                relations.withColumn(_SALT, _salt(buckets))
+                .join(salted, [_PRODUCT, _SALT])
+                .drop(_SALT)
+                )
+        missing = products.join(used, _PRODUCT, "left_anti")
+    else:
+        pairs = relations.join(products, _PRODUCT)
+        missing = products.join(used, _PRODUCT, "left_anti")
+    return pairs.select(_PRODUCT, _CATEGORY).unionByName(
+            missing.select(_PRODUCT, F.lit(None).cast("string").alias(_CATEGORY)),
+            )
+
+
+def product_category_sets(
+        prod_df: DataFrame,
+        relation_df: DataFrame,
+        *,
+        salt_buckets: int = 0,
+        ) -> DataFrame:
+    """<product, categories> row for every product of prod_df,
+    categories is array of distinct categories (empty for products
+    without categories). Relations are scanned once and aggregated
+    before join, salt_buckets > 1 aggregates hot products in two
+    steps (by product and salt, then by product)."""
+    buckets = _checked_buckets(salt_buckets)
+    relations = relation_df.select(_PRODUCT, _CATEGORY)
+    if buckets > 1:
+        sets = (
+                relations.groupBy(_PRODUCT, _salt(buckets).alias(_SALT))
+                .agg(F.collect_set(_CATEGORY).alias(_CATEGORIES))
+                .groupBy(_PRODUCT)
+                .agg(F.array_distinct(F.flatten(F.collect_list(_CATEGORIES))).alias(_CATEGORIES))
+                )
+    else:
+        sets = relations.groupBy(_PRODUCT).agg(F.collect_set(_CATEGORY).alias(_CATEGORIES))
+    return prod_df.select(_PRODUCT).join(sets, _PRODUCT, "left").select(
+            _PRODUCT,
+            F.coalesce(_CATEGORIES, F.array().cast("array<string>")).alias(_CATEGORIES),
+            )
+
+
+def run_job(
+        spark: SparkSession,
+        prod_df: DataFrame,
+        relation_df: DataFrame,
+        *,
+        aggregate: bool = False,
+        broadcast: bool = True,
+        salt_buckets: int = 0,
+        output: Optional[str] = None,
+        ) -> DataFrame:
+    """build result once and write it to output (parquet) or show it."""
+    enable_skew_join(spark)
+    if aggregate:
+        result = product_category_sets(prod_df, relation_df, salt_buckets=salt_buckets)
+    else:
+        result = product_categories(
+                prod_df, relation_df, broadcast=broadcast, salt_buckets=salt_buckets,
+                )
+    if output is None:
+        result.orderBy(_PRODUCT).show(truncate=False)
+    else:
+        result.write.mode("overwrite").parquet(output)
+    return result
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", help="products parquet (sample data if not set)")
+    parser.add_argument("--relations", help="relations parquet")
+    parser.add_argument("--output", help="result parquet (show if not set)")
+    parser.add_argument("--aggregate", action="store_true", help="product -> categories")
+    parser.add_argument("--no-broadcast", action="store_true")
+    parser.add_argument("--salt-buckets", type=int, default=0)
+    opts = parser.parse_args(argv)
+    if (opts.products is None) != (opts.relations is None):
+        parser.error("--products and --relations are set together")
+
+    spark = SparkSession.builder.getOrCreate()
+    if opts.products is None:
+        prod_df, relation_df = sample_frames(spark)
+    else:
+        prod_df = spark.read.parquet(opts.products)
+        relation_df = spark.read.parquet(opts.relations)
+    run_job(
+            spark, prod_df, relation_df,
+            aggregate=opts.aggregate,
+            broadcast=not opts.no_broadcast,
+            salt_buckets=opts.salt_buckets,
+            output=opts.output,
+            )
+    spark.stop()
 
 
 if __name__ == "__main__":
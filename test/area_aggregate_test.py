@@ -0,0 +1,121 @@
+import math
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from figures import (
+        AreaAccumulator,
+        AreaAggregator,
+        FigureBatch,
+        FigureSpec,
+        FigureType,
+        aggregate_figure_areas,
+        calculate_figure_areas,
+        )
+
+_EDGES = (1.0, 10.0, 100.0)
+
+
+@pytest.fixture(scope="module")
+def specs() -> list[FigureSpec]:
+    rnd = random.Random(13)
+    out = []
+    for _ in range(3000):
+        ftype = rnd.choice(
+                (FigureType.CIRCLE, FigureType.SQUARE, FigureType.RECTANGLE, FigureType.TRIANGLE),
+                )
+        if ftype is FigureType.TRIANGLE:
+            a, b = rnd.uniform(0.1, 20.0), rnd.uniform(0.1, 20.0)
+            args: tuple[float, ...] = (a, b, abs(a - b) + min(a, b) * rnd.uniform(0.1, 1.9))
+        elif ftype is FigureType.RECTANGLE:
+            args = (rnd.uniform(1e-3, 1e3), rnd.uniform(1e-3, 1e3))
+        else:
+            args = (rnd.uniform(1e-3, 1e3), )
+        out.append(FigureSpec(ftype, args))
+    out.append(FigureSpec(FigureType.CIRCLE, (-1.0, )))
+    out.append(FigureSpec(FigureType.TRIANGLE, (1.0, 1.0, 5.0)))
+    out.append(FigureSpec(FigureType.SQUARE, (1.0, 2.0)))
+    return out
+
+
+def test_aggregate_matches_materialized(specs: list[FigureSpec]) -> None:
+    result = aggregate_figure_areas(specs, edges=_EDGES, chunk_size=256)
+    areas = calculate_figure_areas(specs[:-1])
+    types = np.array([s.ftype.value for s in specs[:-1]])
+    for ftype, summary in result.items():
+        expected = areas[(types == ftype.value) & ~np.isnan(areas)]
+        assert summary.count == len(expected)
+        assert summary.total == math.fsum(expected.tolist())
+        assert summary.min == expected.min()
+        assert summary.max == expected.max()
+        assert sum(summary.histogram) == summary.count
+        assert summary.histogram[0] == (expected < 1.0).sum()
+    assert result[FigureType.CIRCLE].errors == {"ImpossibleDimention": 1}
+    assert result[FigureType.TRIANGLE].errors == {"ImpossibleDimention": 1}
+    assert result[FigureType.SQUARE].errors == {"FigureSpecError": 1}
+
+
+def test_aggregate_sources_agree(specs: list[FigureSpec]) -> None:
+    valid = specs[:-1]
+    by_spec = AreaAggregator(_EDGES)
+    for spec in valid:
+        by_spec.add(spec)
+    by_batch = AreaAggregator(_EDGES).update(FigureBatch(valid))
+    assert by_spec.summary() == by_batch.summary()
+
+
+def test_aggregate_counts_bad_args(specs: list[FigureSpec]) -> None:
+    bad = [
+            FigureSpec(FigureType.CIRCLE, ("x", )),
+            FigureSpec(FigureType.TRIANGLE, (3.0, None, 5.0)),
+            ]
+    mixed = [*specs[:100], *bad, *specs[100:200]]
+    result = aggregate_figure_areas(mixed, chunk_size=64)
+    clean = aggregate_figure_areas(specs[:200], chunk_size=64)
+    assert {t: s.total for t, s in result.items()} == {t: s.total for t, s in clean.items()}
+    assert result[FigureType.CIRCLE].errors == {"FigureSpecError": 1}
+    assert result[FigureType.TRIANGLE].errors == {"FigureSpecError": 1}
+    by_spec = AreaAggregator()
+    for spec in mixed:
+        by_spec.add(spec)
+    assert by_spec.summary() == result
+
+
+def test_merge_is_exact(specs: list[FigureSpec]) -> None:
+    whole = aggregate_figure_areas(specs, edges=_EDGES)
+    parts = [AreaAggregator(_EDGES).update(specs[i::7]) for i in range(7)]
+    merged = AreaAggregator(_EDGES)
+    for part in reversed(parts):
+        merged.merge(pickle.loads(pickle.dumps(part)))
+    assert merged.summary() == whole
+
+
+def test_accumulator_sum_is_exact() -> None:
+    acc = AreaAccumulator()
+    values = [1e16, 1.0, -0.0, 1e-300, 3.0, 5e-324]
+    acc.add_areas(values[:3])
+    for v in values[3:]:
+        acc.add(v)
+    assert acc.total == math.fsum(values)
+    assert acc.mean == math.fsum(values) / len(values)
+
+
+def test_accumulator_errors_and_empty() -> None:
+    acc = AreaAccumulator((1.0, ))
+    acc.add_areas([math.nan, math.inf, 2.0])
+    summary = acc.summary()
+    assert summary.count == 1
+    assert summary.histogram == (0, 1)
+    assert summary.errors == {"ImpossibleDimention": 1, "OverflowError": 1}
+    empty = AreaAccumulator().summary()
+    assert empty.count == 0 and empty.total == 0.0
+    assert math.isnan(empty.mean) and math.isnan(empty.min)
+
+
+def test_accumulator_edges() -> None:
+    with pytest.raises(ValueError):
+        AreaAccumulator((2.0, 1.0))
+    with pytest.raises(ValueError):
+        AreaAccumulator((1.0, )).merge(AreaAccumulator((2.0, )))
@@ -0,0 +1,173 @@
+import threading
+from typing import Iterator
+
+import pytest
+
+from figures import (
+        FigureAreaCache,
+        FigureType,
+        ImpossibleDimention,
+        build_figure_spec,
+        calculate_circle_area,
+        calculate_figure_area,
+        calculate_square_area,
+        calculate_triangle_area,
+        disable_area_cache,
+        enable_area_cache,
+        get_area_cache,
+        is_triangle_right,
+        )
+
+
+@pytest.fixture(scope="function")
+def cache() -> Iterator[FigureAreaCache]:
+    yield enable_area_cache(maxsize=4)
+    disable_area_cache()
+
+
+def test_cache_off_by_default() -> None:
+    assert get_area_cache() is None
+
+
+def test_cache_hits_and_misses(cache: FigureAreaCache) -> None:
+    first = calculate_circle_area(2.0)
+    assert calculate_circle_area(2.0) == first
+    assert calculate_figure_area(build_figure_spec(FigureType.CIRCLE, 2.0)) == first
+    st = cache.stats()
+    assert (st.hits, st.misses, st.size) == (2, 1, 1)
+
+
+def test_cache_lru_eviction(cache: FigureAreaCache) -> None:
+    for side in (1.0, 2.0, 3.0, 4.0):
+        calculate_square_area(side)
+    calculate_square_area(1.0)
+    calculate_square_area(5.0)
+    assert cache.stats().evictions == 1
+    calculate_square_area(1.0)
+    assert cache.stats().hits == 2, "recently used entry evicted"
+    calculate_square_area(2.0)
+    assert cache.stats().misses == 6
+
+
+@pytest.mark.parametrize(
+        "policy, counters",
+        [("lru", (2, 3, 1)), ("fifo", (1, 4, 2))],
+        )
+def test_cache_policy_eviction(policy: str, counters: tuple[int, int, int]) -> None:
+    cache = FigureAreaCache(maxsize=2, policy=policy)
+    for key in ("a", "b", "a", "c", "a"):
+        assert cache.lookup(str.upper, key) == key.upper()
+    st = cache.stats()
+    assert (st.hits, st.misses, st.evictions) == counters
+
+
+@pytest.mark.parametrize("policy, size", [("lru", 0), ("fifo", 2)])
+def test_cache_resize_and_clear(policy: str, size: int) -> None:
+    cache = enable_area_cache(maxsize=4, policy=policy)
+    try:
+        for side in (1.0, 2.0, 3.0, 4.0, 1.0):
+            calculate_square_area(side)
+        cache.resize(2)
+        st = cache.stats()
+        assert (st.size, st.maxsize, st.evictions) == (size, 2, 4 - size)
+        for side in (5.0, 6.0, 7.0):
+            calculate_square_area(side)
+        assert cache.stats().evictions == 5
+        cache.clear(stats=False)
+        st = cache.stats()
+        assert (st.size, st.hits, st.misses, st.evictions) == (0, 1, 7, 5)
+        cache.clear()
+        st = cache.stats()
+        assert (st.size, st.hits, st.misses, st.evictions) == (0, 0, 0, 0)
+    finally:
+        disable_area_cache()
+
+
+def test_cache_lru_grows_warm() -> None:
+    calls: list[str] = []
+
+    def upper(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    cache = FigureAreaCache(maxsize=3)
+    old_lookup = cache.lookup
+    for key in "abc":
+        cache.lookup(upper, key)
+    cache.resize(5)
+    st = cache.stats()
+    assert (st.size, st.maxsize, st.hits, st.misses, st.evictions) == (3, 5, 0, 3, 0)
+    assert [cache.lookup(upper, key) for key in "ab"] == ["A", "B"]
+    assert calls == list("abc"), "entries of old cache are calculated again"
+    for key in "de":
+        cache.lookup(upper, key)
+    st = cache.stats()
+    assert (st.size, st.hits, st.misses, st.evictions) == (5, 2, 5, 0)
+    # cache is full, not used entry <c> of old cache is evicted
+    cache.lookup(upper, "f")
+    st = cache.stats()
+    assert (st.size, st.hits, st.misses, st.evictions) == (5, 2, 6, 1)
+    cache.lookup(upper, "c")
+    assert calls == list("abcdefc")
+    st = cache.stats()
+    assert (st.size, st.hits, st.misses, st.evictions) == (5, 2, 7, 2)
+    # lookup taken before resize still works
+    assert old_lookup(upper, "z") == "Z"
+
+
+class _Unhashable(float):
+    __hash__ = None  # type: ignore[assignment]
+
+
+@pytest.mark.parametrize("policy", ["lru", "fifo"])
+def test_cache_unhashable_args_not_cached(policy: str) -> None:
+    cache = enable_area_cache(maxsize=4, policy=policy)
+    try:
+        side = _Unhashable(3.0)
+        assert calculate_square_area(side) == 9.0
+        spec = build_figure_spec(FigureType.TRIANGLE, 3.0, 4.0, side)
+        assert calculate_figure_area(spec) == calculate_triangle_area(3.0, 4.0, 3.0)
+        assert is_triangle_right(3.0, 4.0, side, rel_tolerance=1e-3) is False
+        assert len(cache) == 1
+    finally:
+        disable_area_cache()
+
+
+def test_cache_invalid_params() -> None:
+    with pytest.raises(ValueError):
+        FigureAreaCache(maxsize=0)
+    with pytest.raises(ValueError):
+        FigureAreaCache(policy="mru")
+
+
+def test_cache_errors_not_cached(cache: FigureAreaCache) -> None:
+    for _ in range(2):
+        with pytest.raises(ImpossibleDimention):
+            calculate_circle_area(-1.0)
+    assert len(cache) == 0
+
+
+def test_cache_triangle_tolerance_in_key(cache: FigureAreaCache) -> None:
+    args = (2.0, 2.0, 2.9)
+    assert is_triangle_right(*args, rel_tolerance=1e-1) is True
+    assert is_triangle_right(*args, rel_tolerance=1e-3) is False
+    calculate_triangle_area(*args)
+    assert cache.stats().size == 3
+
+
+@pytest.mark.parametrize("policy", ["lru", "fifo"])
+def test_cache_thread_safe(policy: str) -> None:
+    cache = FigureAreaCache(maxsize=8, policy=policy)
+
+    def worker() -> None:
+        for i in range(1000):
+            assert cache.lookup(float, i % 16) == i % 16
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    st = cache.stats()
+    assert st.hits + st.misses == 4000
+    assert st.size == 8
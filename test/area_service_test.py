@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from figures import (
+        AreaService,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        ImpossibleDimention,
+        build_figure_spec,
+        calculate_figure_area,
+        )
+
+
+def _specs(n: int) -> list[FigureSpec]:
+    return [
+            build_figure_spec(FigureType.RECTANGLE, float(i + 1), 2.0)
+            for i in range(n)
+            ]
+
+
+def test_service_areas() -> None:
+    specs = _specs(100)
+
+    async def run() -> list[float]:
+        async with AreaService(max_batch=16) as service:
+            return await asyncio.gather(*(service.area(s) for s in specs))
+
+    assert asyncio.run(run()) == [calculate_figure_area(s) for s in specs]
+
+
+def test_service_merges_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    sizes: list[int] = []
+    calculate = AreaService._calculate
+
+    def counted(items: list) -> None:
+        sizes.append(len(items))
+        calculate(items)
+
+    monkeypatch.setattr(AreaService, "_calculate", staticmethod(counted))
+
+    async def run() -> None:
+        async with AreaService(max_batch=32, max_delay=0.05) as service:
+            await asyncio.gather(*(service.area(s) for s in _specs(100)))
+
+    asyncio.run(run())
+    assert sum(sizes) == 100
+    assert max(sizes) <= 32
+    assert len(sizes) <= 5
+
+
+def test_service_errors_per_request() -> None:
+    specs = [
+            build_figure_spec(FigureType.CIRCLE, 1.0),
+            FigureSpec(FigureType.CIRCLE, (-1.0, )),
+            FigureSpec(FigureType.RECTANGLE, (1.0, )),
+            build_figure_spec(FigureType.TRIANGLE, 1.0, 1.0, 5.0),
+            ]
+
+    async def run() -> list:
+        async with AreaService() as service:
+            return await asyncio.gather(
+                    *(service.area(s) for s in specs),
+                    return_exceptions=True,
+                    )
+
+    res = asyncio.run(run())
+    assert res[0] == pytest.approx(3.14, 1e-2)
+    assert isinstance(res[1], ImpossibleDimention)
+    assert isinstance(res[2], FigureSpecError)
+    assert isinstance(res[3], ImpossibleDimention)
+
+
+def test_service_bad_args_next_to_good() -> None:
+    specs = _specs(3)
+    bad = FigureSpec(FigureType.CIRCLE, ("x", ))
+
+    async def run() -> tuple[list, list[float]]:
+        async with AreaService() as service:
+            res = await asyncio.gather(
+                    service.area(specs[0]), service.area(bad), service.area(specs[1]),
+                    return_exceptions=True,
+                    )
+            # worker is alive after bad spec
+            return res, [await service.area(specs[2])]
+
+    res, after = asyncio.run(asyncio.wait_for(run(), 5.0))
+    assert res[0] == calculate_figure_area(specs[0])
+    assert isinstance(res[1], FigureSpecError)
+    assert res[2] == calculate_figure_area(specs[1])
+    assert after == [calculate_figure_area(specs[2])]
+
+
+def test_service_survives_batch_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    calculate = AreaService._calculate
+    calls: list[int] = []
+
+    def failing_once(items: list) -> None:
+        calls.append(len(items))
+        if len(calls) == 1:
+            raise RuntimeError("broken batch")
+        calculate(items)
+
+    monkeypatch.setattr(AreaService, "_calculate", staticmethod(failing_once))
+
+    async def run() -> tuple[object, float]:
+        async with AreaService() as service:
+            first = await asyncio.gather(service.area(_specs(1)[0]), return_exceptions=True)
+            return first[0], await service.area(_specs(2)[1])
+
+    first, second = asyncio.run(asyncio.wait_for(run(), 5.0))
+    assert isinstance(first, RuntimeError)
+    assert second == 4.0
+
+
+def test_service_backpressure() -> None:
+    specs = _specs(50)
+
+    async def run() -> list[float]:
+        async with AreaService(max_batch=4, max_queue=2) as service:
+            return await asyncio.gather(*(service.area(s) for s in specs))
+
+    assert asyncio.run(run()) == [calculate_figure_area(s) for s in specs]
+
+
+def test_service_close() -> None:
+    async def run() -> None:
+        service = AreaService(max_delay=10.0)
+        await service.start()
+        task = asyncio.ensure_future(service.area(_specs(1)[0]))
+        await asyncio.sleep(0)
+        await service.close()
+        # queued request is calculated, no need to wait for window
+        assert task.result() == 2.0
+        with pytest.raises(RuntimeError):
+            await service.area(_specs(1)[0])
+
+    asyncio.run(asyncio.wait_for(run(), 5.0))
+
+
+def test_service_not_started() -> None:
+    with pytest.raises(RuntimeError):
+        asyncio.run(AreaService().area(_specs(1)[0]))
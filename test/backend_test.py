@@ -0,0 +1,167 @@
+import math
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import figures as figures_mod
+from figures import backends
+from figures import (
+        AreaBackend,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        available_backends,
+        compute_figure_areas,
+        get_backend,
+        register_backend,
+        set_backend,
+        )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def default_backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv("FIGURES_BACKEND", raising=False)
+    yield
+    set_backend(None)
+
+
+@pytest.fixture(scope="module")
+def specs() -> list[FigureSpec]:
+    return [
+            FigureSpec(FigureType.CIRCLE, (1.5, )),
+            FigureSpec(FigureType.TRIANGLE, (3.0, 4.0, 5.0)),
+            FigureSpec(FigureType.TRIANGLE, (1.0, 1.0, 5.0)),
+            FigureSpec(FigureType.SQUARE, (-2.0, )),
+            FigureSpec(FigureType.SQUARE, (1.0, 2.0)),
+            FigureSpec(FigureType.RECTANGLE, (2.0, 3.5)),
+            ]
+
+
+def _run(code: str) -> str:
+    # figures is a package, run from its parent dir
+    path = os.path.dirname(os.path.dirname(os.path.abspath(figures_mod.__file__)))
+    env = dict(os.environ, PYTHONPATH=path)
+    env.pop("FIGURES_BACKEND", None)
+    return subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=path, env=env, check=True, capture_output=True, text=True,
+            ).stdout.strip()
+
+
+def test_import_is_light() -> None:
+    heavy = ("numpy", "pandas", "pyarrow", "asyncio", "concurrent.futures")
+    code = f"import sys, figures; print([m for m in {heavy!r} if m in sys.modules])"
+    assert _run(code) == "[]"
+
+
+def test_features_import_lazily() -> None:
+    code = (
+            "import sys, figures\n"
+            "print(*sorted(m for m in sys.modules if m.startswith('figures.')))\n"
+            "figures.FigureBatch\n"
+            "print('figures.batch' in sys.modules, 'figures.io' in sys.modules)\n"
+            )
+    assert _run(code).split() == ["figures.core", "True", "False"]
+
+
+def test_unknown_name() -> None:
+    with pytest.raises(AttributeError):
+        figures_mod.no_such_name
+
+
+def test_backend_imports_lazily() -> None:
+    code = (
+            "import sys, figures\n"
+            "figures.compute_figure_areas([figures.FigureSpec(figures.FigureType.SQUARE, (2.0, ))])\n"
+            "print('numpy' in sys.modules)\n"
+            "figures.get_backend('numpy')\n"
+            "print('numpy' in sys.modules, 'pandas' in sys.modules)\n"
+            )
+    assert _run(code).split() == ["False", "True", "False"]
+
+
+def test_backends_agree(specs: list[FigureSpec]) -> None:
+    expected = compute_figure_areas(specs, backend="numpy")
+    assert isinstance(expected, np.ndarray)
+    py_areas = compute_figure_areas(specs)
+    assert isinstance(py_areas, list)
+    np.testing.assert_allclose(py_areas, expected)
+    assert [math.isnan(a) for a in py_areas] == [False, False, True, True, True, False]
+    series = compute_figure_areas(iter(specs), backend="pandas")
+    assert isinstance(series, pd.Series)
+    np.testing.assert_allclose(series.to_numpy(), expected)
+
+
+def test_backends_agree_bad_args(specs: list[FigureSpec]) -> None:
+    specs = [
+            *specs,
+            FigureSpec(FigureType.CIRCLE, ("2.0", )),
+            FigureSpec(FigureType.TRIANGLE, (3.0, None, 5.0)),
+            FigureSpec(FigureType.POLYGON, (0.0, 0.0, 4.0, "x", 0.0, 3.0)),
+            ]
+    expected = compute_figure_areas(specs, backend="numpy")
+    for name in ("python", "pandas"):
+        np.testing.assert_array_equal(
+                np.asarray(compute_figure_areas(specs, backend=name)), expected,
+                )
+    assert np.isnan(expected[-3:]).all()
+
+
+def test_backend_areas() -> None:
+    sides = pd.Series([1.0, -1.0, 3.0], index=["a", "b", "c"])
+    res = get_backend("pandas").areas(FigureType.SQUARE, sides)
+    assert list(res.index) == ["a", "b", "c"]
+    np.testing.assert_allclose(res.to_numpy(), [1.0, np.nan, 9.0])
+    assert get_backend("python").areas(FigureType.RECTANGLE, [2.0, 0.0], [3.0, 1.0])[0] == 6.0
+    for name in ("python", "numpy"):
+        with pytest.raises(FigureSpecError):
+            get_backend(name).areas(FigureType.RECTANGLE, [2.0])
+        with pytest.raises(FigureTypeError):
+            get_backend(name).areas("hexagon", [2.0])  # type: ignore[arg-type]
+
+
+def test_backend_choice(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_backend().name == "python"
+    monkeypatch.setenv("FIGURES_BACKEND", "numpy")
+    assert get_backend().name == "numpy"
+    set_backend("pandas")
+    assert get_backend().name == "pandas"
+    assert get_backend("python").name == "python"
+    with pytest.raises(ValueError):
+        set_backend("fortran")
+    with pytest.raises(ValueError):
+        get_backend("fortran")
+
+
+def test_register_backend() -> None:
+    created: list[int] = []
+
+    class ConstBackend(AreaBackend):
+        __slots__ = ()
+        name = "const"
+
+        def __init__(self) -> None:
+            created.append(1)
+
+        def areas(self, ftype: FigureType, /, *columns: object) -> list[float]:
+            return [1.0]
+
+        def figure_areas(self, specs: object) -> list[float]:
+            return [1.0]
+
+    register_backend("const", ConstBackend)
+    try:
+        assert "const" in available_backends()
+        assert created == []
+        assert compute_figure_areas([], backend="const") == [1.0]
+        get_backend("const")
+        assert created == [1]
+    finally:
+        backends._backend_factories.pop("const")
+        backends._backends.pop("const")
@@ -0,0 +1,102 @@
+import math
+
+import numpy as np
+import pytest
+
+from figures import (
+        FigureSpec,
+        FigureType,
+        FigureSpecError,
+        FigureTypeError,
+        args_valid_mask,
+        build_figure_spec,
+        calculate_areas,
+        calculate_figure_area,
+        calculate_figure_areas,
+        )
+
+
+def test_circle_areas_calc_correct() -> None:
+    areas = calculate_areas(FigureType.CIRCLE, [1.0, 2.0, 3.5])
+    assert areas.dtype == np.float64
+    assert areas == pytest.approx([math.pi, 12.56, 38.48], 1e-2)
+
+
+def test_square_areas_calc_correct() -> None:
+    assert calculate_areas(FigureType.SQUARE, [2.0, 3.0]) == pytest.approx([4.0, 9.0])
+
+
+def test_rectangle_areas_broadcast_scalar() -> None:
+    areas = calculate_areas(FigureType.RECTANGLE, [1.0, 2.0], 3.0)
+    assert areas == pytest.approx([3.0, 6.0])
+
+
+def test_triangle_areas_same_as_scalar() -> None:
+    sides = [(2.0, 2.0, 2.8283), (4.0, 6.5, 7.6321), (3.0, 3.0, 3.0)]
+    areas = calculate_areas(FigureType.TRIANGLE, *np.array(sides).T)
+    expected = [
+            calculate_figure_area(build_figure_spec(FigureType.TRIANGLE, *s))
+            for s in sides
+            ]
+    assert areas.tolist() == expected
+
+
+def test_invalid_rows_masked_by_nan() -> None:
+    areas = calculate_areas(FigureType.CIRCLE, [1.0, 0.0, -2.0, np.nan])
+    assert np.isnan(areas).tolist() == [False, True, True, True]
+
+
+def test_impossible_triangle_masked() -> None:
+    a, b, c = [1.0, 2.0, 1.0], [1.0, 2.0, -1.0], [5.0, 2.0, 1.0]
+    mask = args_valid_mask(FigureType.TRIANGLE, a, b, c)
+    assert mask.tolist() == [False, True, False]
+    assert np.isnan(calculate_areas(FigureType.TRIANGLE, a, b, c)[[0, 2]]).all()
+
+
+def test_calculate_areas_raises_fte() -> None:
+    with pytest.raises(FigureTypeError):
+        calculate_areas("any", [1.0])
+
+
+def test_calculate_areas_raises_fse_args_cnt() -> None:
+    with pytest.raises(FigureSpecError):
+        calculate_areas(FigureType.RECTANGLE, [1.0])
+
+
+def test_figure_areas_keep_order(
+        circ_spec: FigureSpec,
+        triangle_spec: FigureSpec,
+        square_spec: FigureSpec,
+        rectangle_spec: FigureSpec,
+        ) -> None:
+    specs = [square_spec, circ_spec, rectangle_spec, triangle_spec, circ_spec]
+    areas = calculate_figure_areas(specs)
+    assert areas.tolist() == [calculate_figure_area(s) for s in specs]
+
+
+def test_figure_areas_mark_broken_specs() -> None:
+    specs = [
+            FigureSpec(FigureType.CIRCLE, (-1.0, )),
+            FigureSpec(FigureType.RECTANGLE, (1.0, )),
+            FigureSpec(FigureType.SQUARE, (2.0, )),
+            ]
+    areas = calculate_figure_areas(specs)
+    assert np.isnan(areas).tolist() == [True, True, False]
+
+
+def test_figure_areas_bad_args_nan() -> None:
+    specs = [
+            FigureSpec(FigureType.CIRCLE, ("x", )),
+            FigureSpec(FigureType.SQUARE, (2.0, )),
+            FigureSpec(FigureType.TRIANGLE, (3.0, None, 5.0)),
+            FigureSpec(FigureType.POLYGON, (0.0, 0.0, 4.0, "0", 0.0, 3.0)),
+            FigureSpec(FigureType.POLYGON, (0.0, 0.0, 4.0, 0.0, 0.0, 3.0)),
+            FigureSpec(FigureType.CIRCLE, (1.0, )),
+            ]
+    areas = calculate_figure_areas(specs)
+    assert np.isnan(areas).tolist() == [True, False, True, True, False, False]
+    assert areas[[1, 4, 5]].tolist() == [calculate_figure_area(specs[i]) for i in (1, 4, 5)]
+
+
+def test_figure_areas_empty() -> None:
+    assert calculate_figure_areas([]).shape == (0, )
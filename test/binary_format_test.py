@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from figures import (
+        FigureBatch,
+        FigureRecords,
+        FigureSpec,
+        FigureType,
+        build_figure_spec,
+        calculate_figure_areas,
+        read_figures_binary,
+        write_figures_binary,
+        )
+
+
+@pytest.fixture(scope="function")
+def specs() -> list[FigureSpec]:
+    return [
+            build_figure_spec(FigureType.SQUARE, 1.5),
+            build_figure_spec(FigureType.CIRCLE, 2.5),
+            build_figure_spec(FigureType.RECTANGLE, 2.5, 3.8),
+            build_figure_spec(FigureType.TRIANGLE, 2.0, 2.0, 2.8283),
+            build_figure_spec(FigureType.CIRCLE, 1.0),
+            ]
+
+
+@pytest.mark.parametrize("as_batch", (False, True))
+def test_binary_roundtrip(tmp_path: Path, specs: list[FigureSpec], as_batch: bool) -> None:
+    path = tmp_path / "figures.bin"
+    src = FigureBatch(specs) if as_batch else iter(specs)
+    assert write_figures_binary(path, src) == len(specs)
+    records = read_figures_binary(path)
+    assert len(records) == len(specs)
+    assert list(records) == specs
+    assert records[1:3][0] == specs[1]
+    assert path.stat().st_size == 16 + 32 * len(specs)
+
+
+def test_binary_records_are_mapped(tmp_path: Path, specs: list[FigureSpec]) -> None:
+    path = tmp_path / "figures.bin"
+    write_figures_binary(path, specs)
+    records = read_figures_binary(path)
+    assert isinstance(records.params.base, np.memmap) or isinstance(records.params, np.memmap)
+    assert records.params.shape == (len(specs), 3)
+    assert not records.params.flags.writeable
+    assert np.isnan(records.params[0, 1:]).all()
+    assert records.codes.tolist() == [FigureBatch.type_code(s.ftype) for s in specs]
+
+
+def test_binary_records_areas(tmp_path: Path, specs: list[FigureSpec]) -> None:
+    path = tmp_path / "figures.bin"
+    write_figures_binary(path, specs)
+    records = read_figures_binary(path)
+    assert isinstance(records, FigureRecords)
+    np.testing.assert_array_equal(
+            calculate_figure_areas(records),
+            calculate_figure_areas(specs),
+            )
+
+
+def test_binary_invalid_rows_get_nan(tmp_path: Path) -> None:
+    path = tmp_path / "figures.bin"
+    write_figures_binary(
+            path,
+            [
+                FigureSpec(FigureType.CIRCLE, (-1.0, )),
+                FigureSpec(FigureType.TRIANGLE, (1.0, 1.0, 5.0)),
+                FigureSpec(FigureType.SQUARE, (2.0, )),
+                ],
+            )
+    areas = calculate_figure_areas(read_figures_binary(path))
+    assert np.isnan(areas[:2]).all()
+    assert areas[2] == 4.0
+
+
+def test_binary_empty(tmp_path: Path) -> None:
+    path = tmp_path / "figures.bin"
+    assert write_figures_binary(path, []) == 0
+    records = read_figures_binary(path)
+    assert len(records) == 0
+    assert len(calculate_figure_areas(records)) == 0
+
+
+def test_binary_bad_file(tmp_path: Path, specs: list[FigureSpec]) -> None:
+    path = tmp_path / "figures.bin"
+    path.write_bytes(b"not a figures file at all")
+    with pytest.raises(ValueError):
+        read_figures_binary(path)
+    write_figures_binary(path, specs)
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        read_figures_binary(path)
@@ -16,8 +16,10 @@ class MockFigType(str, Enum):
 
 @pytest.fixture(scope="function")
 def inv_spec(circ_spec: FigureSpec) -> FigureSpec:
-    circ_spec.ftype = MockFigType.ANY
-    return circ_spec
+    """spec is frozen, so bypass it to get unknown type."""
+    spec = FigureSpec(circ_spec.ftype, circ_spec.args)
+    object.__setattr__(spec, "ftype", MockFigType.ANY)
+    return spec
 
 
 def test_area_calculated_by_spec(circ_spec: FigureSpec) -> None:
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from figures import (
+        FigureSpecError,
+        FigureType,
+        build_figure_spec,
+        calculate_column_areas,
+        calculate_figure_area,
+        column_triangles_right,
+        )
+
+
+FTYPES = np.array(["circle", "triangle", "square", "rectangle", "hexagon", "triangle"])
+P0 = [1.0, 2.0, 3.0, 3.0, 1.0, 1.0]
+P1 = [np.nan, 2.0, np.nan, 4.0, 1.0, 1.0]
+P2 = [np.nan, 2.8283, np.nan, np.nan, 1.0, 5.0]
+
+
+def test_column_areas() -> None:
+    areas = calculate_column_areas(FTYPES, P0, P1, P2)
+    expected = [
+            calculate_figure_area(build_figure_spec(FigureType(t), *args))
+            for t, args in (
+                ("circle", (1.0, )),
+                ("triangle", (2.0, 2.0, 2.8283)),
+                ("square", (3.0, )),
+                ("rectangle", (3.0, 4.0)),
+                )
+            ]
+    assert areas[:4].tolist() == expected
+    assert np.isnan(areas[4:]).all(), "unknown type or impossible triangle"
+
+
+def test_column_areas_accept_enum_values() -> None:
+    ftypes = np.array([FigureType.SQUARE, FigureType.CIRCLE], dtype=object)
+    assert calculate_column_areas(ftypes, [2.0, 1.0]) == pytest.approx([4.0, np.pi])
+
+
+def test_column_areas_not_enough_params() -> None:
+    with pytest.raises(FigureSpecError):
+        calculate_column_areas(FTYPES, P0, P1)
+
+
+def test_column_triangles_right() -> None:
+    right = column_triangles_right(FTYPES, P0, P1, P2, rel_tol=1e-2)
+    assert right.tolist() == [False, True, False, False, False, False]
+
+
+def test_column_triangles_right_per_row_tol() -> None:
+    tol = [0.0, 1e-9, 0.0, 0.0, 0.0, 0.0]
+    right = column_triangles_right(FTYPES, P0, P1, P2, rel_tol=tol)
+    assert right.tolist() == [False] * 6
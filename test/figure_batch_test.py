@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from figures import (
+        FigureBatch,
+        FigureSpec,
+        FigureType,
+        FigureSpecError,
+        FigureTypeError,
+        build_figure_spec,
+        calculate_figure_area,
+        calculate_figure_areas,
+        )
+
+
+@pytest.fixture(scope="function")
+def specs() -> list[FigureSpec]:
+    return [
+            build_figure_spec(FigureType.SQUARE, 1.5),
+            build_figure_spec(FigureType.CIRCLE, 2.5),
+            build_figure_spec(FigureType.RECTANGLE, 2.5, 3.8),
+            build_figure_spec(FigureType.TRIANGLE, 2.0, 2.0, 2.8283),
+            build_figure_spec(FigureType.CIRCLE, 1.0),
+            build_figure_spec(FigureType.SQUARE, 3.0),
+            ]
+
+
+def test_batch_roundtrip(specs: list[FigureSpec]) -> None:
+    batch = FigureBatch.from_specs(specs)
+    assert len(batch) == len(specs)
+    assert batch.to_specs() == specs
+
+
+def test_batch_getitem(specs: list[FigureSpec]) -> None:
+    batch = FigureBatch(specs)
+    assert batch[4] == specs[4]
+    assert batch[-1] == specs[-1]
+    with pytest.raises(IndexError):
+        batch[len(specs)]
+
+
+@pytest.mark.parametrize(
+        "slc",
+        [
+            slice(1, 4),
+            slice(None, 2),
+            slice(3, None),
+            slice(None, None, 2),
+            slice(None, None, -1),
+            slice(5, 1),
+            ]
+        )
+def test_batch_slice(specs: list[FigureSpec], slc: slice) -> None:
+    batch = FigureBatch(specs)
+    assert batch[slc].to_specs() == specs[slc]
+
+
+def test_batch_extend_by_batch(specs: list[FigureSpec]) -> None:
+    batch = FigureBatch(specs[:3])
+    batch.extend(FigureBatch(specs[3:]))
+    assert batch == FigureBatch(specs)
+
+
+def test_batch_extend_by_self(specs: list[FigureSpec]) -> None:
+    polygon = build_figure_spec(FigureType.POLYGON, 0.0, 0.0, 4.0, 0.0, 0.0, 3.0)
+    specs = [*specs, polygon]
+    batch = FigureBatch(specs)
+    batch.extend(batch)
+    assert batch.to_specs() == specs * 2
+    assert batch.offsets(FigureType.POLYGON).tolist() == [0, 6, 12]
+
+
+def test_batch_from_columns(specs: list[FigureSpec]) -> None:
+    polygon = build_figure_spec(FigureType.POLYGON, 0.0, 0.0, 4.0, 0.0, 0.0, 3.0)
+    batch = FigureBatch([*specs, polygon])
+    params = {ftype: batch.params(ftype) for ftype in FigureType}
+    ends = {FigureType.POLYGON: batch.offsets(FigureType.POLYGON)[1:]}
+    codes = batch.type_codes()
+    assert FigureBatch._from_columns(codes, params, ends) == batch
+    del params[FigureType.RECTANGLE]
+    with pytest.raises(ValueError):
+        FigureBatch._from_columns(codes, params, ends)
+    with pytest.raises(ValueError):
+        FigureBatch._from_columns(codes[:-1], {}, {})
+    with pytest.raises(FigureTypeError):
+        FigureBatch._from_columns(codes[:0], {}, {FigureType.CIRCLE: ends[FigureType.POLYGON][:0]})
+
+
+def test_batch_params_by_type(specs: list[FigureSpec]) -> None:
+    batch = FigureBatch(specs)
+    assert batch.count(FigureType.CIRCLE) == 2
+    assert batch.params(FigureType.CIRCLE).tolist() == [[2.5], [1.0]]
+    assert batch.params(FigureType.RECTANGLE).shape == (1, 2)
+    code = FigureBatch.type_code(FigureType.SQUARE)
+    assert np.flatnonzero(batch.type_codes() == code).tolist() == [0, 5]
+
+
+def test_batch_append_figure_raises() -> None:
+    batch = FigureBatch()
+    with pytest.raises(FigureTypeError):
+        batch.append_figure("any", 1.0)
+    with pytest.raises(FigureSpecError):
+        batch.append_figure(FigureType.TRIANGLE, 1.0, 2.0)
+    assert len(batch) == 0
+
+
+def test_batch_failed_append_keeps_batch(specs: list[FigureSpec]) -> None:
+    batch = FigureBatch(specs[:3])
+    with pytest.raises(FigureSpecError):
+        batch.append_figure(FigureType.TRIANGLE, 3.0, "x", 5.0)
+    with pytest.raises(FigureSpecError):
+        batch.append_figure(FigureType.CIRCLE, 10 ** 400)
+    batch.extend(specs[3:])
+    assert batch.to_specs() == specs
+    assert calculate_figure_areas(batch).tolist() == [calculate_figure_area(s) for s in specs]
+
+
+@pytest.mark.parametrize("view", ["codes", "params"])
+def test_batch_append_with_live_view(specs: list[FigureSpec], view: str) -> None:
+    batch = FigureBatch(specs)
+    held = batch.type_codes() if view == "codes" else batch.params(FigureType.CIRCLE)
+    with pytest.raises(BufferError):
+        batch.append_figure(FigureType.CIRCLE, 4.0)
+    with pytest.raises(BufferError):
+        batch.append(specs[1])
+    del held
+    assert batch.to_specs() == specs
+    assert calculate_figure_areas(batch).tolist() == [calculate_figure_area(s) for s in specs]
+
+
+@pytest.mark.parametrize("size", [1, 2, 4, 6, 100])
+def test_batch_chunks(specs: list[FigureSpec], size: int) -> None:
+    polygon = build_figure_spec(FigureType.POLYGON, 0.0, 0.0, 4.0, 0.0, 0.0, 3.0)
+    specs = [*specs, polygon, *specs[:3], polygon]
+    chunks = list(FigureBatch(specs).chunks(size))
+    assert [len(c) for c in chunks[:-1]] == [size] * (len(chunks) - 1)
+    assert [s for c in chunks for s in c] == specs
+    for start, chunk in zip(range(0, len(specs), size), chunks):
+        assert chunk == FigureBatch(specs)[start:start + size]
+
+
+def test_batch_chunks_bad_size(specs: list[FigureSpec]) -> None:
+    with pytest.raises(ValueError):
+        list(FigureBatch(specs).chunks(0))
+
+
+def test_batch_areas_same_as_specs(specs: list[FigureSpec]) -> None:
+    areas = calculate_figure_areas(FigureBatch(specs))
+    assert areas.tolist() == [calculate_figure_area(s) for s in specs]
+
+
+def test_batch_areas_invalid_dims_nan() -> None:
+    batch = FigureBatch()
+    batch.append_figure(FigureType.CIRCLE, -1.0)
+    batch.append_figure(FigureType.SQUARE, 2.0)
+    assert np.isnan(calculate_figure_areas(batch)).tolist() == [True, False]
+
+
+def test_batch_memory_close_to_params(specs: list[FigureSpec]) -> None:
+    batch = FigureBatch(specs * 1000)
+    params_bytes = sum(len(s.args) for s in specs) * 1000 * 8
+    assert batch.nbytes == params_bytes + len(batch)
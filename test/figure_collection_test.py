@@ -0,0 +1,128 @@
+import math
+import random
+
+import pytest
+
+from figures import (
+        Base2DFigure,
+        Circle,
+        FigureCollection,
+        FigureType,
+        FigureTypeError,
+        Rectangle,
+        Square,
+        Triangle,
+        )
+
+
+class _Probe(Square):
+    """remembers area() calls."""
+
+    __slots__ = ()
+    calls: list[float] = []
+
+    def area(self) -> float:
+        self.calls.append(self._side)
+        return super().area()
+
+
+class _Hexagon(Base2DFigure):
+
+    __slots__ = ()
+
+    def area(self) -> float:
+        return 1.0
+
+    def perimeter(self) -> float:
+        return 6.0
+
+
+@pytest.fixture(scope="function")
+def figures() -> list[Base2DFigure]:
+    rnd = random.Random(16)
+    out: list[Base2DFigure] = []
+    for _ in range(300):
+        out.append(Circle(rnd.uniform(0.1, 10.0)))
+        out.append(Rectangle(rnd.uniform(0.1, 10.0), rnd.uniform(0.1, 1e6)))
+        out.append(Triangle(3.0, 4.0, rnd.uniform(1.5, 6.5)))
+    return out
+
+
+def test_collection_totals(figures: list[Base2DFigure]) -> None:
+    coll = FigureCollection(figures)
+    assert len(coll) == len(figures)
+    assert coll.total_area() == math.fsum(f.area() for f in figures)
+    circles = [f.area() for f in figures if isinstance(f, Circle)]
+    assert coll.total_area(FigureType.CIRCLE) == math.fsum(circles)
+    assert coll.count(FigureType.CIRCLE) == len(circles)
+    assert coll.total_area(FigureType.SQUARE) == 0.0
+    assert set(coll.totals()) == {FigureType.CIRCLE, FigureType.RECTANGLE, FigureType.TRIANGLE}
+
+
+def test_collection_edits_keep_exact_totals(figures: list[Base2DFigure]) -> None:
+    coll = FigureCollection(figures)
+    coll.total_area()
+    ids = list(coll)
+    for fid in ids[::2]:
+        coll.remove(fid)
+    coll.replace(ids[1], Square(2.0))
+    left = [coll[fid] for fid in coll]
+    assert coll.total_area() == math.fsum(f.area() for f in left)
+    assert coll.total_area(FigureType.SQUARE) == 4.0
+    with pytest.raises(KeyError):
+        coll.remove(ids[0])
+
+
+def test_collection_unknown_figure() -> None:
+    with pytest.raises(FigureTypeError):
+        FigureCollection().add(_Hexagon())
+
+
+def test_collection_lazy_areas() -> None:
+    calls = _Probe.calls
+    calls.clear()
+    coll = FigureCollection()
+    fids = [coll.add(_Probe(float(i))) for i in range(1, 11)]
+    assert calls == []
+    assert coll.count(FigureType.SQUARE) == 10
+    assert coll.total_area() == math.fsum(float(i * i) for i in range(1, 11))
+    assert len(calls) == 10
+    coll.total_area()
+    assert coll.area(fids[0]) == 1.0
+    assert len(calls) == 10
+    coll.replace(fids[1], _Probe(3.0))
+    coll.add(_Probe(5.0))
+    coll.total_area()
+    assert calls[10:] == [3.0, 5.0]
+
+
+def test_collection_bad_figure_stays_pending() -> None:
+    coll = FigureCollection([Square(1.0), Square(2.0)])
+    bad = coll.add(Triangle(1.0, 1.0, 5.0))
+    coll.add(Square(3.0))
+    with pytest.raises(ValueError):
+        coll.total_area()
+    coll.remove(bad)
+    assert coll.total_area() == 14.0
+
+
+@pytest.mark.parametrize(
+        "figure, error",
+        [
+            (Triangle(1.0, 1.0, 5.0), ValueError),
+            (Circle(1e200), OverflowError),
+            ]
+        )
+def test_collection_bad_figure_error_names_id(
+        figure: Base2DFigure,
+        error: type[Exception],
+        ) -> None:
+    coll = FigureCollection([Square(1.0), Square(2.0)])
+    bad = coll.add(figure)
+    with pytest.raises(error, match=f"figure {bad} "):
+        coll.totals()
+    with pytest.raises(error, match=f"figure {bad} "):
+        coll.area(bad)
+    assert coll.area(0) == 1.0
+    coll.replace(bad, Square(3.0))
+    assert coll.totals() == {FigureType.SQUARE: 14.0}
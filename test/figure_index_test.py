@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from figures import (
+        FigureIndex,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        ImpossibleDimention,
+        calculate_figure_area,
+        )
+
+
+@pytest.fixture(scope="function")
+def specs() -> list[FigureSpec]:
+    rnd = random.Random(15)
+    out = []
+    for _ in range(500):
+        ftype = rnd.choice((FigureType.CIRCLE, FigureType.SQUARE, FigureType.RECTANGLE))
+        cnt = 2 if ftype is FigureType.RECTANGLE else 1
+        # repeated sizes give equal areas
+        out.append(FigureSpec(ftype, tuple(float(rnd.randint(1, 20)) for _ in range(cnt))))
+    return out
+
+
+def _expected(specs: list[FigureSpec], ids: list[int]) -> list[tuple[float, int]]:
+    return sorted((calculate_figure_area(specs[i]), i) for i in ids)
+
+
+def test_index_queries(specs: list[FigureSpec]) -> None:
+    index = FigureIndex(specs)
+    entries = _expected(specs, list(range(len(specs))))
+    assert len(index) == len(specs)
+    assert index.bottom_k(10) == [i for _, i in entries[:10]]
+    assert index.top_k(10) == [i for _, i in entries[::-1][:10]]
+    assert index.between(10.0, 50.0) == [i for a, i in entries if 10.0 <= a <= 50.0]
+    squares = [i for a, i in entries if specs[i].ftype is FigureType.SQUARE]
+    assert index.bottom_k(5, FigureType.SQUARE) == squares[:5]
+    assert index.top_k(1000, FigureType.SQUARE) == squares[::-1]
+    assert index.top_k(3, FigureType.TRIANGLE) == []
+    assert index.specs(index.top_k(2)) == [specs[i] for _, i in entries[::-1][:2]]
+
+
+def test_index_insert_delete_agree_with_bulk(specs: list[FigureSpec]) -> None:
+    bulk = FigureIndex(specs)
+    one_by_one = FigureIndex()
+    for spec in specs:
+        one_by_one.insert(spec)
+    assert one_by_one.between(0.0, 1e9) == bulk.between(0.0, 1e9)
+    for fid in range(0, len(specs), 3):
+        assert bulk.delete(fid) == specs[fid]
+        one_by_one.delete(fid)
+    left = [i for i in range(len(specs)) if i % 3]
+    expected = [i for _, i in _expected(specs, left)]
+    assert bulk.between(0.0, 1e9) == one_by_one.between(0.0, 1e9) == expected
+    assert 0 not in bulk and 1 in bulk
+    with pytest.raises(KeyError):
+        bulk.delete(0)
+
+
+def test_index_new_ids_after_extend(specs: list[FigureSpec]) -> None:
+    index = FigureIndex(specs[:10])
+    ids = index.extend(specs[10:20])
+    assert ids == list(range(10, 20))
+    fid = index.insert(specs[20])
+    assert fid == 20
+    assert index.area(fid) == calculate_figure_area(specs[20])
+
+
+def test_index_bad_specs(specs: list[FigureSpec]) -> None:
+    index = FigureIndex(specs[:5])
+    with pytest.raises(ImpossibleDimention):
+        index.extend([specs[6], FigureSpec(FigureType.CIRCLE, (-1.0, ))])
+    with pytest.raises(FigureSpecError):
+        index.extend([FigureSpec(FigureType.SQUARE, (1.0, 2.0))])
+    with pytest.raises(ImpossibleDimention):
+        index.insert(FigureSpec(FigureType.CIRCLE, (0.0, )))
+    assert len(index) == 5
+    assert len(index.between(0.0, 1e9)) == 5
+
+
+@pytest.mark.parametrize(
+        "spec",
+        [
+            FigureSpec(FigureType.CIRCLE, (float("nan"), )),
+            FigureSpec(FigureType.CIRCLE, (float("inf"), )),
+            FigureSpec(FigureType.SQUARE, (1e300, )),
+            ]
+        )
+def test_index_not_finite_areas(specs: list[FigureSpec], spec: FigureSpec) -> None:
+    index = FigureIndex(specs[:5])
+    with pytest.raises((ImpossibleDimention, OverflowError)):
+        index.insert(spec)
+    with pytest.raises(ImpossibleDimention):
+        index.extend([specs[6], spec])
+    assert len(index) == 5
+    assert index.insert(specs[6]) == 5
+    assert [index.area(i) for i in index.between(0.0, 1e9)] == sorted(
+            calculate_figure_area(s) for s in [*specs[:5], specs[6]]
+            )
@@ -0,0 +1,146 @@
+import math
+
+import numpy as np
+import pytest
+
+from figures import (
+        Base2DFigure,
+        Circle,
+        Polygon,
+        Rectangle,
+        Square,
+        Triangle,
+        FigureBatch,
+        FigureMeasures,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        build_figure_spec,
+        calculate_figure_area,
+        calculate_figure_areas,
+        classify_triangles,
+        measure_figure,
+        measure_figures,
+        )
+
+
+SPECS = [
+        build_figure_spec(FigureType.TRIANGLE, 3.0, 4.0, 5.0),
+        build_figure_spec(FigureType.TRIANGLE, 2.0, 3.0, 4.2),
+        build_figure_spec(FigureType.CIRCLE, 1.5),
+        build_figure_spec(FigureType.SQUARE, 2.0),
+        build_figure_spec(FigureType.RECTANGLE, 2.0, 3.5),
+        build_figure_spec(FigureType.POLYGON, 1.0, 1.0, 5.0, 1.0, 5.0, 4.0, 1.0, 4.0),
+        build_figure_spec(FigureType.TRIANGLE, 1.0, 2.0, 3.0),
+        build_figure_spec(FigureType.TRIANGLE, 1.0, 1.0, 5.0),
+        build_figure_spec(FigureType.CIRCLE, -1.0),
+        ]
+
+
+@pytest.mark.parametrize("figure, perimeter", [
+        (Circle(1.0), 2 * math.pi),
+        (Triangle(3.0, 4.0, 5.0), 12.0),
+        (Rectangle(2.0, 3.5), 11.0),
+        (Square(2.5), 10.0),
+        (Polygon(0.0, 0.0, 4.0, 0.0, 4.0, 3.0), 12.0),
+        ])
+def test_figure_perimeter(figure: Base2DFigure, perimeter: float) -> None:
+    assert figure.perimeter() == pytest.approx(perimeter)
+
+
+def test_perimeter_is_required() -> None:
+
+    class _Dot(Base2DFigure):
+        def area(self) -> float:
+            return 0.0
+
+    with pytest.raises(TypeError):
+        _Dot()  # type: ignore[abstract]
+
+
+def test_measure_right_triangle() -> None:
+    assert measure_figure(SPECS[0]) == FigureMeasures(area=6.0, perimeter=12.0, right=True)
+    assert not measure_figure(SPECS[1]).right
+    assert measure_figure(SPECS[1], rel_tol=0.5).right
+
+
+@pytest.mark.parametrize("spec", SPECS[:6])
+def test_measure_same_as_separate_calls(spec: FigureSpec) -> None:
+    measures = measure_figure(spec)
+    assert measures.area == calculate_figure_area(spec)
+    if spec.ftype is FigureType.TRIANGLE:
+        assert measures.right == Triangle(*spec.args).is_right_triangle()
+    else:
+        assert measures.right is None
+
+
+def test_measure_degenerate_triangle() -> None:
+    assert measure_figure(SPECS[6]) == FigureMeasures(area=0.0, perimeter=6.0, right=False)
+
+
+@pytest.mark.parametrize("spec, error", [
+        (SPECS[7], ImpossibleDimention),
+        (SPECS[8], ImpossibleDimention),
+        (FigureSpec(FigureType.SQUARE, (1.0, 2.0)), FigureSpecError),
+        ])
+def test_measure_raises(spec: FigureSpec, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        measure_figure(spec)
+
+
+def test_measure_unknown_type() -> None:
+    """spec is frozen, so bypass it to get unknown type."""
+    spec = FigureSpec(FigureType.CIRCLE, (1.0, ))
+    object.__setattr__(spec, "ftype", "hexagon")
+    with pytest.raises(FigureTypeError):
+        measure_figure(spec)
+
+
+@pytest.mark.parametrize("container", [list, FigureBatch])
+def test_measure_figures(container: type) -> None:
+    measures = measure_figures(container(SPECS))
+    np.testing.assert_array_equal(measures.areas, calculate_figure_areas(SPECS))
+    assert measures.right.tolist() == [True] + [False] * 8
+    expected = [measure_figure(s).perimeter for s in SPECS[:7]]
+    assert measures.perimeters[:7] == pytest.approx(expected)
+    assert np.isnan(measures.perimeters[7:]).all()
+
+
+def test_measure_figures_tolerance() -> None:
+    measures = measure_figures(SPECS[:2], rel_tol=0.5)
+    assert measures.right.tolist() == [True, True]
+
+
+def test_measure_figures_same_as_scalar() -> None:
+    rnd = np.random.default_rng(19)
+    a, b = rnd.uniform(1, 10, (2, 1000))
+    c = np.sqrt(a ** 2 + b ** 2) * rnd.uniform(0.999, 1.001, 1000)
+    specs = [build_figure_spec(FigureType.TRIANGLE, *s) for s in zip(a.tolist(), b.tolist(), c.tolist())]
+    measures = measure_figures(FigureBatch(specs))
+    scalar = [measure_figure(s) for s in specs]
+    assert measures.right.tolist() == [m.right for m in scalar]
+    assert measures.areas.tolist() == [m.area for m in scalar]
+    assert measures.perimeters.tolist() == [m.perimeter for m in scalar]
+    np.testing.assert_array_equal(measures.areas, classify_triangles(a, b, c).areas)
+
+
+def test_measure_figures_bad_args() -> None:
+    specs = [
+            FigureSpec(FigureType.TRIANGLE, (3.0, "4", 5.0)),
+            *SPECS[:3],
+            FigureSpec(FigureType.CIRCLE, (None, )),
+            FigureSpec(FigureType.POLYGON, (1.0, 1.0, "x", 1.0, 5.0, 4.0)),
+            ]
+    measures = measure_figures(specs)
+    bad = [True, False, False, False, True, True]
+    assert np.isnan(measures.areas).tolist() == bad
+    assert np.isnan(measures.perimeters).tolist() == bad
+    assert measures.right.tolist() == [False, True, False, False, False, False]
+    np.testing.assert_array_equal(measures.areas[1:4], measure_figures(SPECS[:3]).areas)
+
+
+def test_measure_figures_empty() -> None:
+    measures = measure_figures([])
+    assert len(measures.areas) == len(measures.perimeters) == len(measures.right) == 0
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from figures import (
@@ -6,6 +8,10 @@ from figures import (
         FigureSpecError,
         FigureTypeError,
         build_figure_spec,
+        Circle,
+        Triangle,
+        Rectangle,
+        Square,
         )
 
 
@@ -53,3 +59,31 @@ def test_build_rectangle_spec_succ() -> None:
 def test_build_triangle_spec_succ() -> None:
     spec = build_figure_spec(FigureType.TRIANGLE, 1.0, 2.0, 2.4)
     assert isinstance(spec, FigureSpec) is True, "inv type"
+
+
+def test_spec_is_frozen(circ_spec: FigureSpec) -> None:
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        circ_spec.args = (2.0, )
+
+
+def test_spec_is_hashable() -> None:
+    specs = {
+            build_figure_spec(FigureType.CIRCLE, 1.0),
+            build_figure_spec(FigureType.CIRCLE, 1.0),
+            build_figure_spec(FigureType.SQUARE, 1.0),
+            }
+    assert len(specs) == 2
+
+
+@pytest.mark.parametrize(
+        "fig",
+        [
+            FigureSpec(FigureType.CIRCLE, (1.0, )),
+            Circle(1.0),
+            Triangle(2.0, 2.0, 2.8283),
+            Rectangle(1.0, 2.0),
+            Square(1.0),
+            ]
+        )
+def test_no_instance_dict(fig: object) -> None:
+    assert not hasattr(fig, "__dict__"), "slots broken"
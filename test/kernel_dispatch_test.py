@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from figures import (
+        Circle,
+        FigureType,
+        ImpossibleDimention,
+        Rectangle,
+        Square,
+        Triangle,
+        build_figure_spec,
+        calculate_circle_area,
+        calculate_figure_area,
+        calculate_rectangle_area,
+        calculate_square_area,
+        calculate_triangle_area,
+        is_triangle_right,
+        )
+
+
+def _random_args(cnt: int) -> list[tuple[float, ...]]:
+    rnd = random.Random(7)
+    return [
+            tuple(rnd.uniform(0.01, 1e4) for _ in range(cnt))
+            for _ in range(1000)
+            ]
+
+
+@pytest.mark.parametrize(
+        "ftype,cls,func,cnt",
+        [
+            (FigureType.CIRCLE, Circle, calculate_circle_area, 1),
+            (FigureType.SQUARE, Square, calculate_square_area, 1),
+            (FigureType.RECTANGLE, Rectangle, calculate_rectangle_area, 2),
+            ]
+        )
+def test_kernels_same_as_objects(ftype, cls, func, cnt: int) -> None:
+    for args in _random_args(cnt):
+        expected = cls(*args).area()
+        assert func(*args) == expected
+        assert calculate_figure_area(build_figure_spec(ftype, *args)) == expected
+
+
+def test_triangle_kernel_same_as_object() -> None:
+    for a, b, t in _random_args(3):
+        # |a - b| < c < a + b
+        c = abs(a - b) + 2 * min(a, b) * t / 1e4
+        expected = Triangle(a, b, c).area()
+        assert calculate_triangle_area(a, b, c) == expected
+        spec = build_figure_spec(FigureType.TRIANGLE, a, b, c)
+        assert calculate_figure_area(spec) == expected
+        assert (
+                is_triangle_right(a, b, c, rel_tolerance=1e-2)
+                == Triangle(a, b, c, rel_tol=1e-2).is_right_triangle()
+                )
+
+
+@pytest.mark.parametrize(
+        "ftype,args",
+        [
+            (FigureType.CIRCLE, (0.0, )),
+            (FigureType.SQUARE, (-1.0, )),
+            (FigureType.RECTANGLE, (1.0, -2.0)),
+            (FigureType.TRIANGLE, (1.0, 1.0, 0.0)),
+            ]
+        )
+def test_kernels_raise_impossible_dim(ftype: FigureType, args: tuple) -> None:
+    with pytest.raises(ImpossibleDimention):
+        calculate_figure_area(build_figure_spec(ftype, *args))
+
+
+def test_impossible_triangle_raises_value_error() -> None:
+    """as Triangle.area() does (math domain error)."""
+    with pytest.raises(ValueError):
+        Triangle(1.0, 1.0, 5.0).area()
+    with pytest.raises(ValueError):
+        calculate_triangle_area(1.0, 1.0, 5.0)
@@ -0,0 +1,94 @@
+from collections.abc import Iterator
+
+import pytest
+
+from figures import (
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        MetricsSnapshot,
+        build_figure_spec,
+        calculate_circle_area,
+        calculate_figure_area,
+        disable_metrics,
+        enable_area_cache,
+        disable_area_cache,
+        enable_metrics,
+        get_metrics,
+        is_triangle_right,
+        )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def no_metrics() -> Iterator[None]:
+    yield
+    disable_metrics()
+    disable_area_cache()
+
+
+def test_metrics_off_by_default() -> None:
+    assert get_metrics() is None
+    assert calculate_circle_area(1.0) > 0
+
+
+def test_metrics_counts_calls(circ_spec: FigureSpec, triangle_spec: FigureSpec) -> None:
+    metrics = enable_metrics()
+    calculate_figure_area(circ_spec)
+    calculate_figure_area(circ_spec)
+    calculate_figure_area(triangle_spec)
+    calculate_circle_area(2.0)
+    is_triangle_right(3.0, 4.0, 5.0, rel_tolerance=1e-3)
+    ops = metrics.snapshot().ops
+    circle = ops[("calculate_figure_area", "circle")]
+    assert circle.calls == 2
+    assert sum(circle.latency_hist) == 2
+    assert len(circle.latency_hist) == len(circle.latency_edges_ns) + 1
+    assert circle.total_ns > 0
+    assert ops[("calculate_figure_area", "triangle")].calls == 1
+    assert ops[("calculate_circle_area", "circle")].calls == 1
+    assert ops[("is_triangle_right", "triangle")].calls == 1
+
+
+def test_metrics_counts_errors() -> None:
+    metrics = enable_metrics()
+    with pytest.raises(ImpossibleDimention):
+        calculate_figure_area(FigureSpec(FigureType.CIRCLE, (-1.0, )))
+    with pytest.raises(FigureSpecError):
+        build_figure_spec(FigureType.SQUARE, 1.0, 2.0)
+    with pytest.raises(FigureTypeError):
+        build_figure_spec("hexagon", 1.0)  # type: ignore[arg-type]
+    ops = metrics.snapshot().ops
+    assert ops[("calculate_figure_area", "circle")].errors == {"ImpossibleDimention": 1}
+    assert ops[("build_figure_spec", "square")].errors == {"FigureSpecError": 1}
+    assert ops[("build_figure_spec", "hexagon")].errors == {"FigureTypeError": 1}
+
+
+def test_metrics_with_cache(circ_spec: FigureSpec) -> None:
+    metrics = enable_metrics()
+    cache = enable_area_cache()
+    calculate_figure_area(circ_spec)
+    calculate_figure_area(circ_spec)
+    assert cache.stats().hits == 1
+    assert metrics.snapshot().ops[("calculate_figure_area", "circle")].calls == 2
+
+
+def test_metrics_export_and_reset(circ_spec: FigureSpec) -> None:
+    exported: list[MetricsSnapshot] = []
+    metrics = enable_metrics(exporter=exported.append)
+    calculate_figure_area(circ_spec)
+    snap = metrics.export(reset=True)
+    assert exported == [snap]
+    assert snap.ops[("calculate_figure_area", "circle")].calls == 1
+    assert metrics.snapshot().ops == {}
+    calculate_figure_area(circ_spec)
+    metrics.reset()
+    assert metrics.snapshot().ops == {}
+
+
+def test_metrics_disable(circ_spec: FigureSpec) -> None:
+    metrics = enable_metrics()
+    disable_metrics()
+    calculate_figure_area(circ_spec)
+    assert metrics.snapshot().ops == {}
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from figures import (
+        FigureSpecError,
+        FigureType,
+        SpecStatus,
+        calculate_column_areas,
+        column_triangles_right,
+        register_pandas_accessor,
+        )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def accessor() -> None:
+    register_pandas_accessor()
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame(
+            {
+                "ftype": [
+                    "circle", "triangle", FigureType.SQUARE, "rectangle",
+                    "hexagon", "triangle", None, "polygon", "square", "triangle",
+                    ],
+                "p0": [1.0, 3.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0, -2.0, 3.0],
+                "p1": [None, 4.0, None, 3.5, None, 1.0, None, None, None, 4.0],
+                "p2": [None, 5.0, None, None, None, 5.0, None, None, None, None],
+                },
+            index=pd.Index([f"f{i}" for i in range(10)], name="fid"),
+            )
+
+
+def _columns(frame: pd.DataFrame) -> tuple[np.ndarray, ...]:
+    ftypes = np.array([str(getattr(t, "value", t)) for t in frame["ftype"]])
+    return ftypes, *(frame[p].to_numpy(dtype=np.float64) for p in ("p0", "p1", "p2"))
+
+
+def test_area(frame: pd.DataFrame) -> None:
+    areas = frame.figures.area()
+    assert areas.name == "area"
+    assert areas.index.equals(frame.index)
+    np.testing.assert_allclose(areas.to_numpy(), calculate_column_areas(*_columns(frame)))
+
+
+def test_is_right(frame: pd.DataFrame) -> None:
+    right = frame.figures.is_right()
+    assert right.name == "is_right"
+    assert right.index.equals(frame.index)
+    assert right.tolist() == column_triangles_right(*_columns(frame)).tolist()
+    assert right.tolist() == [False, True] + [False] * 8
+
+
+def test_categorical_types(frame: pd.DataFrame) -> None:
+    acc = frame.figures
+    areas, right, status = acc.area(), acc.is_right(), acc.validate()
+    cat = frame.assign(ftype=frame["ftype"].map(lambda t: getattr(t, "value", t)).astype("category"))
+    pd.testing.assert_series_equal(cat.figures.area(), areas)
+    pd.testing.assert_series_equal(cat.figures.is_right(), right)
+    pd.testing.assert_series_equal(cat.figures.validate(), status)
+
+
+def test_other_columns(frame: pd.DataFrame) -> None:
+    other = frame.rename(columns={"ftype": "kind", "p0": "a", "p1": "b", "p2": "c"})
+    pd.testing.assert_series_equal(
+            other.figures("kind", params=("a", "b", "c")).area(),
+            frame.figures.area(),
+            )
+
+
+def test_validate(frame: pd.DataFrame) -> None:
+    status = frame.figures.validate()
+    assert status.name == "status"
+    assert status.index.equals(frame.index)
+    assert status.tolist() == [
+            SpecStatus.OK,
+            SpecStatus.OK,
+            SpecStatus.OK,
+            SpecStatus.OK,
+            SpecStatus.UNKNOWN_TYPE,
+            SpecStatus.IMPOSSIBLE_TRIANGLE,
+            SpecStatus.UNKNOWN_TYPE,
+            SpecStatus.WRONG_ARGS_COUNT,
+            SpecStatus.IMPOSSIBLE_DIMENTION,
+            SpecStatus.WRONG_ARGS_COUNT,
+            ]
+
+
+def test_validate_bad_args() -> None:
+    df = pd.DataFrame({"ftype": ["square", "circle"], "p0": ["2", "two"]})
+    assert df.figures(params=("p0", )).validate().tolist() == [
+            SpecStatus.OK, SpecStatus.BAD_ARGS,
+            ]
+
+
+def test_not_enough_params(frame: pd.DataFrame) -> None:
+    acc = frame.figures(params=("p0", "p1"))
+    with pytest.raises(FigureSpecError):
+        acc.area()
+    with pytest.raises(FigureSpecError):
+        acc.is_right()
+    assert acc.validate().iloc[1] == SpecStatus.WRONG_ARGS_COUNT
+
+
+def test_no_column(frame: pd.DataFrame) -> None:
+    with pytest.raises(ValueError):
+        frame.figures("kind").area()
+
+
+def test_empty_frame() -> None:
+    df = pd.DataFrame({"ftype": pd.Series([], dtype=object), "p0": pd.Series([], dtype=float)})
+    assert df.figures.area().empty
+    assert df.figures.validate().empty
+
+
+def test_register_twice() -> None:
+    register_pandas_accessor()
+    assert hasattr(pd.DataFrame, "figures")
@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from figures import (
+        FigureBatch,
+        FigureSpec,
+        FigureType,
+        FigureSpecError,
+        FigureTypeError,
+        ImpossibleDimention,
+        build_figure_spec,
+        calculate_figure_area,
+        parallel_figure_areas,
+        )
+
+
+@pytest.fixture(scope="module")
+def specs() -> list[FigureSpec]:
+    base = [
+            build_figure_spec(FigureType.SQUARE, 1.5),
+            build_figure_spec(FigureType.CIRCLE, 2.5),
+            build_figure_spec(FigureType.RECTANGLE, 2.5, 3.8),
+            build_figure_spec(FigureType.TRIANGLE, 2.0, 2.0, 2.8283),
+            ]
+    return base * 50
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_keeps_order(specs: list[FigureSpec], workers: int) -> None:
+    rep = parallel_figure_areas(specs, workers=workers, chunk_size=7)
+    assert rep.areas.tolist() == [calculate_figure_area(s) for s in specs]
+    assert rep.errors == {}
+
+
+def test_parallel_over_batch(specs: list[FigureSpec]) -> None:
+    rep = parallel_figure_areas(FigureBatch(specs), workers=2, chunk_size=16)
+    assert rep.areas.tolist() == [calculate_figure_area(s) for s in specs]
+
+
+def test_parallel_collects_errors(specs: list[FigureSpec]) -> None:
+    bad = list(specs[:10])
+    bad[2] = FigureSpec(FigureType.CIRCLE, (-1.0, ))
+    bad[5] = FigureSpec(FigureType.RECTANGLE, (1.0, ))
+    unknown = FigureSpec(FigureType.CIRCLE, (1.0, ))
+    object.__setattr__(unknown, "ftype", "any")
+    bad[9] = unknown
+    rep = parallel_figure_areas(bad, workers=2, chunk_size=3)
+    assert list(rep.errors) == [2, 5, 9]
+    assert isinstance(rep.errors[2], ImpossibleDimention)
+    assert isinstance(rep.errors[5], FigureSpecError)
+    assert isinstance(rep.errors[9], FigureTypeError)
+    assert np.flatnonzero(np.isnan(rep.areas)).tolist() == [2, 5, 9]
+    assert rep.areas[0] == calculate_figure_area(bad[0])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_collects_bad_args(specs: list[FigureSpec], workers: int) -> None:
+    bad = list(specs[:8])
+    bad[1] = FigureSpec(FigureType.CIRCLE, ("x", ))
+    bad[6] = FigureSpec(FigureType.TRIANGLE, (3.0, None, 5.0))
+    rep = parallel_figure_areas(bad, workers=workers, chunk_size=3)
+    assert list(rep.errors) == [1, 6]
+    assert all(isinstance(err, FigureSpecError) for err in rep.errors.values())
+    assert np.flatnonzero(np.isnan(rep.areas)).tolist() == [1, 6]
+    assert rep.areas[7] == calculate_figure_area(bad[7])
+
+
+def test_parallel_invalid_chunk_size(specs: list[FigureSpec]) -> None:
+    with pytest.raises(ValueError):
+        parallel_figure_areas(specs, chunk_size=0)
+
+
+def test_batch_chunk_is_compact() -> None:
+    """pickled batch is smaller as pickled list of specs."""
+    specs = [
+            build_figure_spec(FigureType.RECTANGLE, float(i), i + 0.5)
+            for i in range(1, 1000)
+            ]
+    assert len(pickle.dumps(FigureBatch(specs))) < len(pickle.dumps(specs))
@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from figures import (
+        FigureSpecError,
+        calculate_column_areas,
+        column_triangles_right,
+        compute_areas_parquet,
+        read_figures_parquet,
+        )
+
+
+FTYPES = ["circle", "triangle", "square", "rectangle", "hexagon", "triangle", None, "polygon"]
+P0 = [1.0, 3.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0]
+P1 = [None, 4.0, None, 3.5, None, 1.0, None, None]
+P2 = [None, 5.0, None, None, None, 5.0, None, None]
+
+
+def _table(ftypes: pa.Array) -> pa.Table:
+    return pa.table({
+            "id": pa.array(range(len(FTYPES)), type=pa.int64()),
+            "ftype": ftypes,
+            "p0": pa.array(P0, type=pa.float32()),
+            "p1": pa.array(P1, type=pa.float64()),
+            "p2": pa.array(P2, type=pa.float64()),
+            "note": pa.array(["x"] * len(FTYPES)),
+            })
+
+
+@pytest.fixture
+def figures_parquet(tmp_path: Path) -> Path:
+    path = tmp_path / "figures.parquet"
+    pq.write_table(_table(pa.array(FTYPES)), path, row_group_size=3)
+    return path
+
+
+def _expected_areas() -> np.ndarray:
+    ftypes = np.array([t or "" for t in FTYPES])
+    params = [np.array(p, dtype=np.float64) for p in (P0, P1, P2)]
+    return calculate_column_areas(ftypes, *params)
+
+
+def test_read_projection(figures_parquet: Path) -> None:
+    batches = list(read_figures_parquet(figures_parquet, columns=("id", ), batch_size=3))
+    assert [b.num_rows for b in batches] == [3, 3, 2]
+    assert batches[0].schema.names == ["id", "ftype", "p0", "p1", "p2"]
+
+
+def test_read_missing_column(figures_parquet: Path) -> None:
+    with pytest.raises(ValueError):
+        list(read_figures_parquet(figures_parquet, params=("p0", "p9")))
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_read_bad_batch_size(figures_parquet: Path, batch_size: int) -> None:
+    with pytest.raises(ValueError):
+        list(read_figures_parquet(figures_parquet, batch_size=batch_size))
+
+
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_compute_areas(figures_parquet: Path, tmp_path: Path, use_threads: bool) -> None:
+    out = tmp_path / "areas.parquet"
+    rows = compute_areas_parquet(
+            figures_parquet, out, columns=("id", ), batch_size=3, use_threads=use_threads,
+            )
+    assert rows == len(FTYPES)
+    table = pq.read_table(out)
+    assert table.column_names == ["id", "ftype", "p0", "p1", "p2", "area", "is_right"]
+    assert table.column("id").to_pylist() == list(range(len(FTYPES)))
+    areas = table.column("area").to_numpy(zero_copy_only=False)
+    np.testing.assert_allclose(areas, _expected_areas())
+    # NaN areas are written as nulls
+    assert table.column("area").null_count == 4
+    assert table.column("is_right").to_pylist() == [
+            False, True, False, False, False, False, False, False,
+            ]
+
+
+def test_compute_dictionary_types(tmp_path: Path) -> None:
+    src, out = tmp_path / "figures.parquet", tmp_path / "areas.parquet"
+    pq.write_table(_table(pa.array(FTYPES).dictionary_encode()), src)
+    compute_areas_parquet(src, out, area_col="a", right_col="r", rel_tol=1e-2)
+    table = pq.read_table(out)
+    np.testing.assert_allclose(
+            table.column("a").to_numpy(zero_copy_only=False), _expected_areas(),
+            )
+    ftypes = np.array([t or "" for t in FTYPES])
+    params = [np.array(p, dtype=np.float64) for p in (P0, P1, P2)]
+    assert table.column("r").to_pylist() == column_triangles_right(ftypes, *params).tolist()
+
+
+def test_compute_empty(tmp_path: Path) -> None:
+    src, out = tmp_path / "figures.parquet", tmp_path / "areas.parquet"
+    pq.write_table(_table(pa.array(FTYPES)).slice(0, 0), src)
+    assert compute_areas_parquet(src, out) == 0
+    assert pq.read_table(out).num_rows == 0
+
+
+def test_compute_not_enough_params(tmp_path: Path) -> None:
+    src, out = tmp_path / "figures.parquet", tmp_path / "areas.parquet"
+    pq.write_table(_table(pa.array(FTYPES)), src)
+    with pytest.raises(FigureSpecError):
+        compute_areas_parquet(src, out, params=("p0", ))
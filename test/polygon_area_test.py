@@ -0,0 +1,134 @@
+import math
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from figures import (
+        FigureBatch,
+        FigureCollection,
+        FigureSpec,
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        Polygon,
+        build_figure_spec,
+        calculate_areas,
+        calculate_figure_area,
+        calculate_figure_areas,
+        calculate_polygon_area,
+        calculate_polygon_areas,
+        write_figures_binary,
+        )
+
+_SQUARE = (0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0)
+
+
+def _random_polygon(rnd: random.Random) -> tuple[float, ...]:
+    """convex polygon (vertices on ellipse by sorted angles)."""
+    cx, cy = rnd.uniform(-1e3, 1e3), rnd.uniform(-1e3, 1e3)
+    rx, ry = rnd.uniform(0.1, 50.0), rnd.uniform(0.1, 50.0)
+    angles = sorted(rnd.uniform(0, 2 * math.pi) for _ in range(rnd.randint(3, 12)))
+    return tuple(
+            c for a in angles
+            for c in (cx + rx * math.cos(a), cy + ry * math.sin(a))
+            )
+
+
+@pytest.fixture(scope="module")
+def polygons() -> list[tuple[float, ...]]:
+    rnd = random.Random(18)
+    return [_random_polygon(rnd) for _ in range(300)]
+
+
+def test_polygon_spec() -> None:
+    spec = build_figure_spec(FigureType.POLYGON, *_SQUARE)
+    assert calculate_figure_area(spec) == 1.0
+    with pytest.raises(FigureSpecError):
+        build_figure_spec(FigureType.POLYGON, 0.0, 0.0, 1.0, 0.0)
+    with pytest.raises(FigureSpecError):
+        build_figure_spec(FigureType.POLYGON, *_SQUARE, 1.0)
+
+
+def test_polygon_area() -> None:
+    assert calculate_polygon_area(0.0, 0.0, 4.0, 0.0, 0.0, 3.0) == 6.0
+    # orientation doesn`t matter
+    assert calculate_polygon_area(0.0, 0.0, 0.0, 3.0, 4.0, 0.0) == 6.0
+    # far from origin
+    far = tuple(c + 1e8 for c in _SQUARE)
+    assert calculate_polygon_area(*far) == 1.0
+    # concave "L"
+    assert calculate_polygon_area(0, 0, 2, 0, 2, 1, 1, 1, 1, 2, 0, 2) == 3.0
+    assert Polygon(*_SQUARE).area() == 1.0
+    with pytest.raises(ImpossibleDimention):
+        calculate_polygon_area(0.0, 0.0, math.inf, 0.0, 0.0, 1.0)
+    with pytest.raises(FigureSpecError):
+        Polygon(0.0, 0.0, 1.0)
+
+
+def test_polygon_areas_match_scalar(polygons: list[tuple[float, ...]]) -> None:
+    offsets = np.cumsum([0, *map(len, polygons)])
+    coords = np.concatenate(polygons)
+    areas = calculate_polygon_areas(coords, offsets)
+    assert areas.tolist() == [calculate_polygon_area(*p) for p in polygons]
+
+
+def test_polygon_areas_invalid_rows() -> None:
+    coords = [
+            *_SQUARE,
+            0.0, 0.0, 1.0, 1.0,  # 2 vertices
+            0.0, 0.0, 1.0,  # odd coords count
+            math.nan, 2.0, 2.0, 2.0, 0.0, 0.0,
+            ]
+    offsets = [0, 8, 12, 15, 21]
+    areas = calculate_polygon_areas(coords, offsets)
+    assert areas[0] == 1.0
+    assert np.isnan(areas[1:]).all()
+    with pytest.raises(FigureSpecError):
+        calculate_polygon_areas(_SQUARE, [0, 8, 6])
+    with pytest.raises(FigureSpecError):
+        calculate_polygon_areas(_SQUARE, [0, 10])
+    with pytest.raises(FigureTypeError):
+        calculate_areas(FigureType.POLYGON, _SQUARE)
+
+
+def test_polygon_batch(polygons: list[tuple[float, ...]]) -> None:
+    specs: list[FigureSpec] = []
+    for i, poly in enumerate(polygons[:50]):
+        specs.append(FigureSpec(FigureType.POLYGON, poly))
+        specs.append(FigureSpec(FigureType.CIRCLE, (i + 1.0, )))
+    batch = FigureBatch(specs)
+    assert batch.count(FigureType.POLYGON) == 50
+    assert batch.to_specs() == specs
+    assert batch[-2] == specs[-2]
+    assert batch[7:31].to_specs() == specs[7:31]
+    assert batch[::3].to_specs() == specs[::3]
+    joined = FigureBatch(specs[:11])
+    joined.extend(FigureBatch(specs[11:]))
+    assert joined == batch
+    offsets = batch.offsets(FigureType.POLYGON)
+    assert offsets[0] == 0 and offsets[-1] == len(batch.params(FigureType.POLYGON))
+    expected = [calculate_figure_area(s) for s in specs]
+    assert calculate_figure_areas(batch).tolist() == expected
+    assert calculate_figure_areas(specs).tolist() == expected
+    assert calculate_figure_areas(batch[5:20]).tolist() == expected[5:20]
+    with pytest.raises(FigureTypeError):
+        batch.offsets(FigureType.CIRCLE)
+
+
+def test_polygon_in_collection_and_binary(tmp_path: Path) -> None:
+    coll = FigureCollection([Polygon(*_SQUARE)])
+    assert coll.total_area(FigureType.POLYGON) == 1.0
+    with pytest.raises(FigureTypeError):
+        write_figures_binary(tmp_path / "p.bin", [FigureSpec(FigureType.POLYGON, _SQUARE)])
+
+
+def test_polygon_stream() -> None:
+    from figures import iter_figure_areas
+    lines = ["polygon,0,0,4,0,0,3\n", "polygon,0,0,1\n", "square,2\n"]
+    res = list(iter_figure_areas(lines, fmt="csv"))
+    assert res[0].area == 6.0
+    assert isinstance(res[1].error, FigureSpecError)
+    assert res[2].area == 4.0
@@ -0,0 +1,60 @@
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+pytest.importorskip("pyspark.sql")
+
+
+def _areas_module() -> ModuleType:
+    """pyspark/areas.py is a script module (not a package)."""
+    path = Path(__file__).resolve().parents[1] / "pyspark" / "areas.py"
+    spec = importlib.util.spec_from_file_location("spark_areas", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+areas = _areas_module()
+
+
+def _batch() -> pa.RecordBatch:
+    table = pa.table({
+            "id": pa.array([0, 1, 2, 3, 4, 5], type=pa.int64()),
+            "ftype": ["circle", "triangle", "hexagon", "square", "triangle", "triangle"],
+            "p0": pa.array([1.0, 3.0, 1.0, -2.0, 2.0, 1.0], type=pa.float32()),
+            "p1": [None, 4.0, None, None, 2.0, 1.0],
+            "p2": [None, 5.0, None, None, 2.9, 5.0],
+            })
+    return table.combine_chunks().to_batches()[0]
+
+
+def test_metrics_batches() -> None:
+    batches = list(areas.figure_metrics_batches(
+            iter([_batch(), _batch().slice(0, 2)]),
+            "ftype", ("p0", "p1", "p2"), None,
+            ))
+    assert [b.num_rows for b in batches] == [6, 2]
+    out = batches[0]
+    assert out.schema.names == ["id", "ftype", "p0", "p1", "p2", "area", "is_right"]
+    assert out.column("id").to_pylist() == list(range(6))
+    # NaN areas (unknown type, impossible dimentions) are nulls
+    area = out.column("area")
+    assert area.type == pa.float64()
+    assert area.is_null().to_pylist() == [False, False, True, True, False, True]
+    np.testing.assert_allclose(area.to_pylist()[:2], [np.pi, 6.0])
+    assert out.column("is_right").to_pylist() == [False, True, False, False, False, False]
+
+
+def test_metrics_batches_options() -> None:
+    (out, ) = areas.figure_metrics_batches(
+            iter([_batch()]), "ftype", ("p0", "p1", "p2"), 1e-1,
+            area_col="a", right_col="r",
+            )
+    assert out.schema.names[-2:] == ["a", "r"]
+    # 2, 2, 2.9 is right with 10% tolerance
+    assert out.column("r").to_pylist() == [False, True, False, False, True, False]
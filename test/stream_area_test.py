@@ -0,0 +1,108 @@
+import io
+import json
+import math
+import tracemalloc
+from typing import Iterator
+
+import pytest
+
+from figures import (
+        FigureSpecError,
+        FigureTypeError,
+        ImpossibleDimention,
+        iter_figure_areas,
+        write_figure_areas,
+        )
+
+
+CSV_DATA = """ftype,a,b,c
+circle,1.0
+rectangle,3.0,4.0
+triangle,2.0,2.0,2.8283
+square,-1.0
+hexagon,1.0
+rectangle,1.0
+square,abc
+"""
+
+
+def test_csv_stream_areas() -> None:
+    res = list(iter_figure_areas(io.StringIO(CSV_DATA), chunk_size=2))
+    assert [r.index for r in res] == list(range(7))
+    assert res[0].area == pytest.approx(math.pi)
+    assert res[1].area == pytest.approx(12.0)
+    assert res[2].area == pytest.approx(2.0, 1e-2)
+    assert all(r.ok for r in res[:3])
+
+
+@pytest.mark.parametrize(
+        "idx,err",
+        [
+            (3, ImpossibleDimention),
+            (4, FigureTypeError),
+            (5, FigureSpecError),
+            (6, FigureSpecError),
+            ]
+        )
+def test_csv_stream_errors_as_values(idx: int, err: type) -> None:
+    res = list(iter_figure_areas(io.StringIO(CSV_DATA)))
+    assert res[idx].ok is False
+    assert isinstance(res[idx].error, err)
+
+
+def test_jsonl_stream_areas(tmp_path) -> None:
+    path = tmp_path / "specs.jsonl"
+    path.write_text(
+            json.dumps({"ftype": "square", "args": [2.0]}) + "\n"
+            + "{broken\n"
+            + "\n"
+            + json.dumps({"ftype": "triangle", "args": [1.0, 1.0, 5.0]}) + "\n"
+            )
+    res = list(iter_figure_areas(path))
+    assert res[0].area == pytest.approx(4.0)
+    assert isinstance(res[1].error, FigureSpecError)
+    assert isinstance(res[2].error, ImpossibleDimention)
+
+
+@pytest.mark.parametrize("args", ["345", 345, {"a": 3.0}, None])
+def test_jsonl_args_not_list(args: object) -> None:
+    data = (
+            json.dumps({"ftype": "triangle", "args": args}) + "\n"
+            + json.dumps({"ftype": "square", "args": [2.0]}) + "\n"
+            )
+    res = list(iter_figure_areas(io.StringIO(data), fmt="jsonl"))
+    assert isinstance(res[0].error, FigureSpecError)
+    assert res[1].area == pytest.approx(4.0)
+
+
+def test_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        list(iter_figure_areas(io.StringIO(CSV_DATA), chunk_size=0))
+
+
+def test_write_figure_areas(tmp_path) -> None:
+    out = tmp_path / "areas.csv"
+    assert write_figure_areas(io.StringIO(CSV_DATA), out) == 7
+    rows = out.read_text().splitlines()
+    assert rows[0] == "index,area,error"
+    assert rows[2] == "1,12.0,"
+    assert rows[4].startswith("3,,ImpossibleDimention")
+
+
+def _lines(n: int) -> Iterator[str]:
+    for i in range(n):
+        yield f"rectangle,{i % 100 + 1}.0,2.0\n"
+
+
+def _stream_peak(n: int) -> int:
+    tracemalloc.start()
+    cnt = sum(1 for _ in iter_figure_areas(_lines(n), chunk_size=500))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert cnt == n
+    return peak
+
+
+def test_stream_memory_is_flat() -> None:
+    """peak memory doesn`t grow with input size."""
+    assert _stream_peak(20_000) < 1.5 * _stream_peak(2_000)
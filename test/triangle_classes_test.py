@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from figures import (
+        Triangle,
+        classify_triangles,
+        )
+
+
+SIDES = np.array([
+        (2.0, 2.0, 2.8283),
+        (2.0, 4.0, 4.4721),
+        (2.0, 3.0, 4.2),
+        (2.0, 4.0, 6.0),
+        (1.0, 1.0, 5.0),
+        (-1.0, 6.0, 1.0),
+        (3.0, 4.0, 0.0),
+        (np.nan, 1.0, 1.0),
+        ])
+
+
+def test_triangle_masks() -> None:
+    cls = classify_triangles(*SIDES.T)
+    assert cls.valid.tolist() == [True, True, True, False, False, False, False, False]
+    assert cls.degenerate.tolist() == [False, False, False, True] + [False] * 4
+    assert cls.right.tolist() == [True, True] + [False] * 6
+
+
+def test_triangle_areas() -> None:
+    cls = classify_triangles(*SIDES.T)
+    expected = [Triangle(*s).area() for s in SIDES[:3]]
+    assert cls.areas[:3] == pytest.approx(expected)
+    assert cls.areas[3] == 0.0
+    assert np.isnan(cls.areas[4:]).all()
+
+
+def test_right_same_as_scalar() -> None:
+    rnd = np.random.default_rng(3)
+    a, b = rnd.uniform(1, 10, (2, 2000))
+    c = np.sqrt(a ** 2 + b ** 2) * rnd.uniform(0.999, 1.001, 2000)
+    for tol in (None, 1e-4, 1e-2):
+        right = classify_triangles(a, b, c, rel_tol=tol).right
+        expected = [
+                Triangle(*s, rel_tol=tol).is_right_triangle()
+                for s in zip(a, b, c)
+                ]
+        assert right.tolist() == expected
+
+
+def test_per_element_tolerance() -> None:
+    a, b, c = [2.0, 2.0, 2.0], [2.0, 2.0, 2.0], [2.9, 2.9, 2.9]
+    right = classify_triangles(a, b, c, rel_tol=[1e-1, 0.0, 1e-3]).right
+    # zero tolerance means default one (1e-3)
+    assert right.tolist() == [True, False, False]
+
+
+def test_negative_tolerance_raises() -> None:
+    with pytest.raises(ValueError):
+        classify_triangles([1.0], [1.0], [1.0], rel_tol=-1.0)
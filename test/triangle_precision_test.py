@@ -0,0 +1,132 @@
+import warnings
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from figures import (
+        FigureType,
+        Triangle,
+        args_valid_mask,
+        calculate_areas,
+        calculate_triangle_area,
+        classify_triangles,
+        )
+
+
+def _exact_area(a: float, b: float, c: float) -> float:
+    """area of triangle with exactly these (binary) sides."""
+    a_, b_, c_ = Fraction(a), Fraction(b), Fraction(c)
+    sq16 = (a_ + b_ + c_) * (-a_ + b_ + c_) * (a_ - b_ + c_) * (a_ + b_ - c_)
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return float((Decimal(sq16.numerator) / Decimal(sq16.denominator)).sqrt() / 4)
+
+
+def _textbook(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    p = (a + b + c) / 2
+    return np.sqrt(p * (p - a) * (p - b) * (p - c))
+
+
+@pytest.fixture(scope="module")
+def needles() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """needle-like triangles: two long close sides and a short one."""
+    rnd = np.random.default_rng(22)
+    a = rnd.uniform(1, 10, 500)
+    b = a * (1 + rnd.uniform(0, 1e-6, 500))
+    c = rnd.uniform(1e-6, 1e-3, 500)
+    return a, b, c
+
+
+def _rel_err(areas: np.ndarray, exact: np.ndarray) -> float:
+    return float(np.max(np.abs(areas.astype(np.float64) - exact) / exact))
+
+
+def test_scalar_needles(needles: tuple[np.ndarray, ...]) -> None:
+    for a, b, c in zip(*(arr.tolist() for arr in needles)):
+        exact = _exact_area(a, b, c)
+        assert calculate_triangle_area(a, b, c) == pytest.approx(exact, rel=1e-14)
+        # sides order doesn`t matter
+        assert Triangle(c, a, b).area() == pytest.approx(exact, rel=1e-14)
+
+
+def test_batch_needles_float64(needles: tuple[np.ndarray, ...]) -> None:
+    exact = np.array([_exact_area(*s) for s in zip(*needles)])
+    areas = calculate_areas(FigureType.TRIANGLE, *needles)
+    assert _rel_err(areas, exact) < 1e-14
+    # textbook Heron loses digits here
+    assert _rel_err(_textbook(*needles), exact) > 1e-11
+
+
+def test_batch_needles_float32(needles: tuple[np.ndarray, ...]) -> None:
+    sides = [arr.astype(np.float32) for arr in needles]
+    exact = np.array([_exact_area(*map(float, s)) for s in zip(*sides)])
+    areas = calculate_areas(FigureType.TRIANGLE, *sides, dtype=np.float32)
+    assert areas.dtype == np.float32
+    assert _rel_err(areas, exact) < 1e-6
+    # in float32 textbook Heron gives nothing useful
+    assert _rel_err(_textbook(*sides), exact) > 1e-2
+
+
+def test_float32_areas_close_to_float64() -> None:
+    rnd = np.random.default_rng(7)
+    a, b = rnd.uniform(1, 10, (2, 1000))
+    c = np.sqrt(a ** 2 + b ** 2)
+    for ftype, cols in [
+            (FigureType.TRIANGLE, (a, b, c)),
+            (FigureType.CIRCLE, (a, )),
+            (FigureType.SQUARE, (a, )),
+            (FigureType.RECTANGLE, (a, b)),
+            ]:
+        areas32 = calculate_areas(ftype, *cols, dtype=np.float32)
+        areas64 = calculate_areas(ftype, *cols)
+        assert areas32.nbytes * 2 == areas64.nbytes
+        np.testing.assert_allclose(areas32, areas64, rtol=1e-6)
+
+
+@pytest.mark.parametrize("side", [5e9, 1e17, 1e-11, 1e-12, 1e-17])
+def test_float32_range(side: float) -> None:
+    """area fits float32, so it`s calculated though squares
+    of perimeter products would overflow or underflow."""
+    sides = np.full(2, side, dtype=np.float32)
+    exact = _exact_area(*[float(np.float32(side))] * 3)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        areas = calculate_areas(FigureType.TRIANGLE, sides, sides, sides, dtype=np.float32)
+        cls = classify_triangles(sides, sides, sides, dtype=np.float32)
+    assert args_valid_mask(FigureType.TRIANGLE, sides, sides, sides).all()
+    np.testing.assert_allclose(areas, exact, rtol=1e-6)
+    np.testing.assert_allclose(cls.areas, exact, rtol=1e-6)
+
+
+def test_float32_area_overflow() -> None:
+    areas = calculate_areas(
+            FigureType.TRIANGLE, [1e20, 3.0], [1e20, 4.0], [1e20, 5.0], dtype=np.float32,
+            )
+    assert areas[0] == np.inf
+    assert areas[1] == pytest.approx(6.0, rel=1e-6)
+
+
+def test_classify_float32() -> None:
+    cls64 = classify_triangles([3.0, 1.0, 1.0], [4.0, 1.0, 2.0], [5.0, 5.0, 3.0])
+    cls32 = classify_triangles(
+            [3.0, 1.0, 1.0], [4.0, 1.0, 2.0], [5.0, 5.0, 3.0], dtype=np.float32,
+            )
+    assert cls32.areas.dtype == np.float32
+    assert cls32.valid.tolist() == cls64.valid.tolist()
+    assert cls32.degenerate.tolist() == cls64.degenerate.tolist()
+    assert cls32.right.tolist() == cls64.right.tolist()
+
+
+def test_invalid_rows_float32() -> None:
+    areas = calculate_areas(
+            FigureType.TRIANGLE, [1.0, -1.0], [1.0, 1.0], [5.0, 1.0], dtype=np.float32,
+            )
+    assert np.isnan(areas).all()
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.int64, "U8"])
+def test_unsupported_dtype(dtype: object) -> None:
+    with pytest.raises(ValueError):
+        calculate_areas(FigureType.CIRCLE, [1.0], dtype=dtype)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from figures import (
+        FigureBatch,
+        FigureSpec,
+        FigureType,
+        build_figure_spec,
+        calculate_figure_areas,
+        calculate_unique_areas,
+        )
+
+
+@pytest.fixture(scope="module")
+def repetitive_specs() -> list[FigureSpec]:
+    """few standard sizes, many rows."""
+    sizes = [
+            build_figure_spec(FigureType.CIRCLE, 1.5),
+            build_figure_spec(FigureType.SQUARE, 2.0),
+            build_figure_spec(FigureType.TRIANGLE, 3.0, 4.0, 5.0),
+            build_figure_spec(FigureType.RECTANGLE, 1.0, 2.5),
+            build_figure_spec(FigureType.POLYGON, 0.0, 0.0, 4.0, 0.0, 0.0, 3.0),
+            build_figure_spec(FigureType.TRIANGLE, 1.0, 1.0, 5.0),
+            ]
+    rnd = np.random.default_rng(23)
+    return [sizes[i] for i in rnd.integers(0, len(sizes), 600)]
+
+
+def test_same_as_calculate_figure_areas(repetitive_specs: list[FigureSpec]) -> None:
+    res = calculate_unique_areas(repetitive_specs)
+    np.testing.assert_array_equal(res.areas, calculate_figure_areas(repetitive_specs))
+
+
+def test_unique_specs_are_calculated_once(repetitive_specs: list[FigureSpec]) -> None:
+    res = calculate_unique_areas(repetitive_specs)
+    assert res.unique_count == 6
+    assert res.dedup_ratio == pytest.approx(100.0)
+    np.testing.assert_array_equal(res.unique_areas[res.inverse], res.areas)
+
+
+def test_inverse_keeps_first_seen_order() -> None:
+    a = build_figure_spec(FigureType.SQUARE, 2.0)
+    b = build_figure_spec(FigureType.CIRCLE, 1.0)
+    res = calculate_unique_areas([a, b, a, a, b])
+    assert res.inverse.tolist() == [0, 1, 0, 0, 1]
+    assert res.unique_areas.tolist() == pytest.approx([4.0, np.pi])
+
+
+def test_specs_from_batch(repetitive_specs: list[FigureSpec]) -> None:
+    res = calculate_unique_areas(FigureBatch(repetitive_specs))
+    np.testing.assert_array_equal(res.areas, calculate_figure_areas(repetitive_specs))
+
+
+def test_bad_args_nan() -> None:
+    circle = build_figure_spec(FigureType.CIRCLE, 1.5)
+    specs = [
+            FigureSpec(FigureType.CIRCLE, ("x", )),
+            circle,
+            FigureSpec(FigureType.POLYGON, ([0.0, 0.0], 4.0, 0.0, 0.0, 3.0)),
+            FigureSpec(FigureType.TRIANGLE, (3.0, None, 5.0)),
+            circle,
+            FigureSpec(FigureType.CIRCLE, ("x", )),
+            ]
+    res = calculate_unique_areas(specs)
+    assert np.isnan(res.areas).tolist() == [True, False, True, True, False, True]
+    assert res.areas[1] == res.areas[4] == calculate_figure_areas([circle])[0]
+    assert res.unique_count == 4
+
+
+def test_no_specs() -> None:
+    res = calculate_unique_areas([])
+    assert len(res.areas) == res.unique_count == 0
+    assert res.dedup_ratio == 1.0
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from figures import (
+        FigureSpecError,
+        FigureType,
+        FigureTypeError,
+        ImpossibleDimention,
+        SpecStatus,
+        build_figure_spec,
+        calculate_figure_areas,
+        validate_figures,
+        )
+
+
+ROWS = [
+        ("circle", [1.0]),
+        ("square", ["2.5"]),
+        ("hexagon", [1.0]),
+        ("triangle", (1.0, 2.0)),
+        ("triangle", (1.0, 1.0, 5.0)),
+        ("rectangle", (-1.0, 2.0)),
+        ("polygon", [0.0, 0.0, 4.0, 0.0, 0.0, 3.0]),
+        ("polygon", [0.0, 0.0, "x", 0.0, 0.0, 3.0]),
+        (FigureType.TRIANGLE, (3.0, 4.0, 5.0)),
+        ("circle", "abc"),
+        (None, (1.0, )),
+        build_figure_spec(FigureType.SQUARE, 3.0),
+        ("triangle", (1.0, 2.0, 3.0)),
+        ("circle", [float("nan")]),
+        ("square", [True]),
+        ("rectangle", (2.0, b"3")),
+        ]
+
+STATUS = [
+        SpecStatus.OK,
+        SpecStatus.BAD_ARGS,
+        SpecStatus.UNKNOWN_TYPE,
+        SpecStatus.WRONG_ARGS_COUNT,
+        SpecStatus.IMPOSSIBLE_TRIANGLE,
+        SpecStatus.IMPOSSIBLE_DIMENTION,
+        SpecStatus.OK,
+        SpecStatus.BAD_ARGS,
+        SpecStatus.OK,
+        SpecStatus.BAD_ARGS,
+        SpecStatus.UNKNOWN_TYPE,
+        SpecStatus.OK,
+        SpecStatus.OK,
+        SpecStatus.IMPOSSIBLE_DIMENTION,
+        # bools are numbers for scalar calculation too
+        SpecStatus.OK,
+        SpecStatus.BAD_ARGS,
+        ]
+
+
+def test_status_codes() -> None:
+    checked = validate_figures(ROWS)
+    assert checked.status.tolist() == STATUS
+    assert checked.rows.tolist() == [0, 6, 8, 11, 12, 14]
+    assert checked.counts()[SpecStatus.BAD_ARGS] == 4
+    assert sum(checked.counts().values()) == len(ROWS) == len(checked)
+
+
+def test_batch_of_valid_rows() -> None:
+    checked = validate_figures(ROWS)
+    expected = [
+            build_figure_spec(FigureType.CIRCLE, 1.0),
+            build_figure_spec(FigureType.POLYGON, 0.0, 0.0, 4.0, 0.0, 0.0, 3.0),
+            build_figure_spec(FigureType.TRIANGLE, 3.0, 4.0, 5.0),
+            build_figure_spec(FigureType.SQUARE, 3.0),
+            build_figure_spec(FigureType.TRIANGLE, 1.0, 2.0, 3.0),
+            build_figure_spec(FigureType.SQUARE, 1.0),
+            ]
+    assert checked.batch.to_specs() == expected
+    areas = checked.areas()
+    np.testing.assert_array_equal(areas[checked.ok], calculate_figure_areas(expected))
+    assert np.isnan(areas[~checked.ok]).all()
+
+
+@pytest.mark.parametrize("row, error, msg", [
+        (2, FigureTypeError, "No type <hexagon> specified."),
+        (3, FigureSpecError, "Args count in (1.0, 2.0) not mathed. Got: 2, need: 3"),
+        (4, ImpossibleDimention, "break triangle inequality"),
+        (5, ImpossibleDimention, "Dimentions shold be bigger as zero."),
+        (9, FigureSpecError, "Invalid args abc"),
+        (1, FigureSpecError, "Invalid args ['2.5']"),
+        ])
+def test_errors_are_built_on_demand(row: int, error: type[Exception], msg: str) -> None:
+    checked = validate_figures(ROWS)
+    err = checked.error(row)
+    assert isinstance(err, error)
+    assert msg in str(err)
+
+
+def test_no_error_for_valid_row() -> None:
+    checked = validate_figures(ROWS)
+    assert checked.message(0) is None
+    assert checked.error(0) is None
+
+
+def test_errors_in_rows_order() -> None:
+    checked = validate_figures(ROWS)
+    rows = [row for row, _ in checked.errors()]
+    assert rows == [i for i, st in enumerate(STATUS) if st is not SpecStatus.OK]
+
+
+def test_same_errors_as_build_figure_spec() -> None:
+    checked = validate_figures([("square", (1.0, 2.0))])
+    with pytest.raises(FigureSpecError) as err:
+        build_figure_spec(FigureType.SQUARE, 1.0, 2.0)
+    assert str(checked.error(0)) == str(err.value)
+
+
+def test_not_finite_dimentions() -> None:
+    inf = float("inf")
+    checked = validate_figures([
+            ("triangle", (inf, inf, 1.0)),
+            ("circle", [inf]),
+            ("rectangle", (2.0, inf)),
+            ("polygon", [0.0, 0.0, inf, 0.0, 0.0, 3.0]),
+            ("square", [2.0]),
+            ])
+    assert checked.status.tolist() == [SpecStatus.IMPOSSIBLE_DIMENTION] * 4 + [SpecStatus.OK]
+    assert checked.batch.to_specs() == [build_figure_spec(FigureType.SQUARE, 2.0)]
+    assert checked.areas().tolist()[4] == 4.0
+
+
+def test_validate_empty() -> None:
+    checked = validate_figures([])
+    assert len(checked) == 0
+    assert len(checked.batch) == 0
+    assert checked.counts() == {}